@@ -5,12 +5,15 @@ Advanced algorithms for breaking down complex tasks into manageable subtasks.
 
 import logging
 import re
-from typing import List, Dict, Any, Optional, Tuple, Set
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Set, ClassVar, Mapping
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
 import networkx as nx
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel
 
 from ...domain.entities.task import (
     TaskEntity, TaskDecompositionTemplate, TaskComplexityLevel,
@@ -24,15 +27,142 @@ from ...domain.exceptions.task_exceptions import (
 )
 
 
-class DecompositionRule(BaseModel):
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """Compile a rule pattern, shared across rules built at runtime"""
+    return re.compile(pattern, flags)
+
+
+@dataclass(slots=True, frozen=True)
+class DecompositionRule:
     """Rule for task decomposition"""
     
     pattern: str  # Regex pattern to match task title/description
     strategy: str  # Decomposition strategy
-    parameters: Dict[str, Any] = Field(default_factory=dict)
-    priority: int = Field(default=1, ge=1, le=10)
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    priority: int = 1
+    _compiled: re.Pattern = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Validate the rule and compile its pattern once"""
+        if not 1 <= self.priority <= 10:
+            raise ValueError(f"Rule priority must be between 1 and 10, got {self.priority}")
+        try:
+            compiled = _compile_pattern(self.pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid rule pattern '{self.pattern}': {e}")
+        object.__setattr__(self, "_compiled", compiled)
     
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    @property
+    def compiled_pattern(self) -> re.Pattern:
+        """Compiled match pattern"""
+        return self._compiled
+
+
+# Map keywords to capabilities
+_CAPABILITY_KEYWORDS: Dict[str, AgentCapability] = {
+    # Planning & Architecture
+    "design": AgentCapability.SYSTEM_DESIGN,
+    "architecture": AgentCapability.ARCHITECTURE_PLANNING,
+    "plan": AgentCapability.ARCHITECTURE_PLANNING,
+    "requirement": AgentCapability.REQUIREMENTS_ANALYSIS,
+    "analyze": AgentCapability.REQUIREMENTS_ANALYSIS,
+    "break down": AgentCapability.TASK_DECOMPOSITION,
+    "decompose": AgentCapability.TASK_DECOMPOSITION,
+
+    # Implementation
+    "implement": AgentCapability.CODE_GENERATION,
+    "create": AgentCapability.CODE_GENERATION,
+    "build": AgentCapability.CODE_GENERATION,
+    "develop": AgentCapability.CODE_GENERATION,
+    "write": AgentCapability.CODE_GENERATION,
+    "code": AgentCapability.CODE_GENERATION,
+    "test": AgentCapability.TEST_GENERATION,
+    "document": AgentCapability.DOCUMENTATION,
+    "refactor": AgentCapability.REFACTORING,
+
+    # Quality Assurance
+    "review": AgentCapability.CODE_REVIEW,
+    "audit": AgentCapability.SECURITY_AUDIT,
+    "security": AgentCapability.SECURITY_AUDIT,
+    "performance": AgentCapability.PERFORMANCE_ANALYSIS,
+    "compliance": AgentCapability.COMPLIANCE_CHECK,
+
+    # Problem Solving
+    "debug": AgentCapability.DEBUGGING,
+    "fix": AgentCapability.DEBUGGING,
+    "troubleshoot": AgentCapability.TROUBLESHOOTING,
+    "diagnose": AgentCapability.ROOT_CAUSE_ANALYSIS,
+    "optimize": AgentCapability.OPTIMIZATION,
+    "improve": AgentCapability.OPTIMIZATION,
+
+    # Integration & Operations
+    "deploy": AgentCapability.DEPLOYMENT,
+    "configure": AgentCapability.CONFIGURATION,
+    "monitor": AgentCapability.MONITORING,
+    "scale": AgentCapability.SCALING,
+    "integrate": AgentCapability.DEPLOYMENT,
+}
+
+# One pass over the text for every keyword. The lookahead keeps overlapping
+# keywords matchable like per-keyword substring checks; only one keyword can
+# match at a given offset, so no keyword may be a prefix of another.
+_CAPABILITY_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(
+        re.escape(k) for k in sorted(_CAPABILITY_KEYWORDS, key=len, reverse=True)
+    ) + "))"
+)
+
+
+# Complexity heuristics
+_COMPLEXITY_INDICATORS: Dict[str, int] = {
+    "must": 1,
+    "should": 2,
+    "could": 3,
+    "would": 4,
+    "implement": 2,
+    "create": 2,
+    "build": 3,
+    "develop": 3,
+    "design": 4,
+    "architect": 5,
+    "integrate": 4,
+    "deploy": 3,
+    "test": 2,
+    "document": 1,
+}
+
+# Score contribution per indicator, in the order they are summed
+_COMPLEXITY_INCREMENTS: Dict[str, float] = {
+    indicator: weight * 0.1 for indicator, weight in _COMPLEXITY_INDICATORS.items()
+}
+
+# Substring semantics, same constraints as _CAPABILITY_KEYWORD_PATTERN
+_COMPLEXITY_INDICATOR_PATTERN = re.compile(
+    "(?=(" + "|".join(
+        re.escape(k) for k in sorted(_COMPLEXITY_INDICATORS, key=len, reverse=True)
+    ) + "))"
+)
+
+_SENTENCE_BREAK_PATTERN = re.compile(r'[.!?]+')
+
+_TECHNICAL_TERM_PATTERN = re.compile(
+    r'\b(API|database|authentication|encryption|scalability|performance|'
+    r'security|deployment|integration|microservice|container|kubernetes|'
+    r'docker|aws|azure|gcp|cloud|serverless)\b',
+    re.IGNORECASE
+)
+
+
+# Bounds for a single task's estimated hours
+_MIN_ESTIMATED_HOURS = 1.0
+_MAX_ESTIMATED_HOURS = 24.0
+
+# Result for empty text; whitespace-only text still runs the heuristics
+_EMPTY_ANALYSIS = MappingProxyType({
+    "word_count": 0,
+    "estimated_hours": _MIN_ESTIMATED_HOURS,
+})
 
 
 class ComplexityAnalyzer(BaseModel):
@@ -42,59 +172,43 @@ class ComplexityAnalyzer(BaseModel):
     def analyze_requirements_text(text: str) -> Dict[str, Any]:
         """Analyze requirements text for complexity indicators"""
         if not text:
-            return {"word_count": 0, "estimated_hours": 1.0}
+            return dict(_EMPTY_ANALYSIS)
         
+        return dict(ComplexityAnalyzer._compute_requirements_analysis(text))
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _compute_requirements_analysis(text: str) -> Mapping[str, Any]:
+        """Run the complexity heuristics over non-empty text (memoized per text)"""
         word_count = len(text.split())
-        sentence_count = len(re.split(r'[.!?]+', text))
-        
-        # Complexity heuristics
-        complexity_indicators = {
-            "must": 1,
-            "should": 2,
-            "could": 3,
-            "would": 4,
-            "implement": 2,
-            "create": 2,
-            "build": 3,
-            "develop": 3,
-            "design": 4,
-            "architect": 5,
-            "integrate": 4,
-            "deploy": 3,
-            "test": 2,
-            "document": 1,
-        }
+        sentence_count = len(_SENTENCE_BREAK_PATTERN.split(text))
         
         # Count technical terms
-        technical_terms = re.findall(
-            r'\b(API|database|authentication|encryption|scalability|performance|'
-            r'security|deployment|integration|microservice|container|kubernetes|'
-            r'docker|aws|azure|gcp|cloud|serverless)\b',
-            text,
-            re.IGNORECASE
-        )
+        technical_terms = _TECHNICAL_TERM_PATTERN.findall(text)
         
         # Estimate hours based on heuristics
         base_hours = word_count / 100  # 100 words ≈ 1 hour
         
         # Adjust for complexity indicators
         complexity_score = 1.0
-        for indicator, weight in complexity_indicators.items():
-            if indicator in text.lower():
-                complexity_score += weight * 0.1
+        found = set(_COMPLEXITY_INDICATOR_PATTERN.findall(text.lower()))
+        if found:
+            for indicator, increment in _COMPLEXITY_INCREMENTS.items():
+                if indicator in found:
+                    complexity_score += increment
         
         # Adjust for technical terms
         complexity_score += len(technical_terms) * 0.2
         
         estimated_hours = base_hours * complexity_score
         
-        return {
+        return MappingProxyType({
             "word_count": word_count,
             "sentence_count": sentence_count,
             "technical_terms": len(technical_terms),
             "complexity_score": complexity_score,
-            "estimated_hours": max(1.0, min(estimated_hours, 24.0)),
-        }
+            "estimated_hours": max(_MIN_ESTIMATED_HOURS, min(estimated_hours, _MAX_ESTIMATED_HOURS)),
+        })
     
     @staticmethod
     def estimate_from_task_description(task: TaskEntity) -> TaskEstimate:
@@ -154,58 +268,11 @@ class ComplexityAnalyzer(BaseModel):
         if not text:
             return [AgentCapability.CODE_GENERATION]
         
-        text_lower = text.lower()
-        capabilities = set()
-        
-        # Map keywords to capabilities
-        keyword_map = {
-            # Planning & Architecture
-            "design": AgentCapability.SYSTEM_DESIGN,
-            "architecture": AgentCapability.ARCHITECTURE_PLANNING,
-            "plan": AgentCapability.ARCHITECTURE_PLANNING,
-            "requirement": AgentCapability.REQUIREMENTS_ANALYSIS,
-            "analyze": AgentCapability.REQUIREMENTS_ANALYSIS,
-            "break down": AgentCapability.TASK_DECOMPOSITION,
-            "decompose": AgentCapability.TASK_DECOMPOSITION,
-            
-            # Implementation
-            "implement": AgentCapability.CODE_GENERATION,
-            "create": AgentCapability.CODE_GENERATION,
-            "build": AgentCapability.CODE_GENERATION,
-            "develop": AgentCapability.CODE_GENERATION,
-            "write": AgentCapability.CODE_GENERATION,
-            "code": AgentCapability.CODE_GENERATION,
-            "test": AgentCapability.TEST_GENERATION,
-            "document": AgentCapability.DOCUMENTATION,
-            "refactor": AgentCapability.REFACTORING,
-            
-            # Quality Assurance
-            "review": AgentCapability.CODE_REVIEW,
-            "audit": AgentCapability.SECURITY_AUDIT,
-            "security": AgentCapability.SECURITY_AUDIT,
-            "performance": AgentCapability.PERFORMANCE_ANALYSIS,
-            "compliance": AgentCapability.COMPLIANCE_CHECK,
-            
-            # Problem Solving
-            "debug": AgentCapability.DEBUGGING,
-            "fix": AgentCapability.DEBUGGING,
-            "troubleshoot": AgentCapability.TROUBLESHOOTING,
-            "diagnose": AgentCapability.ROOT_CAUSE_ANALYSIS,
-            "optimize": AgentCapability.OPTIMIZATION,
-            "improve": AgentCapability.OPTIMIZATION,
-            
-            # Integration & Operations
-            "deploy": AgentCapability.DEPLOYMENT,
-            "configure": AgentCapability.CONFIGURATION,
-            "monitor": AgentCapability.MONITORING,
-            "scale": AgentCapability.SCALING,
-            "integrate": AgentCapability.DEPLOYMENT,
+        capabilities = {
+            _CAPABILITY_KEYWORDS[match.group(1)]
+            for match in _CAPABILITY_KEYWORD_PATTERN.finditer(text.lower())
         }
         
-        for keyword, capability in keyword_map.items():
-            if keyword in text_lower:
-                capabilities.add(capability)
-        
         # If no capabilities detected, default to code generation
         if not capabilities:
             capabilities.add(AgentCapability.CODE_GENERATION)
@@ -224,14 +291,30 @@ class TaskDecompositionService:
     4. Parallel execution optimization
     """
     
+    # Defaults are built by the first instance and shared read-only after that
+    _default_templates: ClassVar[Optional[Mapping[str, TaskDecompositionTemplate]]] = None
+    _default_rules: ClassVar[Optional[Tuple[DecompositionRule, ...]]] = None
+    
     def __init__(self):
         self._logger = logging.getLogger(__name__)
         
+        cls = type(self)
+        if cls._default_templates is None:
+            cls._default_templates = MappingProxyType(self._load_default_templates())
+        if cls._default_rules is None:
+            cls._default_rules = tuple(self._load_default_rules())
+        
         # Predefined decomposition templates
-        self._templates = self._load_default_templates()
+        self._templates = cls._default_templates
         
         # Decomposition rules
-        self._rules = self._load_default_rules()
+        self._rules = cls._default_rules
+        
+        # Iteration order fixed once; rules run highest priority first
+        self._template_items = tuple(self._templates.items())
+        self._rules_by_priority = tuple(
+            sorted(self._rules, key=lambda r: r.priority, reverse=True)
+        )
         
         # Complexity analyzer
         self._analyzer = ComplexityAnalyzer()
@@ -437,7 +520,7 @@ class TaskDecompositionService:
         """Apply matching decomposition templates to task"""
         applied = []
         
-        for template_name, template in self._templates.items():
+        for template_name, template in self._template_items:
             try:
                 subtasks = template.apply_to_task(task)
                 if subtasks:
@@ -455,8 +538,8 @@ class TaskDecompositionService:
         # Combine title and description for pattern matching
         text_to_match = f"{task.title} {task.description or ''}"
         
-        for rule in sorted(self._rules, key=lambda r: r.priority, reverse=True):
-            if re.search(rule.pattern, text_to_match, re.IGNORECASE):
+        for rule in self._rules_by_priority:
+            if rule.compiled_pattern.search(text_to_match):
                 try:
                     self._apply_rule(rule, task)
                     applied.append(rule.pattern)
@@ -677,6 +760,12 @@ class TaskDecompositionService:
 
     def _calculate_max_depth(self, task: TaskEntity) -> int:
         """Calculate maximum depth of task hierarchy"""
-        if not task.child_tasks:
-            return 1
-        return 1 + max(self._calculate_max_depth(child) for child in task.child_tasks)
+        # Iterative DFS so deep hierarchies cannot hit the recursion limit
+        stack = [(task, 1)]
+        max_depth = 1
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                max_depth = depth
+            stack.extend((child, depth + 1) for child in node.child_tasks)
+        return max_depth
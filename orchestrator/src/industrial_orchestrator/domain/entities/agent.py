@@ -4,7 +4,7 @@ Advanced agent models with specialization, performance tracking, and capability
 """
 
 from enum import Enum
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, FrozenSet
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
@@ -18,6 +18,11 @@ from ..exceptions.agent_exceptions import (
 )
 
 
+def _now() -> datetime:
+    """Current UTC time; module-level so tests can pin the clock"""
+    return datetime.now(timezone.utc)
+
+
 class AgentType(str, Enum):
     """Industrial agent specialization types"""
     ARCHITECT = "architect"          # System design and planning
@@ -451,9 +456,9 @@ class AgentEntity(BaseModel):
         return self
     
     @property
-    def all_capabilities(self) -> Set[AgentCapability]:
+    def all_capabilities(self) -> FrozenSet[AgentCapability]:
         """Get all capabilities (primary + secondary)"""
-        return set(self.primary_capabilities) | set(self.secondary_capabilities)
+        return frozenset(self.primary_capabilities).union(self.secondary_capabilities)
     
     @property
     def performance_tier(self) -> AgentPerformanceTier:
@@ -490,8 +495,8 @@ class AgentEntity(BaseModel):
         if self.maintenance_mode or not self.is_active:
             return False
         
-        # Check capabilities
-        if not all(self.has_capability(cap) for cap in required_capabilities):
+        # Check capabilities (build the set once, not per required capability)
+        if not self.all_capabilities.issuperset(required_capabilities):
             return False
         
         # Check load capacity
@@ -644,7 +649,7 @@ class AgentEntity(BaseModel):
         
         # Accept task
         self.load.increment_load(estimated_complexity)
-        self.last_active_at = datetime.now(timezone.utc)
+        self.last_active_at = _now()
     
     def complete_task(
         self,
@@ -688,7 +693,7 @@ class AgentEntity(BaseModel):
         self.load.decrement_load(estimated_complexity)
         
         # Update timestamp
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now()
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get comprehensive performance summary"""
@@ -735,14 +740,17 @@ class AgentEntity(BaseModel):
             })
         
         # Check inactivity
-        if self.last_active_at:
-            hours_inactive = (datetime.now(timezone.utc) - self.last_active_at).total_seconds() / 3600
-            if hours_inactive > 24:
-                issues.append({
-                    "type": "inactive",
-                    "severity": "warning",
-                    "message": f"Inactive for {hours_inactive:.1f} hours"
-                })
+        now = _now()
+        hours_inactive = (
+            (now - self.last_active_at).total_seconds() / 3600
+            if self.last_active_at else None
+        )
+        if hours_inactive is not None and hours_inactive > 24:
+            issues.append({
+                "type": "inactive",
+                "severity": "warning",
+                "message": f"Inactive for {hours_inactive:.1f} hours"
+            })
         
         # Check low success rate
         if self.performance.overall_success_rate < 0.5:
@@ -761,9 +769,6 @@ class AgentEntity(BaseModel):
             "load_level": self.load_level.value,
             "success_rate": self.performance.overall_success_rate,
             "utilization": self.load.utilization_percentage,
-            "last_active_hours": (
-                (datetime.now(timezone.utc) - self.last_active_at).total_seconds() / 3600
-                if self.last_active_at else None
-            ),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "last_active_hours": hours_inactive,
+            "timestamp": now.isoformat(),
         }
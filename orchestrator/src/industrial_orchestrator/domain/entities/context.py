@@ -3,16 +3,40 @@ INDUSTRIAL CONTEXT ENTITY
 Domain entity for execution context management with scope-based access control.
 """
 
+from collections import deque
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Dict, Any, List, Deque, Iterator, Sequence, Tuple
 from uuid import UUID, uuid4
 from enum import Enum
 import copy
-from pydantic import Field, ConfigDict
+from pydantic import Field, ConfigDict, PrivateAttr
 
 from .base import DomainEntity
 
 
+@lru_cache(maxsize=1024)
+def _split_path(key: str) -> Tuple[str, ...]:
+    """Dotted key to path parts; cached since the same keys recur."""
+    return tuple(key.split('.'))
+
+
+# Changes kept in a context's audit trail unless _max_history is overridden
+MAX_CHANGE_HISTORY = 100
+
+
+# Leaf types that can be shared between contexts without copying
+_IMMUTABLE_LEAVES = (str, int, float, bool, type(None))
+
+
+def _copy_value(value: Any) -> Any:
+    """Deep-copy a context value, sharing immutable leaves as-is."""
+    if isinstance(value, _IMMUTABLE_LEAVES):
+        return value
+    return copy.deepcopy(value)
+
+
 class ContextScope(str, Enum):
     """
     Scope levels for context visibility and lifecycle.
@@ -79,16 +103,22 @@ class ContextEntity(DomainEntity):
     created_by: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    # Audit trail (private field in pydantic)
-    _change_history: List[ContextChange] = []
-    _max_history: int = 100
+    # Audit trail (private field in pydantic); a bounded deque drops the
+    # oldest change in O(1) once _max_history is reached
+    _max_history: int = MAX_CHANGE_HISTORY
+    _change_history: Deque[ContextChange] = PrivateAttr(
+        default_factory=lambda: deque(maxlen=MAX_CHANGE_HISTORY)
+    )
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get value from context supporting dot notation."""
-        keys = key.split('.')
+        return self.get_path(_split_path(key), default)
+    
+    def get_path(self, parts: Sequence[str], default: Any = None) -> Any:
+        """Get value from context by pre-split path parts."""
         value = self.data
         
-        for k in keys:
+        for k in parts:
             if isinstance(value, dict):
                 value = value.get(k)
                 if value is None:
@@ -105,7 +135,7 @@ class ContextEntity(DomainEntity):
         changed_by: Optional[str] = None
     ) -> None:
         """Set value in context with versioning and history."""
-        keys = key.split('.')
+        keys = _split_path(key)
         old_value = self.get(key)
         
         # Navigate to parent
@@ -131,7 +161,7 @@ class ContextEntity(DomainEntity):
         changed_by: Optional[str] = None
     ) -> bool:
         """Delete value from context."""
-        keys = key.split('.')
+        keys = _split_path(key)
         old_value = self.get(key)
         
         if old_value is None:
@@ -158,8 +188,8 @@ class ContextEntity(DomainEntity):
         """Calculate difference between this context and another."""
         diff = ContextDiff()
         
-        self_keys = set(self.all_keys())
-        other_keys = set(other.all_keys())
+        self_keys = set(self.iter_keys())
+        other_keys = set(other.iter_keys())
         
         for key in other_keys - self_keys:
             diff.added[key] = other.get(key)
@@ -175,19 +205,23 @@ class ContextEntity(DomainEntity):
         
         return diff
 
-    def all_keys(self, prefix: str = "") -> List[str]:
-        """Get all keys including nested."""
-        result = []
-        
-        def _flatten(d: Dict, parent: str = ""):
-            for k, v in d.items():
+    def iter_keys(self, prefix: str = "") -> Iterator[str]:
+        """Yield all keys including nested, depth-first, without recursion."""
+        stack = [(prefix, iter(self.data.items()))]
+        while stack:
+            parent, items = stack[-1]
+            for k, v in items:
                 full_key = f"{parent}.{k}" if parent else k
-                result.append(full_key)
+                yield full_key
                 if isinstance(v, dict):
-                    _flatten(v, full_key)
-        
-        _flatten(self.data, prefix)
-        return result
+                    stack.append((full_key, iter(v.items())))
+                    break
+            else:
+                stack.pop()
+
+    def all_keys(self, prefix: str = "") -> List[str]:
+        """Get all keys including nested."""
+        return list(self.iter_keys(prefix))
 
     def merge(
         self,
@@ -198,21 +232,23 @@ class ContextEntity(DomainEntity):
         if self.tenant_id != other.tenant_id:
             raise ValueError("Cannot merge contexts from different tenants")
 
-        merged_data = copy.deepcopy(self.data)
+        # _deep_merge_dicts copies whatever it keeps, so operands are passed as-is
         conflicts = []
         
         if strategy == MergeStrategy.LAST_WRITE_WINS:
-            merged_data = self._deep_merge_dicts(merged_data, other.data, prefer_other=True)
+            merged_data = self._deep_merge_dicts(self.data, other.data, prefer_other=True)
         elif strategy == MergeStrategy.DEEP_MERGE:
-            merged_data = self._deep_merge_dicts(merged_data, other.data, prefer_other=False)
+            merged_data = self._deep_merge_dicts(self.data, other.data, prefer_other=False)
         elif strategy == MergeStrategy.PREFER_SOURCE:
-            merged_data = self._deep_merge_dicts(merged_data, other.data, prefer_other=True)
+            merged_data = self._deep_merge_dicts(self.data, other.data, prefer_other=True)
         elif strategy == MergeStrategy.PREFER_TARGET:
-            merged_data = self._deep_merge_dicts(other.data.copy(), merged_data, prefer_other=True)
+            merged_data = self._deep_merge_dicts(other.data, self.data, prefer_other=True)
         elif strategy == MergeStrategy.MANUAL:
             diff = self.diff(other)
             conflicts = list(diff.modified.keys())
-            merged_data = self._deep_merge_dicts(merged_data, other.data, prefer_other=True)
+            merged_data = self._deep_merge_dicts(self.data, other.data, prefer_other=True)
+        else:
+            merged_data = copy.deepcopy(self.data)
         
         return ContextEntity(
             tenant_id=self.tenant_id,
@@ -260,7 +296,8 @@ class ContextEntity(DomainEntity):
 
     def get_recent_changes(self, count: int = 10) -> List[ContextChange]:
         """Get recent change history."""
-        return self._change_history[-count:]
+        history = self._change_history
+        return list(islice(history, max(0, len(history) - count), None))
 
     def _record_change(self, key: str, old_value: Any, new_value: Any, changed_by: Optional[str]) -> None:
         change = ContextChange(
@@ -269,20 +306,27 @@ class ContextEntity(DomainEntity):
             new_value=new_value,
             changed_by=changed_by
         )
+        # Only an instance that overrode _max_history needs its buffer resized
+        if self._change_history.maxlen != self._max_history:
+            self._change_history = deque(self._change_history, maxlen=self._max_history)
         self._change_history.append(change)
-        if len(self._change_history) > self._max_history:
-            self._change_history = self._change_history[-self._max_history:]
 
     def _deep_merge_dicts(self, base: Dict, overlay: Dict, prefer_other: bool = True) -> Dict:
+        # Copy base once, then merge overlay into that copy level by level with
+        # a worklist; nested dicts of the copy are already private to it
         result = copy.deepcopy(base)
-        for key, value in overlay.items():
-            if key in result:
-                if isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = self._deep_merge_dicts(result[key], value, prefer_other)
-                elif prefer_other:
-                    result[key] = copy.deepcopy(value)
-            else:
-                result[key] = copy.deepcopy(value)
+        stack = [(result, overlay)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if key in target:
+                    current = target[key]
+                    if isinstance(current, dict) and isinstance(value, dict):
+                        stack.append((current, value))
+                    elif prefer_other:
+                        target[key] = _copy_value(value)
+                else:
+                    target[key] = _copy_value(value)
         return result
 
     def _determine_merged_scope(self, other: "ContextEntity") -> ContextScope:
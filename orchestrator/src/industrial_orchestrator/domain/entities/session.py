@@ -4,12 +4,13 @@ Core business entity representing an OpenCode execution session.
 Designed for resilience, auditability, and precise state management.
 """
 
+from collections import deque
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Deque
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_serializer, field_validator, ConfigDict
 
 from ..value_objects.session_status import SessionStatus
 from ..value_objects.execution_metrics import ExecutionMetrics
@@ -17,6 +18,29 @@ from ..events.session_events import SessionCreated, SessionStatusChanged
 from ..exceptions.session_exceptions import InvalidSessionTransition
 
 
+def _now() -> datetime:
+    """Current UTC time; module-level so tests can pin the clock"""
+    return datetime.now(timezone.utc)
+
+
+# Checkpoint history kept per session; older entries rotate out
+MAX_CHECKPOINTS = 100
+
+# Health score for every status except RUNNING, which depends on elapsed time
+_FIXED_HEALTH_SCORES = {
+    **{status: 0.8 for status in SessionStatus if status != SessionStatus.RUNNING},
+    SessionStatus.COMPLETED: 1.0,
+    SessionStatus.FAILED: 0.0,
+}
+
+# Failure states a session can be resumed from (given checkpoints)
+_RECOVERABLE_STATUSES = frozenset({
+    SessionStatus.FAILED,
+    SessionStatus.TIMEOUT,
+    SessionStatus.STOPPED,
+})
+
+
 class SessionType(str, Enum):
     """Type of orchestration session"""
     PLANNING = "planning"
@@ -78,7 +102,7 @@ class SessionEntity(BaseModel):
     
     # Metrics & telemetry
     metrics: ExecutionMetrics = Field(default_factory=ExecutionMetrics)
-    checkpoints: List[Dict[str, Any]] = Field(default_factory=list)
+    checkpoints: Deque[Dict[str, Any]] = Field(default_factory=deque)
     
     # System metadata
     created_by: Optional[str] = None
@@ -125,6 +149,11 @@ class SessionEntity(BaseModel):
         
         return v
     
+    @field_serializer('checkpoints')
+    def serialize_checkpoints(self, v: Deque[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Checkpoints dump as a plain list"""
+        return list(v)
+    
     def transition_to(self, new_status: SessionStatus) -> None:
         """
         Industrial-grade state transition with validation
@@ -140,7 +169,7 @@ class SessionEntity(BaseModel):
         
         old_status = self.status
         self.status = new_status
-        self.status_updated_at = datetime.now(timezone.utc)
+        self.status_updated_at = _now()
         
         # Record state transition event
         event = SessionStatusChanged(
@@ -162,12 +191,12 @@ class SessionEntity(BaseModel):
             )
         
         self.transition_to(SessionStatus.RUNNING)
-        self.metrics.started_at = datetime.now(timezone.utc)
+        self.metrics.started_at = _now()
     
     def complete_with_result(self, result: Dict[str, Any]) -> None:
         """Mark session as completed with execution results"""
         self.transition_to(SessionStatus.COMPLETED)
-        self.metrics.completed_at = datetime.now(timezone.utc)
+        self.metrics.completed_at = _now()
         self.metrics.result = result
         
         # Calculate duration
@@ -175,10 +204,10 @@ class SessionEntity(BaseModel):
             duration = (self.metrics.completed_at - self.metrics.started_at).total_seconds()
             self.metrics.execution_duration_seconds = duration
     
-    def fail_with_error(self, error: Exception, error_context: Dict[str, Any] = None) -> None:
+    def fail_with_error(self, error: Exception, error_context: Optional[Dict[str, Any]] = None) -> None:
         """Handle session failure with detailed error context"""
         self.transition_to(SessionStatus.FAILED)
-        self.metrics.failed_at = datetime.now(timezone.utc)
+        self.metrics.failed_at = _now()
         self.metrics.error = {
             'type': error.__class__.__name__,
             'message': str(error),
@@ -189,7 +218,7 @@ class SessionEntity(BaseModel):
         """Add execution checkpoint for recovery"""
         # Sequence continues from last checkpoint (handles rotation correctly)
         next_sequence = (self.checkpoints[-1]['sequence'] + 1) if self.checkpoints else 1
-        now = datetime.now(timezone.utc)
+        now = _now()
         checkpoint = {
             'timestamp': now.isoformat(),
             'data': data,
@@ -197,20 +226,17 @@ class SessionEntity(BaseModel):
         }
         self.checkpoints.append(checkpoint)
         
+        # Limit checkpoint history; popleft keeps the trim O(1) per append
+        while len(self.checkpoints) > MAX_CHECKPOINTS:
+            self.checkpoints.popleft()
+        
         # Update metrics
         self.metrics.checkpoint_count = len(self.checkpoints)
         self.metrics.last_checkpoint_at = now
-        
-        # Limit checkpoint history
-        if len(self.checkpoints) > 100:
-            self.checkpoints = self.checkpoints[-100:]
-            self.metrics.checkpoint_count = len(self.checkpoints)
     
     def get_latest_checkpoint(self) -> Optional[Dict[str, Any]]:
         """Retrieve most recent checkpoint for recovery"""
-        if not self.checkpoints:
-            return None
-        return self.checkpoints[-1]
+        return self.checkpoints[-1] if self.checkpoints else None
     
     def collect_events(self) -> List[Any]:
         """Collect and clear domain events for publishing"""
@@ -220,15 +246,13 @@ class SessionEntity(BaseModel):
     
     def calculate_health_score(self) -> float:
         """Calculate session health score (0.0 to 1.0)"""
-        if self.status == SessionStatus.COMPLETED:
-            return 1.0
-        
-        if self.status == SessionStatus.FAILED:
-            return 0.0
+        fixed = _FIXED_HEALTH_SCORES.get(self.status)
+        if fixed is not None:
+            return fixed
         
-        # Calculate based on duration vs limit
-        if self.status == SessionStatus.RUNNING and self.metrics.started_at:
-            elapsed = (datetime.now(timezone.utc) - self.metrics.started_at).total_seconds()
+        # Running: calculate based on duration vs limit
+        if self.metrics.started_at:
+            elapsed = (_now() - self.metrics.started_at).total_seconds()
             progress_ratio = min(elapsed / self.max_duration_seconds, 1.0)
             
             # Penalize long-running sessions
@@ -239,18 +263,12 @@ class SessionEntity(BaseModel):
             else:
                 return 0.9  # Healthy
         
-        return 0.8  # Default for other states
+        return 0.8  # Running but not yet timed
     
     def is_recoverable(self) -> bool:
         """Determine if session can be recovered from failure"""
-        recoverable_statuses = {
-            SessionStatus.FAILED,
-            SessionStatus.TIMEOUT,
-            SessionStatus.STOPPED
-        }
-        
         return (
-            self.status in recoverable_statuses and
+            self.status in _RECOVERABLE_STATUSES and
             len(self.checkpoints) > 0 and
             self.metrics.retry_count < 3
         )
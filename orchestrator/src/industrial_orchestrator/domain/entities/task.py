@@ -4,7 +4,8 @@ Advanced task models with decomposition, dependencies, and complexity analysis.
 """
 
 from enum import Enum
-from typing import List, Dict, Any, Optional, Set, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
@@ -20,6 +21,11 @@ from ..exceptions.task_exceptions import (
 )
 
 
+def _now() -> datetime:
+    """Current UTC time; module-level so tests can pin the clock"""
+    return datetime.now(timezone.utc)
+
+
 class TaskComplexityLevel(str, Enum):
     """Task complexity classification"""
     TRIVIAL = "trivial"      # < 15 minutes, simple implementation
@@ -29,6 +35,36 @@ class TaskComplexityLevel(str, Enum):
     EXPERT = "expert"        # 8+ hours, very complex, multiple components
 
 
+@lru_cache(maxsize=1024)
+def _pert_metrics(
+    optimistic: float, likely: float, pessimistic: float
+) -> Tuple[float, float, TaskComplexityLevel]:
+    """
+    (expected hours, standard deviation, complexity level) for a PERT estimate
+    
+    Pure in its three inputs, so estimates sharing hours share one entry.
+    """
+    if optimistic == 0 and likely == 0 and pessimistic == 0:
+        expected = 0.0
+    else:
+        expected = (optimistic + 4 * likely + pessimistic) / 6
+    
+    std_dev = (pessimistic - optimistic) / 6 if pessimistic > optimistic else 0.0
+    
+    if expected < 0.25:  # < 15 minutes
+        level = TaskComplexityLevel.TRIVIAL
+    elif expected < 1.0:  # < 1 hour
+        level = TaskComplexityLevel.SIMPLE
+    elif expected < 4.0:  # < 4 hours
+        level = TaskComplexityLevel.MODERATE
+    elif expected < 8.0:  # < 8 hours
+        level = TaskComplexityLevel.COMPLEX
+    else:  # 8+ hours
+        level = TaskComplexityLevel.EXPERT
+    
+    return expected, std_dev, level
+
+
 class TaskPriority(str, Enum):
     """Task execution priority"""
     BLOCKER = "blocker"      # Blocks all other work
@@ -94,33 +130,17 @@ class TaskEstimate(BaseModel):
     @property
     def expected_hours(self) -> float:
         """Calculate expected hours using PERT formula"""
-        if self.optimistic_hours == 0 and self.likely_hours == 0 and self.pessimistic_hours == 0:
-            return 0.0
-        
-        return (self.optimistic_hours + 4 * self.likely_hours + self.pessimistic_hours) / 6
+        return _pert_metrics(self.optimistic_hours, self.likely_hours, self.pessimistic_hours)[0]
     
     @property
     def standard_deviation_hours(self) -> float:
         """Calculate standard deviation"""
-        if self.pessimistic_hours <= self.optimistic_hours:
-            return 0.0
-        return (self.pessimistic_hours - self.optimistic_hours) / 6
+        return _pert_metrics(self.optimistic_hours, self.likely_hours, self.pessimistic_hours)[1]
     
     @property
     def complexity_level(self) -> TaskComplexityLevel:
         """Determine complexity level based on expected hours"""
-        hours = self.expected_hours
-        
-        if hours < 0.25:  # < 15 minutes
-            return TaskComplexityLevel.TRIVIAL
-        elif hours < 1.0:  # < 1 hour
-            return TaskComplexityLevel.SIMPLE
-        elif hours < 4.0:  # < 4 hours
-            return TaskComplexityLevel.MODERATE
-        elif hours < 8.0:  # < 8 hours
-            return TaskComplexityLevel.COMPLEX
-        else:  # 8+ hours
-            return TaskComplexityLevel.EXPERT
+        return _pert_metrics(self.optimistic_hours, self.likely_hours, self.pessimistic_hours)[2]
     
     def update_from_execution(
         self,
@@ -149,7 +169,7 @@ class TaskEstimate(BaseModel):
         if actual_cost_usd is not None:
             self.estimated_cost_usd = actual_cost_usd
         
-        self.last_estimated_at = datetime.now(timezone.utc)
+        self.last_estimated_at = _now()
         self.estimation_source = "historical"
 
 
@@ -245,7 +265,7 @@ class TaskEntity(BaseModel):
     def elapsed_hours(self) -> Optional[float]:
         """Calculate elapsed hours if in progress"""
         if self.started_at and not self.completed_at and not self.failed_at:
-            return (datetime.now(timezone.utc) - self.started_at).total_seconds() / 3600
+            return (_now() - self.started_at).total_seconds() / 3600
         return None
     
     @property
@@ -303,7 +323,7 @@ class TaskEntity(BaseModel):
         )
         
         self.dependencies.append(dependency)
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now()
     
     def add_child_task(self, child_task: "TaskEntity") -> None:
         """Add child task (decomposition)"""
@@ -312,7 +332,7 @@ class TaskEntity(BaseModel):
         
         # Add to children
         self.child_tasks.append(child_task)
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now()
     
     def decompose(
         self,
@@ -461,38 +481,34 @@ class TaskEntity(BaseModel):
         """Get NetworkX graph of task dependencies"""
         graph = nx.DiGraph()
         
-        # Add this task
-        graph.add_node(self.id, task=self)
-        
-        # Add dependencies
-        for dep in self.dependencies:
-            graph.add_edge(dep.target_task_id, dep.source_task_id, dependency=dep)
-        
-        # Add child task dependencies recursively
-        for child in self.child_tasks:
-            child_graph = child.get_dependency_graph()
-            graph = nx.compose(graph, child_graph)
+        # Walk the hierarchy into one graph rather than composing a copy per child
+        pending = [self]
+        while pending:
+            task = pending.pop()
+            graph.add_node(task.id, task=task)
             
-            # Add parent-child relationship
-            graph.add_edge(self.id, child.id, relationship="parent_child")
+            # Add dependencies
+            for dep in task.dependencies:
+                graph.add_edge(dep.target_task_id, dep.source_task_id, dependency=dep)
+            
+            # Add parent-child relationships
+            for child in task.child_tasks:
+                graph.add_edge(task.id, child.id, relationship="parent_child")
+                pending.append(child)
         
         return graph
     
     def validate_dependencies(self) -> bool:
         """Validate that dependency graph has no cycles"""
         try:
-            graph = self.get_dependency_graph()
-            cycles = list(nx.simple_cycles(graph))
-            
-            if cycles:
-                raise TaskDependencyCycleError(
-                    f"Task dependency cycle detected: {cycles}"
-                )
-            
-            return True
-            
+            # Stops at the first cycle instead of enumerating all of them
+            cycle = nx.find_cycle(self.get_dependency_graph())
         except nx.NetworkXNoCycle:
             return True
+        
+        raise TaskDependencyCycleError(
+            f"Task dependency cycle detected: {[source for source, _ in cycle]}"
+        )
     
     def get_execution_order(self) -> List[UUID]:
         """Get topological order for task execution"""
@@ -545,17 +561,17 @@ class TaskEntity(BaseModel):
         
         old_status = self.status
         self.status = new_status
-        self.status_updated_at = datetime.now(timezone.utc)
+        self.status_updated_at = _now()
         
         # Update timestamps based on status
         if new_status == TaskStatus.IN_PROGRESS and not self.started_at:
-            self.started_at = datetime.now(timezone.utc)
+            self.started_at = _now()
         elif new_status == TaskStatus.COMPLETED and not self.completed_at:
-            self.completed_at = datetime.now(timezone.utc)
+            self.completed_at = _now()
         elif new_status == TaskStatus.FAILED and not self.failed_at:
-            self.failed_at = datetime.now(timezone.utc)
+            self.failed_at = _now()
         
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now()
         
         return old_status
     
@@ -565,7 +581,7 @@ class TaskEntity(BaseModel):
             raise ValueError(f"Cannot assign task in status {self.status}")
         
         self.assigned_agent_id = agent_id
-        self.assigned_at = datetime.now(timezone.utc)
+        self.assigned_at = _now()
         self.update_status(TaskStatus.ASSIGNED)
     
     def complete_with_result(
@@ -599,7 +615,7 @@ class TaskEntity(BaseModel):
             "type": error.__class__.__name__,
             "message": str(error),
             "context": error_context or {},
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now().isoformat(),
         }
         
         self.update_status(TaskStatus.FAILED)
@@ -629,40 +645,29 @@ class TaskEntity(BaseModel):
             "priority": self.priority.value,
         }
     
+    def iter_subtasks(self) -> Iterator["TaskEntity"]:
+        """Yield every descendant depth-first, parents before children"""
+        pending = list(reversed(self.child_tasks))
+        while pending:
+            task = pending.pop()
+            yield task
+            pending.extend(reversed(task.child_tasks))
+    
     def count_subtasks(self, status_filter: Optional[TaskStatus] = None) -> int:
         """Count subtasks (recursive) optionally filtered by status"""
-        count = 0
-        
-        # Count children
-        for child in self.child_tasks:
-            if status_filter is None or child.status == status_filter:
-                count += 1
-            
-            # Recurse
-            count += child.count_subtasks(status_filter)
-        
-        return count
+        if status_filter is None:
+            return sum(1 for _ in self.iter_subtasks())
+        return sum(1 for task in self.iter_subtasks() if task.status == status_filter)
     
     def find_subtask(self, task_id: UUID) -> Optional["TaskEntity"]:
         """Find subtask by ID (recursive)"""
         if self.id == task_id:
             return self
-        
-        for child in self.child_tasks:
-            found = child.find_subtask(task_id)
-            if found:
-                return found
-        
-        return None
+        return next((task for task in self.iter_subtasks() if task.id == task_id), None)
     
     def flatten_hierarchy(self) -> List["TaskEntity"]:
         """Flatten task hierarchy into list"""
-        tasks = [self]
-        
-        for child in self.child_tasks:
-            tasks.extend(child.flatten_hierarchy())
-        
-        return tasks
+        return [self, *self.iter_subtasks()]
 
 
 class TaskDecompositionTemplate(BaseModel):
@@ -4,7 +4,7 @@ Precise state transitions with validation for resilient orchestration.
 """
 
 from enum import Enum
-from typing import Set, Dict
+from typing import Set, Dict, FrozenSet
 
 
 class SessionStatus(str, Enum):
@@ -80,63 +80,7 @@ class SessionStatus(str, Enum):
         
         Returns True if transition from current to target is valid
         """
-        transition_map: Dict[SessionStatus, Set[SessionStatus]] = {
-            # From PENDING
-            SessionStatus.PENDING: {
-                SessionStatus.QUEUED,     # Scheduled for execution
-                SessionStatus.RUNNING,    # Immediate execution (start_execution)
-                SessionStatus.CANCELLED,  # Cancelled before queueing
-                SessionStatus.FAILED,     # Immediate failure (e.g., validation)
-            },
-            
-            # From QUEUED
-            SessionStatus.QUEUED: {
-                SessionStatus.RUNNING,    # Execution started
-                SessionStatus.CANCELLED,  # Cancelled while queued
-                SessionStatus.FAILED,     # Pre-execution failure
-            },
-            
-            # From RUNNING
-            SessionStatus.RUNNING: {
-                SessionStatus.COMPLETED,          # Successful completion
-                SessionStatus.PARTIALLY_COMPLETED, # Partial success
-                SessionStatus.FAILED,             # Execution failure
-                SessionStatus.TIMEOUT,            # Exceeded time limit
-                SessionStatus.PAUSED,             # Manually paused
-                SessionStatus.STOPPED,            # Manually stopped
-                SessionStatus.DEGRADED,           # Running with issues
-            },
-            
-            # From PAUSED
-            SessionStatus.PAUSED: {
-                SessionStatus.RUNNING,    # Resumed execution
-                SessionStatus.STOPPED,    # Stopped while paused
-                SessionStatus.CANCELLED,  # Cancelled while paused
-            },
-            
-            # From DEGRADED
-            SessionStatus.DEGRADED: {
-                SessionStatus.RUNNING,    # Recovered to normal
-                SessionStatus.FAILED,     # Degraded further to failure
-                SessionStatus.COMPLETED,  # Managed to complete despite issues
-                SessionStatus.STOPPED,    # Manually stopped
-            },
-            
-            # From FAILED (allowed for retries)
-            SessionStatus.FAILED: {
-                SessionStatus.PENDING,    # Manual or automatic retry
-            },
-            
-            # From TIMEOUT (allowed for retries)
-            SessionStatus.TIMEOUT: {
-                SessionStatus.PENDING,    # Retry with increased timeout
-            },
-            
-            # Other terminal states - no transitions allowed
-            **{state: set() for state in {SessionStatus.COMPLETED, SessionStatus.PARTIALLY_COMPLETED, SessionStatus.STOPPED, SessionStatus.CANCELLED, SessionStatus.ORPHANED}},
-        }
-        
-        return target_status in transition_map.get(self, set())
+        return target_status in _ALLOWED_TARGETS[self]
     
     def is_terminal(self) -> bool:
         """Check if status is terminal (no further transitions)"""
@@ -185,3 +129,68 @@ class SessionStatus(str, Enum):
             SessionStatus.DEGRADED: "#F97316",     # Orange
         }
         return color_map.get(self, "#000000")
+
+
+# Allowed edges per source state; terminal states have none
+_TRANSITION_MAP: Dict[SessionStatus, Set[SessionStatus]] = {
+    # From PENDING
+    SessionStatus.PENDING: {
+        SessionStatus.QUEUED,     # Scheduled for execution
+        SessionStatus.RUNNING,    # Immediate execution (start_execution)
+        SessionStatus.CANCELLED,  # Cancelled before queueing
+        SessionStatus.FAILED,     # Immediate failure (e.g., validation)
+    },
+    
+    # From QUEUED
+    SessionStatus.QUEUED: {
+        SessionStatus.RUNNING,    # Execution started
+        SessionStatus.CANCELLED,  # Cancelled while queued
+        SessionStatus.FAILED,     # Pre-execution failure
+    },
+    
+    # From RUNNING
+    SessionStatus.RUNNING: {
+        SessionStatus.COMPLETED,          # Successful completion
+        SessionStatus.PARTIALLY_COMPLETED, # Partial success
+        SessionStatus.FAILED,             # Execution failure
+        SessionStatus.TIMEOUT,            # Exceeded time limit
+        SessionStatus.PAUSED,             # Manually paused
+        SessionStatus.STOPPED,            # Manually stopped
+        SessionStatus.DEGRADED,           # Running with issues
+    },
+    
+    # From PAUSED
+    SessionStatus.PAUSED: {
+        SessionStatus.RUNNING,    # Resumed execution
+        SessionStatus.STOPPED,    # Stopped while paused
+        SessionStatus.CANCELLED,  # Cancelled while paused
+    },
+    
+    # From DEGRADED
+    SessionStatus.DEGRADED: {
+        SessionStatus.RUNNING,    # Recovered to normal
+        SessionStatus.FAILED,     # Degraded further to failure
+        SessionStatus.COMPLETED,  # Managed to complete despite issues
+        SessionStatus.STOPPED,    # Manually stopped
+    },
+    
+    # From FAILED (allowed for retries)
+    SessionStatus.FAILED: {
+        SessionStatus.PENDING,    # Manual or automatic retry
+    },
+    
+    # From TIMEOUT (allowed for retries)
+    SessionStatus.TIMEOUT: {
+        SessionStatus.PENDING,    # Retry with increased timeout
+    },
+    
+    # Other terminal states - no transitions allowed
+    **{state: set() for state in {SessionStatus.COMPLETED, SessionStatus.PARTIALLY_COMPLETED, SessionStatus.STOPPED, SessionStatus.CANCELLED, SessionStatus.ORPHANED}},
+}
+
+# Frozen target set for every status, so a check is one index plus one
+# set probe (cheaper than hashing a (source, target) tuple per call)
+_ALLOWED_TARGETS: Dict[SessionStatus, FrozenSet[SessionStatus]] = {
+    status: frozenset(_TRANSITION_MAP.get(status, ()))
+    for status in SessionStatus
+}
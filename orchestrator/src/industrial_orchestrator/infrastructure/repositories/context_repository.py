@@ -3,11 +3,12 @@ INDUSTRIAL HYBRID CONTEXT REPOSITORY
 Tiered storage implementation with Redis for hot contexts and PostgreSQL for cold/global.
 """
 
-import json
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
+import orjson
+
 from ...application.ports.repository_ports import ContextRepositoryPort
 from ...domain.entities.context import (
     ContextEntity,
@@ -76,7 +77,8 @@ class HybridContextRepository(ContextRepositoryPort):
         """
         # Serialize context
         context_data = context.to_dict()
-        context_json = json.dumps(context_data)
+        # orjson encodes the UUID/datetime/enum values model_dump() leaves in place
+        context_json = orjson.dumps(context_data)
         
         context_key = self.KEY_CONTEXT.format(str(context.id))
         
@@ -104,9 +106,7 @@ class HybridContextRepository(ContextRepositoryPort):
         # Try Redis first
         context_json = await self._redis.get(context_key)
         if context_json:
-            if isinstance(context_json, bytes):
-                context_json = context_json.decode()
-            context_data = json.loads(context_json)
+            context_data = orjson.loads(context_json)
             return ContextEntity.from_dict(context_data)
         
         # Fall back to PostgreSQL for global contexts
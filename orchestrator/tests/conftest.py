@@ -3,12 +3,43 @@ INDUSTRIAL ORCHESTRATOR TEST CONFIGURATION
 Pytest configuration and fixtures for all tests.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
 # Add orchestrator root directory (parent of src) to Python path for imports
 # This allows imports like: from src.industrial_orchestrator...
 orchestrator_root = Path(__file__).parent.parent
 if str(orchestrator_root) not in sys.path:
     sys.path.insert(0, str(orchestrator_root))
 
+from tests.unit.domain.factories import seed_factories
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _seed_factories():
+    """
+    Seed ``random``, Faker and factory-boy once per (xdist) worker.
+
+    Factories draw from all three; seeding them up front keeps generated data
+    identical across runs without reseeding anywhere on the build path.
+    Import-time pools use their own seeded Faker (see ``seeded_faker``);
+    ids built with ``uuid4`` are the exception and stay unique per run.
+    """
+    seed_factories()
+
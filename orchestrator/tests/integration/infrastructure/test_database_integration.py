@@ -44,7 +44,6 @@ class TestDatabaseManagerIntegration:
         await manager.close()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_connection_pool_initialization(self, db_manager):
         """Test connection pool initialization"""
         assert db_manager.engine is not None
@@ -57,7 +56,6 @@ class TestDatabaseManagerIntegration:
             assert row.test_value == 1
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_session_context_manager(self, db_manager):
         """Test session context manager functionality"""
         async with db_manager.get_session() as session:
@@ -70,7 +68,6 @@ class TestDatabaseManagerIntegration:
             await session.execute("CREATE TEMPORARY TABLE test (id SERIAL PRIMARY KEY)")
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_transaction_management(self, db_manager):
         """Test transaction management with savepoints"""
         async with db_manager.get_session() as session:
@@ -110,7 +107,6 @@ class TestDatabaseManagerIntegration:
             assert count == 1  # Only first insert persisted
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_health_check(self, db_manager):
         """Test database health check"""
         health = await db_manager.health_check()
@@ -125,7 +121,6 @@ class TestDatabaseManagerIntegration:
             assert health["connections"]["pool_managed"] >= 0
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_connection_retry_logic(self):
         """Test connection retry logic with invalid host"""
         settings = DatabaseSettings(
@@ -145,7 +140,6 @@ class TestDatabaseManagerIntegration:
             await manager.initialize()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_concurrent_sessions(self, db_manager):
         """Test concurrent session usage"""
         async def use_session(session_id: int):
@@ -160,7 +154,6 @@ class TestDatabaseManagerIntegration:
         assert set(results) == set(range(10))
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_metrics_collection(self, db_manager):
         """Test metrics collection"""
         metrics = db_manager.get_metrics()
@@ -175,7 +168,6 @@ class TestGlobalDatabaseFunctions:
     """Test global database functions"""
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_get_database_manager(self):
         """Test global database manager singleton"""
         manager1 = await get_database_manager()
@@ -187,7 +179,6 @@ class TestGlobalDatabaseFunctions:
     
         @pytest.mark.integration
     
-        @pytest.mark.asyncio
     
         async def test_shutdown_database(self):
     
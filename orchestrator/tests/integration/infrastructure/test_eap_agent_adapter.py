@@ -7,14 +7,14 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
 from datetime import datetime
 
-from industrial_orchestrator.infrastructure.adapters.eap_agent_adapter import EAPAgentAdapter
-from industrial_orchestrator.application.dtos.external_agent_protocol import (
+from src.industrial_orchestrator.infrastructure.adapters.eap_agent_adapter import EAPAgentAdapter
+from src.industrial_orchestrator.application.dtos.external_agent_protocol import (
     EAPTaskAssignment,
     EAPTaskResult,
     EAPHeartbeatRequest,
     EAPStatus
 )
-from industrial_orchestrator.infrastructure.exceptions.opencode_exceptions import OpenCodeAPIError
+from src.industrial_orchestrator.infrastructure.exceptions.opencode_exceptions import OpenCodeAPIError
 
 @pytest.fixture
 def adapter():
@@ -31,7 +31,6 @@ def task_assignment():
         requirements=["python"]
     )
 
-@pytest.mark.asyncio
 async def test_send_task_success(adapter, task_assignment):
     # Mock response data
     response_data = {
@@ -71,7 +70,6 @@ async def test_send_task_success(adapter, task_assignment):
     assert call_args[1]["headers"]["X-Agent-Token"] == "secret"
     assert call_args[1]["json"]["task_id"] == str(task_assignment.task_id)
 
-@pytest.mark.asyncio
 async def test_send_task_failure(adapter, task_assignment):
     # Mock error response
     mock_response = MagicMock()
@@ -98,7 +96,6 @@ async def test_send_task_failure(adapter, task_assignment):
             task_assignment=task_assignment
         )
 
-@pytest.mark.asyncio
 async def test_check_health_success(adapter):
     response_data = {
         "status": "healthy",
@@ -42,7 +42,6 @@ class TestIndustrialRedisClientIntegration:
         await client.close()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_connection_initialization(self, redis_client):
         """Test Redis connection initialization"""
         assert redis_client._client is not None
@@ -53,7 +52,6 @@ class TestIndustrialRedisClientIntegration:
         assert result is True
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_json_serialization(self, redis_client):
         """Test JSON serialization/deserialization"""
         test_data = {
@@ -74,7 +72,6 @@ class TestIndustrialRedisClientIntegration:
         assert retrieved == test_data
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_hash_operations(self, redis_client):
         """Test hash operations with JSON"""
         test_data = {
@@ -95,7 +92,6 @@ class TestIndustrialRedisClientIntegration:
         assert missing is None
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_distributed_lock(self, redis_client):
         """Test distributed lock mechanism"""
         lock_key = "test:lock"
@@ -132,7 +128,6 @@ class TestIndustrialRedisClientIntegration:
         assert acquired3 is True
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_circuit_breaker(self, redis_client):
         """Test circuit breaker functionality"""
         # Initially should be CLOSED
@@ -152,7 +147,6 @@ class TestIndustrialRedisClientIntegration:
         assert status["failure_count"] == 4  # Should decrease by 1
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_health_check(self, redis_client):
         """Test Redis health check"""
         health = await redis_client.health_check()
@@ -166,7 +160,6 @@ class TestIndustrialRedisClientIntegration:
             assert "redis_version" in health["info"]
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_retry_logic(self, redis_client):
         """Test retry logic with failing operation"""
         # Mock a failing operation
@@ -194,7 +187,6 @@ class TestIndustrialRedisClientIntegration:
             redis_client._execute_with_retry = original_execute
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_metrics_collection(self, redis_client):
         """Test metrics collection"""
         # Perform some operations
@@ -214,7 +206,6 @@ class TestGlobalRedisFunctions:
     """Test global Redis functions"""
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_get_redis_client(self):
         """Test global Redis client singleton"""
         client1 = await get_redis_client()
@@ -225,7 +216,6 @@ class TestGlobalRedisFunctions:
         await shutdown_redis()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_shutdown_redis(self):
         """Test Redis shutdown"""
         client = await get_redis_client()
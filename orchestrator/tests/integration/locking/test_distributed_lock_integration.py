@@ -49,7 +49,6 @@ class TestIndustrialDistributedLockIntegration:
         return manager
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_lock_acquisition_and_release(self, lock_manager):
         """Test basic lock acquisition and release"""
         resource = "test:resource:1"
@@ -84,7 +83,6 @@ class TestIndustrialDistributedLockIntegration:
         await another_lock.release()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_lock_timeout(self, lock_manager):
         """Test lock timeout behavior"""
         resource = "test:resource:2"
@@ -115,7 +113,6 @@ class TestIndustrialDistributedLockIntegration:
         await another_lock.release()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_lock_renewal(self, lock_manager):
         """Test lock renewal (heartbeat)"""
         resource = "test:resource:3"
@@ -148,7 +145,6 @@ class TestIndustrialDistributedLockIntegration:
         await lock_manager.release_lock(resource)
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_context_manager(self, lock_manager):
         """Test lock context manager"""
         resource = "test:resource:4"
@@ -185,7 +181,6 @@ class TestIndustrialDistributedLockIntegration:
         await another_lock.release()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_fair_lock_queue(self, lock_manager):
         """Test fair locking with queue"""
         resource = "test:resource:5"
@@ -223,7 +218,6 @@ class TestIndustrialDistributedLockIntegration:
         assert set(results) == {"instance_1", "instance_2", "instance_3"}
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_lock_priority(self, lock_manager):
         """Test lock acquisition with priority"""
         resource = "test:resource:6"
@@ -286,7 +280,6 @@ class TestIndustrialDistributedLockIntegration:
             await redis_client._client.zrem(f"lock_queue:{resource}", entry_id)
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_lock_metadata(self, lock_manager):
         """Test lock metadata tracking"""
         resource = "test:resource:7"
@@ -315,7 +308,6 @@ class TestIndustrialDistributedLockIntegration:
         await lock_manager.release_lock(resource)
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_lock_manager_stats(self, lock_manager):
         """Test lock manager statistics"""
         # Acquire some locks
@@ -343,7 +335,6 @@ class TestIndustrialDistributedLockIntegration:
         await lock_manager.release_lock("resource:2")
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_cleanup_expired_locks(self, lock_manager):
         """Test cleanup of expired locks"""
         resource = "test:resource:8"
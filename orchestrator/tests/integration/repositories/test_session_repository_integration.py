@@ -63,7 +63,6 @@ class TestSessionRepositoryIntegration:
         return repository
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_add_and_get_session(self, session_repository):
         """Test adding and retrieving a session"""
         # Create test session
@@ -85,7 +84,6 @@ class TestSessionRepositoryIntegration:
         assert retrieved_session.status == added_session.status
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_update_session(self, session_repository):
         """Test updating a session"""
         # Create and add session
@@ -109,7 +107,6 @@ class TestSessionRepositoryIntegration:
         assert retrieved_session.status == SessionStatus.RUNNING
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_delete_session(self, session_repository):
         """Test soft deleting a session"""
         # Create and add session
@@ -131,7 +128,6 @@ class TestSessionRepositoryIntegration:
         assert retrieved_deleted.id == added_session.id
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_find_by_status(self, session_repository):
         """Test finding sessions by status"""
         # Create sessions with different statuses
@@ -154,7 +150,6 @@ class TestSessionRepositoryIntegration:
         assert running_sessions[0].status == SessionStatus.RUNNING
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_find_active_sessions(self, session_repository):
         """Test finding active sessions"""
         # Create mix of active and terminal sessions
@@ -179,7 +174,6 @@ class TestSessionRepositoryIntegration:
         assert SessionStatus.FAILED not in statuses
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_pagination(self, session_repository):
         """Test pagination functionality"""
         # Create multiple sessions
@@ -211,7 +205,6 @@ class TestSessionRepositoryIntegration:
         assert page3.has_previous is True
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_complex_filters(self, session_repository):
         """Test complex filtering with multiple conditions"""
         # Create sessions with different priorities and types
@@ -254,7 +247,6 @@ class TestSessionRepositoryIntegration:
         assert results[0].session_type == SessionType.PLANNING
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_get_with_metrics(self, session_repository):
         """Test getting session with eager-loaded metrics"""
         # Create session with metrics
@@ -275,7 +267,6 @@ class TestSessionRepositoryIntegration:
         assert session_with_metrics.metrics.completed_at is not None
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_add_checkpoint(self, session_repository):
         """Test adding checkpoint to session"""
         # Create and add session
@@ -306,7 +297,6 @@ class TestSessionRepositoryIntegration:
         assert session_with_checkpoints.checkpoints[0]["sequence"] == 1
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_update_status(self, session_repository):
         """Test updating session status"""
         # Create and add session
@@ -330,7 +320,6 @@ class TestSessionRepositoryIntegration:
         assert session_with_metrics.metrics.started_at is not None
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_get_session_stats(self, session_repository):
         """Test getting session statistics"""
         # Create sessions with different statuses
@@ -357,7 +346,6 @@ class TestSessionRepositoryIntegration:
         assert abs(total_percentage - 100.0) < 0.01  # Allow small floating point error
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_bulk_operations(self, session_repository):
         """Test bulk insert and update operations"""
         # Create multiple sessions
@@ -381,7 +369,6 @@ class TestSessionRepositoryIntegration:
             assert session.title.startswith("UPDATED:")
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_optimistic_locking(self, session_repository):
         """Test optimistic locking conflict detection"""
         # Create and add session
@@ -407,7 +394,6 @@ class TestSessionRepositoryIntegration:
                "version" in str(exc_info.value).lower()
     
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_cache_invalidation(self, session_repository):
         """Test cache invalidation on updates"""
         # Create and add session
@@ -48,7 +48,6 @@ def provider():
 def service(mock_repo, mock_curator, provider):
     return FineTuningService(mock_repo, mock_curator, provider)
 
-@pytest.mark.asyncio
 async def test_full_pipeline_simulation(service, mock_repo):
     # 1. Create Job
     tenant_id = uuid4()
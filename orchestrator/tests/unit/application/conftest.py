@@ -6,11 +6,42 @@ NOTE: These tests use mock-based testing to avoid importing infrastructure
 modules that have deep dependencies.
 """
 
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
 import pytest
 from uuid import uuid4
 from typing import Generator
 from unittest.mock import AsyncMock, MagicMock
 
+from src.industrial_orchestrator.application.services import (
+    session_service as session_service_module,
+)
+from src.industrial_orchestrator.domain.entities.context import (
+    ContextEntity,
+    ContextScope,
+)
+from src.industrial_orchestrator.domain.entities.session import SessionEntity
+from tests.unit.application.mocks import async_return
+
+
+@asynccontextmanager
+async def _noop_distributed_lock(*args, **kwargs):
+    """Stand-in for the Redis-backed lock that always acquires."""
+    yield True
+
+
+# ============================================================================
+# Distributed Lock
+# ============================================================================
+
+@pytest.fixture(scope="session", autouse=True)
+def _fake_distributed_lock():
+    """Replace SessionService's distributed_lock with a no-op for the whole run."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(session_service_module, "distributed_lock", _noop_distributed_lock)
+        yield
+
 
 # ============================================================================
 # Mock Repository Fixtures
@@ -111,3 +142,65 @@ def sample_agent_id():
 def sample_context_id():
     """Generate a sample context UUID."""
     return uuid4()
+
+
+# ============================================================================
+# Entity Factory Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def make_context():
+    """
+    Factory for ContextEntity instances cloned from one validated prototype.
+
+    Overrides are applied with ``model_copy`` so repeated construction skips
+    pydantic validation. Each clone gets fresh ``id``/``tenant_id`` values
+    unless they are passed explicitly.
+    """
+    prototype = ContextEntity(tenant_id=uuid4(), scope=ContextScope.SESSION)
+
+    def _make(**overrides) -> ContextEntity:
+        overrides.setdefault("id", uuid4())
+        overrides.setdefault("tenant_id", uuid4())
+        return prototype.model_copy(update=overrides, deep=True)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_session():
+    """
+    Factory for SessionEntity instances cloned from one validated prototype.
+
+    Same semantics as ``make_context``: overrides bypass validation, so only
+    pass values the entity would accept.
+    """
+    prototype = SessionEntity(
+        tenant_id=uuid4(),
+        title="IND-TEST-001: Sample Session",
+        initial_prompt="Implement feature X",
+    )
+
+    def _make(**overrides) -> SessionEntity:
+        overrides.setdefault("id", uuid4())
+        overrides.setdefault("tenant_id", uuid4())
+        return prototype.model_copy(update=overrides, deep=True)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_min_service():
+    """
+    Factory for a SessionService backed by a bare namespace repository.
+
+    The default repository only answers ``get_with_checkpoints`` with None;
+    pass keyword overrides to stub any other repository call a test needs.
+    """
+    def _make(**overrides) -> session_service_module.SessionService:
+        repository = SimpleNamespace(
+            **{"get_with_checkpoints": async_return(None), **overrides}
+        )
+        return session_service_module.SessionService(session_repository=repository)
+
+    return _make
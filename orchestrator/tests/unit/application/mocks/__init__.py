@@ -1 +1,16 @@
 # Mock implementations for application service testing
+
+from typing import Any, Awaitable, Callable
+
+
+def async_return(value: Any) -> Callable[..., Awaitable[Any]]:
+    """
+    Build a coroutine function that resolves to ``value``.
+
+    Assign it as the ``side_effect`` of a plain ``Mock`` to make an awaitable
+    stub that still records calls, without AsyncMock's per-call overhead.
+    """
+    async def _stub(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _stub
@@ -113,7 +113,6 @@ def task_execution_result_failure():
 class TestAgentRegistration:
     """Test agent registration use cases."""
 
-    @pytest.mark.asyncio
     async def test_register_agent_success(self, agent_service, mock_agent_repo):
         """Test successful agent registration."""
         tenant_id = uuid4()
@@ -134,7 +133,6 @@ class TestAgentRegistration:
         assert result is not None
         mock_agent_repo.register.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_register_agent_with_technologies(self, agent_service, mock_agent_repo):
         """Test agent registration with preferred technologies."""
         tenant_id = uuid4()
@@ -149,7 +147,6 @@ class TestAgentRegistration:
             )
         assert result is not None
 
-    @pytest.mark.asyncio
     async def test_deregister_agent_success(self, agent_service, mock_agent_repo, sample_registered_agent):
         """Test successful agent deregistration."""
         agent_id = sample_registered_agent.id
@@ -161,7 +158,6 @@ class TestAgentRegistration:
         assert result is True
         mock_agent_repo.deregister.assert_called_once_with(agent_id)
 
-    @pytest.mark.asyncio
     async def test_deregister_nonexistent_agent(self, agent_service, mock_agent_repo):
         """Test deregistering agent that doesn't exist."""
         agent_id = uuid4()
@@ -180,7 +176,6 @@ class TestAgentRegistration:
 class TestTaskRouting:
     """Test capability-based task routing."""
 
-    @pytest.mark.asyncio
     async def test_route_task_to_capable_agent(self, agent_service, mock_agent_repo, sample_registered_agent):
         """Test routing task to agent with required capabilities."""
         required_caps = [AgentCapability.CODE_GENERATION]
@@ -195,7 +190,6 @@ class TestTaskRouting:
         assert isinstance(result, RouteTaskResult)
         assert result.selected_agent.id == sample_registered_agent.id
 
-    @pytest.mark.asyncio
     async def test_route_task_no_capable_agents(self, agent_service, mock_agent_repo):
         """Test routing when no agents have required capabilities."""
         mock_agent_repo.find_by_capability.return_value = []
@@ -206,7 +200,6 @@ class TestTaskRouting:
                 required_capabilities=[AgentCapability.SECURITY_AUDIT],
             )
 
-    @pytest.mark.asyncio
     async def test_route_task_prefers_higher_tier(self, agent_service, mock_agent_repo, sample_registered_agent):
         """Test that higher performance tier agents are preferred."""
         standard_agent = sample_registered_agent
@@ -235,7 +228,6 @@ class TestTaskRouting:
         # Premium agent should be selected due to higher tier
         assert result.selected_agent.performance_tier == AgentPerformanceTier.PREMIUM
 
-    @pytest.mark.asyncio
     async def test_route_task_avoids_overloaded(self, agent_service, mock_agent_repo, sample_registered_agent):
         """Test that overloaded agents are avoided."""
         overloaded_agent = sample_registered_agent
@@ -264,7 +256,6 @@ class TestTaskRouting:
         # Available agent should be selected, not overloaded
         assert result.selected_agent.load_level != AgentLoadLevel.OVERLOADED
 
-    @pytest.mark.asyncio
     async def test_route_task_with_preferred_agent_type(self, agent_service, mock_agent_repo):
         """Test routing with preferred agent type."""
         tenant_id = uuid4()
@@ -312,7 +303,6 @@ class TestTaskRouting:
 class TestPerformanceTracking:
     """Test agent performance metrics updates."""
 
-    @pytest.mark.asyncio
     async def test_update_performance_on_success(
         self, agent_service, mock_agent_repo, 
         sample_registered_agent, task_execution_result_success
@@ -328,7 +318,6 @@ class TestPerformanceTracking:
     
         mock_agent_repo.update_metrics.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_performance_on_failure(
         self, agent_service, mock_agent_repo,
         sample_registered_agent, task_execution_result_failure
@@ -344,7 +333,6 @@ class TestPerformanceTracking:
     
         mock_agent_repo.update_metrics.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_agent_summary(self, agent_service, mock_agent_repo, sample_registered_agent):
         """Test getting agent performance summary."""
         agent_id = sample_registered_agent.id
@@ -355,7 +343,6 @@ class TestPerformanceTracking:
         assert result is not None
         assert "agent_id" in result
 
-    @pytest.mark.asyncio
     async def test_get_summary_nonexistent_agent(self, agent_service, mock_agent_repo):
         """Test getting summary for nonexistent agent."""
         agent_id = uuid4()
@@ -373,7 +360,6 @@ class TestPerformanceTracking:
 class TestWorkloadRebalancing:
     """Test workload distribution across agents."""
 
-    @pytest.mark.asyncio
     async def test_rebalance_workload(self, agent_service, mock_agent_repo):
         """Test workload rebalancing operation."""
         mock_agent_repo.find_available.return_value = []
@@ -383,7 +369,6 @@ class TestWorkloadRebalancing:
         assert result is not None
         assert isinstance(result, RebalanceResult)
 
-    @pytest.mark.asyncio
     async def test_rebalance_with_no_agents(self, agent_service, mock_agent_repo):
         """Test rebalancing when no agents available."""
         mock_agent_repo.find_available.return_value = []
@@ -400,7 +385,6 @@ class TestWorkloadRebalancing:
 class TestAgentHealth:
     """Test agent health monitoring."""
 
-    @pytest.mark.asyncio
     async def test_process_heartbeat(self, agent_service, mock_agent_repo, sample_registered_agent):
         """Test processing agent heartbeat."""
         agent_id = sample_registered_agent.id
@@ -413,7 +397,6 @@ class TestAgentHealth:
         assert result is True
         mock_agent_repo.heartbeat.assert_called_once_with(agent_id)
 
-    @pytest.mark.asyncio
     async def test_heartbeat_nonexistent_agent(self, agent_service, mock_agent_repo):
         """Test heartbeat for nonexistent agent."""
         agent_id = uuid4()
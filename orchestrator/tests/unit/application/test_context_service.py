@@ -10,7 +10,6 @@ from uuid import uuid4, UUID
 
 from src.industrial_orchestrator.application.services.context_service import ContextService
 from src.industrial_orchestrator.domain.entities.context import (
-    ContextEntity,
     ContextScope,
     MergeStrategy,
 )
@@ -48,9 +47,9 @@ def context_service(mock_context_repo):
 
 
 @pytest.fixture
-def sample_session_context():
+def sample_session_context(make_context):
     """Create sample session-scoped context."""
-    return ContextEntity(
+    return make_context(
         tenant_id=uuid4(),
         session_id=uuid4(),
         scope=ContextScope.SESSION,
@@ -60,9 +59,9 @@ def sample_session_context():
 
 
 @pytest.fixture
-def sample_agent_context():
+def sample_agent_context(make_context):
     """Create sample agent-scoped context."""
-    return ContextEntity(
+    return make_context(
         tenant_id=uuid4(),
         session_id=uuid4(),
         agent_id=uuid4(),
@@ -73,9 +72,9 @@ def sample_agent_context():
 
 
 @pytest.fixture
-def sample_global_context():
+def sample_global_context(make_context):
     """Create sample global-scoped context."""
-    return ContextEntity(
+    return make_context(
         tenant_id=uuid4(),
         scope=ContextScope.GLOBAL,
         data={"shared_config": "value", "system_wide": True},
@@ -90,13 +89,12 @@ def sample_global_context():
 class TestContextCreation:
     """Test context creation use cases."""
 
-    @pytest.mark.asyncio
-    async def test_create_session_context(self, context_service, mock_context_repo):
+    async def test_create_session_context(self, context_service, mock_context_repo, make_context):
         """Test creating session-scoped context."""
         session_id = uuid4()
         tenant_id = uuid4()
         
-        mock_context_repo.store.return_value = ContextEntity(
+        mock_context_repo.store.return_value = make_context(
             tenant_id=tenant_id,
             session_id=session_id,
             scope=ContextScope.SESSION,
@@ -114,14 +112,13 @@ class TestContextCreation:
         assert result is not None
         mock_context_repo.store.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_create_agent_context(self, context_service, mock_context_repo):
+    async def test_create_agent_context(self, context_service, mock_context_repo, make_context):
         """Test creating agent-scoped context."""
         session_id = uuid4()
         agent_id = uuid4()
         tenant_id = uuid4()
         
-        mock_context_repo.store.return_value = ContextEntity(
+        mock_context_repo.store.return_value = make_context(
             tenant_id=tenant_id,
             session_id=session_id,
             agent_id=agent_id,
@@ -139,11 +136,10 @@ class TestContextCreation:
         assert result is not None
         assert result.scope == ContextScope.AGENT
 
-    @pytest.mark.asyncio
-    async def test_create_global_context(self, context_service, mock_context_repo):
+    async def test_create_global_context(self, context_service, mock_context_repo, make_context):
         """Test creating global-scoped context."""
         tenant_id = uuid4()
-        mock_context_repo.store.return_value = ContextEntity(
+        mock_context_repo.store.return_value = make_context(
             tenant_id=tenant_id,
             scope=ContextScope.GLOBAL,
             data={"global": "config"},
@@ -158,13 +154,12 @@ class TestContextCreation:
         assert result is not None
         assert result.scope == ContextScope.GLOBAL
 
-    @pytest.mark.asyncio
-    async def test_create_context_with_metadata(self, context_service, mock_context_repo):
+    async def test_create_context_with_metadata(self, context_service, mock_context_repo, make_context):
         """Test creating context with custom metadata."""
         session_id = uuid4()
         tenant_id = uuid4()
         
-        mock_context_repo.store.return_value = ContextEntity(
+        mock_context_repo.store.return_value = make_context(
             tenant_id=tenant_id,
             session_id=session_id,
             scope=ContextScope.SESSION,
@@ -188,64 +183,59 @@ class TestContextCreation:
 class TestContextRetrieval:
     """Test context retrieval operations."""
 
-    @pytest.mark.asyncio
-    async def test_get_context_by_id(self, context_service, mock_context_repo, sample_session_context):
-        """Test retrieving context by ID."""
-        context_id = sample_session_context.id
-        mock_context_repo.retrieve.return_value = sample_session_context
-        
-        result = await context_service.get_context(context_id)
-        
-        assert result is not None
-        assert result.id == context_id
+    async def test_retrieval_matrix(
+        self, context_service, mock_context_repo, sample_session_context, make_context, subtests
+    ):
+        """Test retrieval scenarios against one service/mock setup."""
+        with subtests.test("get_by_id"):
+            context_id = sample_session_context.id
+            mock_context_repo.retrieve.return_value = sample_session_context
 
-    @pytest.mark.asyncio
-    async def test_get_nonexistent_context(self, context_service, mock_context_repo):
-        """Test retrieving nonexistent context raises error."""
-        context_id = uuid4()
-        mock_context_repo.retrieve.return_value = None
-        
-        with pytest.raises(ContextNotFoundError):
-            await context_service.get_context(context_id)
+            result = await context_service.get_context(context_id)
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_existing(self, context_service, mock_context_repo, sample_session_context):
-        """Test get_or_create returns existing context."""
-        session_id = sample_session_context.session_id
-        mock_context_repo.retrieve_by_session.return_value = [sample_session_context]
-        
-        result = await context_service.get_or_create_context(
-            session_id=session_id,
-            scope=ContextScope.SESSION,
-        )
-        
-        assert result is not None
-        # Should not call store since context exists
-        mock_context_repo.store.assert_not_called()
+            assert result is not None
+            assert result.id == context_id
+
+        mock_context_repo.reset_mock()
+        with subtests.test("get_nonexistent"):
+            mock_context_repo.retrieve.return_value = None
+
+            with pytest.raises(ContextNotFoundError):
+                await context_service.get_context(uuid4())
+
+        mock_context_repo.reset_mock()
+        with subtests.test("get_or_create_existing"):
+            mock_context_repo.retrieve_by_session.return_value = [sample_session_context]
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_creates_new(self, context_service, mock_context_repo):
-        """Test get_or_create creates new when none exists."""
-        session_id = uuid4()
-        tenant_id = uuid4()
-        mock_context_repo.retrieve_by_session.return_value = []  # None exists
-        
-        new_context = ContextEntity(
-            tenant_id=tenant_id,
-            session_id=session_id,
-            scope=ContextScope.SESSION,
-            data={},
-        )
-        mock_context_repo.store.return_value = new_context
-        
-        with patch('src.industrial_orchestrator.application.services.context_service.get_current_tenant_id', return_value=tenant_id):
             result = await context_service.get_or_create_context(
+                session_id=sample_session_context.session_id,
+                scope=ContextScope.SESSION,
+            )
+
+            assert result is not None
+            # Should not call store since context exists
+            mock_context_repo.store.assert_not_called()
+
+        mock_context_repo.reset_mock()
+        with subtests.test("get_or_create_creates_new"):
+            session_id = uuid4()
+            tenant_id = uuid4()
+            mock_context_repo.retrieve_by_session.return_value = []  # None exists
+            mock_context_repo.store.return_value = make_context(
+                tenant_id=tenant_id,
                 session_id=session_id,
                 scope=ContextScope.SESSION,
+                data={},
             )
-        
-        assert result is not None
-        mock_context_repo.store.assert_called_once()
+
+            with patch('src.industrial_orchestrator.application.services.context_service.get_current_tenant_id', return_value=tenant_id):
+                result = await context_service.get_or_create_context(
+                    session_id=session_id,
+                    scope=ContextScope.SESSION,
+                )
+
+            assert result is not None
+            mock_context_repo.store.assert_called_once()
 
 
 # ============================================================================
@@ -255,7 +245,6 @@ class TestContextRetrieval:
 class TestContextUpdate:
     """Test context update operations."""
 
-    @pytest.mark.asyncio
     async def test_update_context(self, context_service, mock_context_repo, sample_session_context):
         """Test updating context data."""
         context_id = sample_session_context.id
@@ -273,7 +262,6 @@ class TestContextUpdate:
         assert result is not None
         mock_context_repo.store.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_update_nonexistent_context(self, context_service, mock_context_repo):
         """Test updating nonexistent context raises error."""
         context_id = uuid4()
@@ -293,7 +281,6 @@ class TestContextUpdate:
 class TestContextSharing:
     """Test context sharing between sessions."""
 
-    @pytest.mark.asyncio
     async def test_share_context_between_sessions(
         self, context_service, mock_context_repo, sample_session_context
     ):
@@ -312,7 +299,6 @@ class TestContextSharing:
         
         assert result is not None
 
-    @pytest.mark.asyncio
     async def test_share_specific_context(
         self, context_service, mock_context_repo, sample_session_context
     ):
@@ -340,17 +326,16 @@ class TestContextSharing:
 class TestContextMerging:
     """Test context merge operations."""
 
-    @pytest.mark.asyncio
-    async def test_merge_two_contexts(self, context_service, mock_context_repo):
+    async def test_merge_two_contexts(self, context_service, mock_context_repo, make_context):
         """Test merging two contexts."""
         tenant_id = uuid4()
-        ctx1 = ContextEntity(
+        ctx1 = make_context(
             tenant_id=tenant_id,
             session_id=uuid4(),
             scope=ContextScope.SESSION,
             data={"key1": "value1", "shared": "from_ctx1"},
         )
-        ctx2 = ContextEntity(
+        ctx2 = make_context(
             tenant_id=tenant_id,
             session_id=ctx1.session_id,
             scope=ContextScope.SESSION,
@@ -358,7 +343,7 @@ class TestContextMerging:
         )
     
         mock_context_repo.retrieve.side_effect = [ctx1, ctx2]
-        mock_context_repo.merge.return_value = ContextEntity(
+        mock_context_repo.merge.return_value = make_context(
             tenant_id=tenant_id,
             session_id=ctx1.session_id,
             scope=ContextScope.SESSION,
@@ -374,17 +359,16 @@ class TestContextMerging:
         assert result is not None
         mock_context_repo.merge.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_merge_with_deep_strategy(self, context_service, mock_context_repo):
+    async def test_merge_with_deep_strategy(self, context_service, mock_context_repo, make_context):
         """Test merging with DEEP_MERGE strategy."""
         tenant_id = uuid4()
-        ctx1 = ContextEntity(
+        ctx1 = make_context(
             tenant_id=tenant_id,
             session_id=uuid4(),
             scope=ContextScope.SESSION,
             data={"nested": {"key1": "v1"}},
         )
-        ctx2 = ContextEntity(
+        ctx2 = make_context(
             tenant_id=tenant_id,
             session_id=ctx1.session_id,
             scope=ContextScope.SESSION,
@@ -392,7 +376,7 @@ class TestContextMerging:
         )
         
         mock_context_repo.retrieve.side_effect = [ctx1, ctx2]
-        mock_context_repo.store.return_value = ContextEntity(
+        mock_context_repo.store.return_value = make_context(
             tenant_id=tenant_id,
             session_id=ctx1.session_id,
             scope=ContextScope.SESSION,
@@ -415,15 +399,14 @@ class TestContextMerging:
 class TestGlobalPromotion:
     """Test context promotion to global scope."""
 
-    @pytest.mark.asyncio
     async def test_promote_session_to_global(
-        self, context_service, mock_context_repo, sample_session_context
+        self, context_service, mock_context_repo, sample_session_context, make_context
     ):
         """Test promoting session context to global scope."""
         context_id = sample_session_context.id
         mock_context_repo.retrieve.return_value = sample_session_context
         
-        global_context = ContextEntity(
+        global_context = make_context(
             tenant_id=sample_session_context.tenant_id,
             scope=ContextScope.GLOBAL,
             data=sample_session_context.data.copy(),
@@ -438,7 +421,6 @@ class TestGlobalPromotion:
         assert result is not None
         assert result.scope == ContextScope.GLOBAL
 
-    @pytest.mark.asyncio
     async def test_promote_nonexistent_context(self, context_service, mock_context_repo):
         """Test promoting nonexistent context raises error."""
         context_id = uuid4()
@@ -455,17 +437,16 @@ class TestGlobalPromotion:
 class TestContextDiff:
     """Test context diff operations."""
 
-    @pytest.mark.asyncio
-    async def test_get_context_diff(self, context_service, mock_context_repo):
+    async def test_get_context_diff(self, context_service, mock_context_repo, make_context):
         """Test getting diff between two contexts."""
         tenant_id = uuid4()
-        ctx_a = ContextEntity(
+        ctx_a = make_context(
             tenant_id=tenant_id,
             session_id=uuid4(),
             scope=ContextScope.SESSION,
             data={"key1": "value1", "shared": "old_value"},
         )
-        ctx_b = ContextEntity(
+        ctx_b = make_context(
             tenant_id=tenant_id,
             session_id=ctx_a.session_id,
             scope=ContextScope.SESSION,
@@ -489,7 +470,6 @@ class TestContextDiff:
 class TestContextCleanup:
     """Test context cleanup operations."""
 
-    @pytest.mark.asyncio
     async def test_cleanup_session_contexts(
         self, context_service, mock_context_repo, sample_session_context
     ):
@@ -505,7 +485,6 @@ class TestContextCleanup:
         
         assert result >= 0
 
-    @pytest.mark.asyncio
     async def test_get_global_contexts(self, context_service, mock_context_repo, sample_global_context):
         """Test retrieving all global contexts."""
         mock_context_repo.retrieve_global.return_value = [sample_global_context]
@@ -523,7 +502,6 @@ class TestContextCleanup:
 class TestContextSummary:
     """Test context summary operations."""
 
-    @pytest.mark.asyncio
     async def test_get_session_context_summary(
         self, context_service, mock_context_repo, sample_session_context
     ):
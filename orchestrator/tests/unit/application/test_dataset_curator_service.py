@@ -8,8 +8,8 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 from pathlib import Path
 
-from industrial_orchestrator.application.services.dataset_curator_service import DatasetCuratorService, DatasetSample
-from industrial_orchestrator.domain.entities.session import SessionEntity, SessionStatus
+from src.industrial_orchestrator.application.services.dataset_curator_service import DatasetCuratorService, DatasetSample
+from src.industrial_orchestrator.domain.entities.session import SessionEntity, SessionStatus
 
 @pytest.fixture
 def mock_session_repo():
@@ -19,7 +19,6 @@ def mock_session_repo():
 def curator(mock_session_repo):
     return DatasetCuratorService(mock_session_repo)
 
-@pytest.mark.asyncio
 async def test_curate_dataset_success(curator, mock_session_repo, tmp_path):
     # Setup mock sessions
     session1 = MagicMock(spec=SessionEntity)
@@ -57,7 +56,6 @@ async def test_curate_dataset_success(curator, mock_session_repo, tmp_path):
         assert sample["instruction"] == "Task 1"
         assert "print(1)" in sample["output"]
 
-@pytest.mark.asyncio
 async def test_curate_dataset_no_samples(curator, mock_session_repo, tmp_path):
     mock_session_repo.find_by_status.return_value = []
     
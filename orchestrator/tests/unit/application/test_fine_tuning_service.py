@@ -27,7 +27,6 @@ def mock_curator():
 def service(mock_repo, mock_curator):
     return FineTuningService(mock_repo, mock_curator)
 
-@pytest.mark.asyncio
 async def test_create_job(service, mock_repo):
     tenant_id = uuid4()
     with patch('src.industrial_orchestrator.application.services.fine_tuning_service.get_current_tenant_id', return_value=tenant_id):
@@ -38,7 +37,6 @@ async def test_create_job(service, mock_repo):
     assert job.tenant_id == tenant_id
     mock_repo.save.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_start_pipeline_success(service, mock_repo, mock_curator):
     job_id = uuid4()
     tenant_id = uuid4()
@@ -52,7 +50,6 @@ async def test_start_pipeline_success(service, mock_repo, mock_curator):
     assert updated_job.dataset_path == "/path/to/dataset.jsonl"
     assert mock_repo.save.call_count >= 2
 
-@pytest.mark.asyncio
 async def test_complete_job(service, mock_repo):
     job_id = uuid4()
     tenant_id = uuid4()
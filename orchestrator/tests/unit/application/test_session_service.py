@@ -5,12 +5,11 @@ Comprehensive unit tests for SessionService business logic.
 
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import Mock, patch
 from uuid import uuid4, UUID
 
 from src.industrial_orchestrator.application.services.session_service import SessionService
 from src.industrial_orchestrator.domain.entities.session import (
-    SessionEntity,
     SessionType,
     SessionPriority,
 )
@@ -19,44 +18,66 @@ from src.industrial_orchestrator.domain.exceptions.session_exceptions import (
     InvalidSessionTransition,
     SessionNotFoundError,
 )
+from tests.unit.application.mocks import async_return
+
+
+# Fixed timestamp for checkpoint payloads; keeps fixtures deterministic
+FIXED_NOW_ISO = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
 
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
+def _configure_session_repo(repo):
+    """Install default awaitable stubs on the session repository mock."""
+    for method in ("initialize", "add", "update", "add_checkpoint", "get_by_id",
+                   "get_with_metrics", "get_with_checkpoints", "get_full_session"):
+        getattr(repo, method).side_effect = async_return(None)
+    repo.get_all.side_effect = async_return([])
+    repo.find_active_sessions.side_effect = async_return([])
+    repo.get_session_stats.side_effect = async_return({"total": 0})
+    repo.get_session_tree.side_effect = async_return({})
+
+
+def _configure_opencode_client(client):
+    """Install default awaitable stubs on the OpenCode client mock."""
+    client.initialize.side_effect = async_return(None)
+    client.execute_session_task.side_effect = async_return({
+        "session_id": "oc-123",
+        "diff": {"files_changed": 2},
+        "metrics": {"tokens": 1000},
+    })
+
+
+@pytest.fixture(scope="module")
 def mock_session_repo():
-    """Create mock session repository."""
-    repo = AsyncMock()
-    repo.initialize = AsyncMock()
-    repo.add = AsyncMock()
-    repo.update = AsyncMock()
-    repo.get_by_id = AsyncMock(return_value=None)
-    repo.get_with_metrics = AsyncMock(return_value=None)
-    repo.get_with_checkpoints = AsyncMock(return_value=None)
-    repo.get_full_session = AsyncMock(return_value=None)
-    repo.add_checkpoint = AsyncMock()
-    repo.get_all = AsyncMock(return_value=[])
-    repo.find_active_sessions = AsyncMock(return_value=[])
-    repo.get_session_stats = AsyncMock(return_value={"total": 0})
-    repo.get_session_tree = AsyncMock(return_value={})
+    """Create mock session repository shared by the module."""
+    repo = Mock()
+    _configure_session_repo(repo)
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_opencode_client():
-    """Create mock OpenCode client."""
-    client = AsyncMock()
-    client.initialize = AsyncMock()
-    client.execute_session_task = AsyncMock(return_value={
-        "session_id": "oc-123",
-        "diff": {"files_changed": 2},
-        "metrics": {"tokens": 1000},
-    })
+    """Create mock OpenCode client shared by the module."""
+    client = Mock()
+    _configure_opencode_client(client)
     return client
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_session_repo, mock_opencode_client):
+    """Restore the shared mocks to their defaults after every test."""
+    yield
+    for mock, configure in (
+        (mock_session_repo, _configure_session_repo),
+        (mock_opencode_client, _configure_opencode_client),
+    ):
+        mock.reset_mock(return_value=True, side_effect=True)
+        configure(mock)
+
+
 @pytest.fixture
 def session_service(mock_session_repo, mock_opencode_client):
     """Create SessionService with mock dependencies."""
@@ -67,10 +88,10 @@ def session_service(mock_session_repo, mock_opencode_client):
     )
 
 
-@pytest.fixture
-def sample_session():
-    """Create a sample session entity."""
-    return SessionEntity(
+@pytest.fixture(scope="module")
+def _sample_session_template(make_session):
+    """Create a sample session entity shared by the module."""
+    return make_session(
         tenant_id=uuid4(),
         title="IND-TEST-001: Sample Session",
         initial_prompt="Implement feature X",
@@ -80,6 +101,12 @@ def sample_session():
     )
 
 
+@pytest.fixture
+def sample_session(_sample_session_template):
+    """Per-test copy of the sample session for tests that mutate it."""
+    return _sample_session_template.model_copy(deep=True)
+
+
 # ============================================================================
 # Test Session Creation
 # ============================================================================
@@ -87,12 +114,11 @@ def sample_session():
 class TestSessionCreation:
     """Test session creation use cases."""
 
-    @pytest.mark.asyncio
-    async def test_create_session_success(self, session_service, mock_session_repo):
+    async def test_create_session_success(self, session_service, mock_session_repo, make_session):
         """Test successful session creation with all fields."""
         tenant_id = uuid4()
         # Arrange
-        expected_session = SessionEntity(
+        expected_session = make_session(
             tenant_id=tenant_id,
             title="IND-TEST-001: New Feature",
             initial_prompt="Implement authentication",
@@ -100,21 +126,19 @@ class TestSessionCreation:
             priority=SessionPriority.HIGH,
             created_by="dev_team",
         )
-        mock_session_repo.add.return_value = expected_session
+        mock_session_repo.add.side_effect = async_return(expected_session)
         
         # Act
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock', 
-                   return_value=AsyncMock(__aenter__=AsyncMock(), __aexit__=AsyncMock())):
-            with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
-                result = await session_service.create_session(
-                    title="IND-TEST-001: New Feature",
-                    initial_prompt="Implement authentication",
-                    session_type=SessionType.EXECUTION,
-                    priority=SessionPriority.HIGH,
-                    created_by="dev_team",
-                    tags=["auth", "security"],
-                    metadata={"sprint": 5},
-                )
+        with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
+            result = await session_service.create_session(
+                title="IND-TEST-001: New Feature",
+                initial_prompt="Implement authentication",
+                session_type=SessionType.EXECUTION,
+                priority=SessionPriority.HIGH,
+                created_by="dev_team",
+                tags=["auth", "security"],
+                metadata={"sprint": 5},
+            )
         
         # Assert
         assert result is not None
@@ -127,31 +151,27 @@ class TestSessionCreation:
         assert added_session.session_type == SessionType.EXECUTION
         assert added_session.priority == SessionPriority.HIGH
 
-    @pytest.mark.asyncio
-    async def test_create_session_with_defaults(self, session_service, mock_session_repo):
+    async def test_create_session_with_defaults(self, session_service, mock_session_repo, make_session):
         """Test session creation with minimal required fields."""
         tenant_id = uuid4()
-        expected_session = SessionEntity(
+        expected_session = make_session(
             tenant_id=tenant_id,
             title="IND-MIN-001: Minimal Session",
             initial_prompt="Simple task",
         )
-        mock_session_repo.add.return_value = expected_session
+        mock_session_repo.add.side_effect = async_return(expected_session)
         
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock',
-                   return_value=AsyncMock(__aenter__=AsyncMock(), __aexit__=AsyncMock())):
-            with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
-                result = await session_service.create_session(
-                    title="IND-MIN-001: Minimal Session",
-                    initial_prompt="Simple task",
-                )
+        with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
+            result = await session_service.create_session(
+                title="IND-MIN-001: Minimal Session",
+                initial_prompt="Simple task",
+            )
         
         assert result is not None
         added_session = mock_session_repo.add.call_args[0][0]
         assert added_session.session_type == SessionType.EXECUTION  # Default
         assert added_session.priority == SessionPriority.MEDIUM  # Default
 
-    @pytest.mark.asyncio
     async def test_create_session_empty_title_fails(self, session_service):
         """Test that empty title is rejected."""
         with pytest.raises(ValueError, match="title is required"):
@@ -160,7 +180,6 @@ class TestSessionCreation:
                 initial_prompt="Some task",
             )
 
-    @pytest.mark.asyncio
     async def test_create_session_empty_prompt_fails(self, session_service):
         """Test that empty prompt is rejected."""
         with pytest.raises(ValueError, match="prompt is required"):
@@ -169,7 +188,6 @@ class TestSessionCreation:
                 initial_prompt="",
             )
 
-    @pytest.mark.asyncio
     async def test_create_session_whitespace_title_fails(self, session_service):
         """Test that whitespace-only title is rejected."""
         with pytest.raises(ValueError, match="title is required"):
@@ -178,7 +196,6 @@ class TestSessionCreation:
                 initial_prompt="Some task",
             )
 
-    @pytest.mark.asyncio
     async def test_create_session_with_parent(self, session_service, mock_session_repo, sample_session):
         """Test session creation with parent session."""
         parent_id = uuid4()
@@ -186,39 +203,31 @@ class TestSessionCreation:
         parent_session.id = parent_id
         tenant_id = sample_session.tenant_id
     
-        mock_session_repo.get_by_id.return_value = parent_session
-        mock_session_repo.add.return_value = sample_session
+        mock_session_repo.get_by_id.side_effect = async_return(parent_session)
+        mock_session_repo.add.side_effect = async_return(sample_session)
     
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock',
-                   return_value=AsyncMock(__aenter__=AsyncMock(), __aexit__=AsyncMock())):
-            with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
-                result = await session_service.create_session(
-                    title="IND-CHILD-001: Child Session",
-                    initial_prompt="Sub-task",
-                    parent_session_id=parent_id,
-                )
+        with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
+            result = await session_service.create_session(
+                title="IND-CHILD-001: Child Session",
+                initial_prompt="Sub-task",
+                parent_session_id=parent_id,
+            )
         assert result is not None
         mock_session_repo.get_by_id.assert_called_once_with(parent_id)
 
-    @pytest.mark.asyncio
     async def test_create_session_nonexistent_parent_fails(self, session_service, mock_session_repo):
         """Test that creation fails if parent doesn't exist."""
         parent_id = uuid4()
         tenant_id = uuid4()
-        mock_session_repo.get_by_id.return_value = None  # Parent not found
-    
-        lock_mock = AsyncMock()
-        lock_mock.__aenter__.return_value = AsyncMock()
-        lock_mock.__aexit__.return_value = None
+        mock_session_repo.get_by_id.side_effect = async_return(None)  # Parent not found
     
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock', return_value=lock_mock):
-            with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
-                with pytest.raises(SessionNotFoundError):
-                    await session_service.create_session(
-                        title="IND-ORPHAN-001: Orphan",
-                        initial_prompt="Orphan task",
-                        parent_session_id=parent_id,
-                    )
+        with patch('src.industrial_orchestrator.application.services.session_service.get_current_tenant_id', return_value=tenant_id):
+            with pytest.raises(SessionNotFoundError):
+                await session_service.create_session(
+                    title="IND-ORPHAN-001: Orphan",
+                    initial_prompt="Orphan task",
+                    parent_session_id=parent_id,
+                )
 
 
 # ============================================================================
@@ -228,83 +237,57 @@ class TestSessionCreation:
 class TestSessionLifecycle:
     """Test session state transitions."""
 
-    @pytest.mark.asyncio
-    async def test_start_session_success(self, session_service, mock_session_repo, sample_session):
-        """Test successful session start."""
+    @pytest.mark.parametrize(
+        "method, already_running, kwargs",
+        [
+            ("start_session", False, {}),
+            (
+                "complete_session",
+                True,
+                {
+                    "result": {"output": "Task completed", "files_changed": 5},
+                    "success_rate": 0.95,
+                    "confidence_score": 0.88,
+                },
+            ),
+            (
+                "fail_session",
+                True,
+                {
+                    "error": RuntimeError("Connection timeout"),
+                    "error_context": {"source": "api"},
+                    "retryable": True,
+                },
+            ),
+        ],
+        ids=["start", "complete", "fail"],
+    )
+    async def test_lifecycle_transition_success(
+        self, session_service, mock_session_repo, sample_session, method, already_running, kwargs
+    ):
+        """Test successful start/complete/fail transitions persist the session once."""
         session_id = sample_session.id
         sample_session.status = SessionStatus.PENDING
-        mock_session_repo.get_by_id.return_value = sample_session
-        mock_session_repo.update.return_value = sample_session
-        
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock',
-                   return_value=AsyncMock(__aenter__=AsyncMock(), __aexit__=AsyncMock())):
-            result = await session_service.start_session(session_id)
-        
+        if already_running:
+            sample_session.start_execution()  # PENDING -> RUNNING
+
+        mock_session_repo.get_by_id.side_effect = async_return(sample_session)
+        mock_session_repo.get_with_metrics.side_effect = async_return(sample_session)
+        mock_session_repo.update.side_effect = async_return(sample_session)
+
+        result = await getattr(session_service, method)(session_id, **kwargs)
+
         assert result is not None
         mock_session_repo.update.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_start_nonexistent_session_fails(self, session_service, mock_session_repo):
         """Test that starting nonexistent session raises error."""
         session_id = uuid4()
-        mock_session_repo.get_by_id.return_value = None
-        mock_session_repo.get_with_metrics.return_value = None
-    
-        lock_mock = AsyncMock()
-        lock_mock.__aenter__.return_value = AsyncMock()
-        lock_mock.__aexit__.return_value = False
+        mock_session_repo.get_by_id.side_effect = async_return(None)
+        mock_session_repo.get_with_metrics.side_effect = async_return(None)
     
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock',
-                   return_value=lock_mock):
-            with pytest.raises(SessionNotFoundError):
-                await session_service.start_session(session_id)
-
-    @pytest.mark.asyncio
-    async def test_complete_session_success(self, session_service, mock_session_repo, sample_session):
-        """Test successful session completion."""
-        session_id = sample_session.id
-        sample_session.status = SessionStatus.PENDING
-        sample_session.start_execution()  # PENDING -> RUNNING
-        
-        mock_session_repo.get_with_metrics.return_value = sample_session
-        mock_session_repo.update.return_value = sample_session
-        
-        result_data = {"output": "Task completed", "files_changed": 5}
-        
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock',
-                   return_value=AsyncMock(__aenter__=AsyncMock(), __aexit__=AsyncMock())):
-            result = await session_service.complete_session(
-                session_id,
-                result=result_data,
-                success_rate=0.95,
-                confidence_score=0.88,
-            )
-        
-        assert result is not None
-        mock_session_repo.update.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_fail_session_success(self, session_service, mock_session_repo, sample_session):
-        """Test session failure handling."""
-        session_id = sample_session.id
-        sample_session.status = SessionStatus.RUNNING
-        
-        mock_session_repo.get_with_metrics.return_value = sample_session
-        mock_session_repo.update.return_value = sample_session
-        
-        error = RuntimeError("Connection timeout")
-        
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock',
-                   return_value=AsyncMock(__aenter__=AsyncMock(), __aexit__=AsyncMock())):
-            result = await session_service.fail_session(
-                session_id,
-                error=error,
-                error_context={"source": "api"},
-                retryable=True,
-            )
-        
-        assert result is not None
-        mock_session_repo.update.assert_called_once()
+        with pytest.raises(SessionNotFoundError):
+            await session_service.start_session(session_id)
 
 
 # ============================================================================
@@ -314,17 +297,16 @@ class TestSessionLifecycle:
 class TestCheckpointing:
     """Test session checkpoint operations."""
 
-    @pytest.mark.asyncio
     async def test_add_checkpoint_success(self, session_service, mock_session_repo):
         """Test adding checkpoint to session."""
         session_id = uuid4()
         checkpoint_data = {"state": "step_3_complete", "progress": 0.75}
         
-        mock_session_repo.add_checkpoint.return_value = {
+        mock_session_repo.add_checkpoint.side_effect = async_return({
             "sequence": 1,
             "data": checkpoint_data,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-        }
+            "created_at": FIXED_NOW_ISO,
+        })
         
         result = await session_service.add_checkpoint(
             session_id,
@@ -344,7 +326,6 @@ class TestCheckpointing:
 class TestSessionRetry:
     """Test session retry logic."""
 
-    @pytest.mark.asyncio
     async def test_retry_recoverable_session(self, mock_session_repo, mock_opencode_client, sample_session):
         """Test retrying a recoverable session."""
         # Ensure we use a fresh service instance
@@ -352,45 +333,36 @@ class TestSessionRetry:
         session_id = sample_session.id
         sample_session.status = SessionStatus.FAILED
         # Force recoverability: must have status in set AND checkpoints AND retry count < 3
-        sample_session.checkpoints = [{"sequence": 1, "data": {}, "timestamp": datetime.now(timezone.utc).isoformat()}]
+        sample_session.checkpoints = [{"sequence": 1, "data": {}, "timestamp": FIXED_NOW_ISO}]
         sample_session.metrics.retry_count = 0
     
         # Setup mocks
-        mock_session_repo.get_with_checkpoints.return_value = sample_session
-        mock_session_repo.update.return_value = sample_session
-    
-        lock_mock = AsyncMock()
-        lock_mock.__aenter__.return_value = AsyncMock()
-        lock_mock.__aexit__.return_value = False
+        mock_session_repo.get_with_checkpoints.side_effect = async_return(sample_session)
+        mock_session_repo.update.side_effect = async_return(sample_session)
     
         # Act
-        with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock',
-                   return_value=lock_mock):
-            result = await local_service.retry_session(session_id)
+        result = await local_service.retry_session(session_id)
         
         assert result is not None
         assert sample_session.status == SessionStatus.PENDING
 
-    @pytest.mark.asyncio
-    async def test_retry_nonrecoverable_session_returns_none(self, session_service, mock_session_repo, sample_session):
+    async def test_retry_nonrecoverable_session_returns_none(self, make_min_service, sample_session):
         """Test that non-recoverable session returns None."""
         session_id = sample_session.id
         sample_session.status = SessionStatus.FAILED
         # No checkpoints -> non-recoverable
         sample_session.checkpoints = []
-        mock_session_repo.get_with_checkpoints.return_value = sample_session
+        service = make_min_service(get_with_checkpoints=async_return(sample_session))
         
-        result = await session_service.retry_session(session_id)
+        result = await service.retry_session(session_id)
         
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_retry_nonexistent_session_returns_none(self, session_service, mock_session_repo):
+    async def test_retry_nonexistent_session_returns_none(self, make_min_service):
         """Test that retrying nonexistent session returns None."""
         session_id = uuid4()
-        mock_session_repo.get_with_checkpoints.return_value = None
         
-        result = await session_service.retry_session(session_id)
+        result = await make_min_service().retry_session(session_id)
         
         assert result is None
 
@@ -402,7 +374,6 @@ class TestSessionRetry:
 class TestOpenCodeExecution:
     """Test OpenCode integration."""
 
-    @pytest.mark.asyncio
     async def test_execute_without_client_raises_error(self, mock_session_repo):
         """Test that execute without client raises RuntimeError."""
         service = SessionService(
@@ -413,11 +384,10 @@ class TestOpenCodeExecution:
         with pytest.raises(RuntimeError, match="not configured"):
             await service.execute_with_opencode(uuid4())
 
-    @pytest.mark.asyncio
     async def test_execute_nonexistent_session_fails(self, session_service, mock_session_repo):
         """Test that executing nonexistent session raises error."""
         session_id = uuid4()
-        mock_session_repo.get_by_id.return_value = None
+        mock_session_repo.get_by_id.side_effect = async_return(None)
         
         with pytest.raises(SessionNotFoundError):
             await session_service.execute_with_opencode(session_id)
@@ -430,79 +400,67 @@ class TestOpenCodeExecution:
 class TestSessionQueries:
     """Test session query operations."""
 
-    @pytest.mark.asyncio
-    async def test_get_session_by_id(self, session_service, mock_session_repo, sample_session):
-        """Test retrieving session by ID."""
-        session_id = sample_session.id
-        mock_session_repo.get_by_id.return_value = sample_session
-        
-        result = await session_service.get_session(session_id)
-        
-        assert result is not None
-        assert result.id == session_id
-
-    @pytest.mark.asyncio
-    async def test_get_session_with_metrics(self, session_service, mock_session_repo, sample_session):
-        """Test retrieving session with metrics."""
-        session_id = sample_session.id
-        mock_session_repo.get_with_metrics.return_value = sample_session
-        
-        result = await session_service.get_session(session_id, include_metrics=True)
-        
-        mock_session_repo.get_with_metrics.assert_called_once_with(session_id)
+    # Each case: service method, its (args, kwargs), the repository method it
+    # delegates to, that method's result, its expected call args, and a check
+    # on the service result. Callables receive the shared sample session.
+    QUERY_CASES = [
+        pytest.param(
+            "get_session", lambda s: ((s.id,), {}),
+            "get_by_id", lambda s: s, lambda s: (s.id,),
+            lambda result, s: result.id == s.id,
+            id="get_session_by_id",
+        ),
+        pytest.param(
+            "get_session", lambda s: ((s.id,), {"include_metrics": True}),
+            "get_with_metrics", lambda s: s, lambda s: (s.id,),
+            lambda result, s: result is s,
+            id="get_session_with_metrics",
+        ),
+        pytest.param(
+            "get_session", lambda s: ((s.id,), {"include_checkpoints": True}),
+            "get_with_checkpoints", lambda s: s, lambda s: (s.id,),
+            lambda result, s: result is s,
+            id="get_session_with_checkpoints",
+        ),
+        pytest.param(
+            "find_sessions",
+            lambda s: ((), {"status": SessionStatus.PENDING, "session_type": SessionType.EXECUTION}),
+            "get_all", lambda s: [s], lambda s: (),
+            lambda result, s: len(result) == 1 and result[0].status == SessionStatus.PENDING,
+            id="find_sessions_with_filters",
+        ),
+        pytest.param(
+            "monitor_sessions", lambda s: ((), {}),
+            "get_session_stats", lambda s: {"total": 5}, lambda s: (),
+            lambda result, s: result["active_sessions_count"] == 0 and result["stats"] == {"total": 5},
+            id="monitor_sessions",
+        ),
+        pytest.param(
+            "get_session_tree", lambda s: ((s.id,), {}),
+            "get_session_tree", lambda s: {"id": str(s.id), "title": "Root", "children": []},
+            lambda s: (s.id,),
+            lambda result, s: result == {"id": str(s.id), "title": "Root", "children": []},
+            id="get_session_tree",
+        ),
+    ]
+
+    @pytest.mark.parametrize(
+        "method, call, repo_method, repo_result, repo_args, check", QUERY_CASES
+    )
+    async def test_query(
+        self, session_service, mock_session_repo, _sample_session_template,
+        method, call, repo_method, repo_result, repo_args, check,
+    ):
+        """Test that each query delegates to the right repository method."""
+        session = _sample_session_template
+        repo_call = getattr(mock_session_repo, repo_method)
+        repo_call.side_effect = async_return(repo_result(session))
+        args, kwargs = call(session)
 
-    @pytest.mark.asyncio
-    async def test_get_session_with_checkpoints(self, session_service, mock_session_repo, sample_session):
-        """Test retrieving session with checkpoints."""
-        session_id = sample_session.id
-        mock_session_repo.get_with_checkpoints.return_value = sample_session
-        
-        result = await session_service.get_session(session_id, include_checkpoints=True)
-        
-        mock_session_repo.get_with_checkpoints.assert_called_once_with(session_id)
+        result = await getattr(session_service, method)(*args, **kwargs)
 
-    @pytest.mark.asyncio
-    async def test_find_sessions_with_filters(self, session_service, mock_session_repo, sample_session):
-        """Test finding sessions with filters."""
-        sample_session.status = SessionStatus.PENDING
-        sample_session.session_type = SessionType.EXECUTION
-        mock_session_repo.get_all.return_value = [sample_session]
-        
-        result = await session_service.find_sessions(
-            status=SessionStatus.PENDING,
-            session_type=SessionType.EXECUTION,
-        )
-        
-        assert len(result) == 1
-        assert result[0].status == SessionStatus.PENDING
-
-    @pytest.mark.asyncio
-    async def test_monitor_sessions(self, session_service, mock_session_repo):
-        """Test session monitoring."""
-        mock_session_repo.find_active_sessions.return_value = []
-        mock_session_repo.get_session_stats.return_value = {"total": 5}
-        
-        result = await session_service.monitor_sessions()
-        
-        assert "active_sessions_count" in result
-        assert "stats" in result
-        assert result["active_sessions_count"] == 0
-
-    @pytest.mark.asyncio
-    async def test_get_session_tree(self, session_service, mock_session_repo):
-        """Test getting session hierarchy tree."""
-        root_id = uuid4()
-        expected_tree = {
-            "id": str(root_id),
-            "title": "Root",
-            "children": [],
-        }
-        mock_session_repo.get_session_tree.return_value = expected_tree
-        
-        result = await session_service.get_session_tree(root_id)
-        
-        assert result == expected_tree
-        mock_session_repo.get_session_tree.assert_called_once_with(root_id)
+        assert check(result, session)
+        repo_call.assert_called_once_with(*repo_args(session))
 
 
 # ============================================================================
@@ -512,24 +470,20 @@ class TestSessionQueries:
 class TestEventPublishing:
     """Test event handling and publishing."""
 
-    @pytest.mark.asyncio
-    async def test_event_handler_registration(self, session_service):
+    def test_event_handler_registration(self, session_service):
         """Test that event handlers can be registered."""
-        handler = MagicMock()
+        handler = Mock()
         session_service._register_event_handler("SessionCreated", handler)
         
         assert "SessionCreated" in session_service._event_handlers
         assert handler in session_service._event_handlers["SessionCreated"]
 
-    @pytest.mark.asyncio
     async def test_event_publishing_calls_handlers(self, session_service):
-        """Test that publishing events calls registered handlers."""
-        handler = MagicMock()
+        """Test that publishing events calls registered sync handlers with the event."""
+        handler = Mock()
         session_service._register_event_handler("TestEvent", handler)
+        event = type("TestEvent", (), {})()
         
-        class TestEvent:
-            pass
-        
-        await session_service._publish_event(TestEvent())
+        await session_service._publish_event(event)
         
-        handler.assert_called_once()
\ No newline at end of file
+        handler.assert_called_once_with(event)
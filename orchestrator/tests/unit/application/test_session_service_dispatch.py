@@ -4,7 +4,8 @@ Tests for Agent routing and execution dispatch (Internal vs External).
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 from src.industrial_orchestrator.application.services.session_service import SessionService
@@ -12,7 +13,6 @@ from src.industrial_orchestrator.domain.entities.session import (
     SessionEntity,
     SessionStatus,
 )
-from src.industrial_orchestrator.domain.entities.registry import RegisteredAgent
 from src.industrial_orchestrator.application.dtos.external_agent_protocol import (
     EAPTaskAssignment,
     EAPTaskResult,
@@ -21,19 +21,12 @@ from src.industrial_orchestrator.application.dtos.external_agent_protocol import
 
 @pytest.fixture
 def mock_session_repo():
-    repo = AsyncMock()
-    repo.get_by_id = AsyncMock()
-    repo.get_with_metrics = AsyncMock()
-    repo.update = AsyncMock()
-    repo.add = AsyncMock()
-    return repo
+    return AsyncMock()
 
 
 @pytest.fixture
 def mock_agent_repo():
-    repo = AsyncMock()
-    repo.get_by_name = AsyncMock()
-    return repo
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -43,9 +36,7 @@ def mock_external_adapter():
 
 @pytest.fixture
 def mock_opencode_client():
-    client = AsyncMock()
-    client.execute_session_task = AsyncMock()
-    return client
+    return AsyncMock()
 
 
 @pytest.fixture
@@ -58,7 +49,6 @@ def service(mock_session_repo, mock_agent_repo, mock_external_adapter, mock_open
     )
 
 
-@pytest.mark.asyncio
 async def test_execute_session_external_dispatch(service, mock_session_repo, mock_agent_repo, mock_external_adapter):
     # Setup Session
     session_id = uuid4()
@@ -76,14 +66,15 @@ async def test_execute_session_external_dispatch(service, mock_session_repo, moc
     mock_session_repo.update.return_value = session
 
     # Setup Agent
-    agent = MagicMock(spec=RegisteredAgent)
-    agent.id = uuid4()
-    agent.name = "AGENT-EXT-01"
-    agent.metadata = {
-        "is_external": True,
-        "endpoint_url": "http://ext-agent",
-        "auth_token": "token"
-    }
+    agent = SimpleNamespace(
+        id=uuid4(),
+        name="AGENT-EXT-01",
+        metadata={
+            "is_external": True,
+            "endpoint_url": "http://ext-agent",
+            "auth_token": "token"
+        },
+    )
     mock_agent_repo.get_by_name.return_value = agent
 
     # Setup Adapter Response
@@ -95,12 +86,8 @@ async def test_execute_session_external_dispatch(service, mock_session_repo, moc
     )
     mock_external_adapter.send_task.return_value = eap_result
 
-    # Mock distributed_lock context manager
-    with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock') as mock_lock:
-        mock_lock.return_value.__aenter__.return_value = True
-        
-        # Execute
-        result = await service.execute_session(session_id)
+    # Execute
+    result = await service.execute_session(session_id)
 
     # Verify
     assert result["success"] is True
@@ -110,7 +97,6 @@ async def test_execute_session_external_dispatch(service, mock_session_repo, moc
     mock_external_adapter.send_task.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_execute_session_internal_fallback(service, mock_session_repo, mock_agent_repo, mock_opencode_client):
     # Setup Session
     session_id = uuid4()
@@ -128,10 +114,11 @@ async def test_execute_session_internal_fallback(service, mock_session_repo, moc
     mock_session_repo.update.return_value = session
 
     # Setup Agent (Not external)
-    agent = MagicMock(spec=RegisteredAgent)
-    agent.id = uuid4()
-    agent.name = "AGENT-INT-01"
-    agent.metadata = {"is_external": False}
+    agent = SimpleNamespace(
+        id=uuid4(),
+        name="AGENT-INT-01",
+        metadata={"is_external": False},
+    )
     mock_agent_repo.get_by_name.return_value = agent
 
     # Setup OpenCode Response
@@ -141,12 +128,8 @@ async def test_execute_session_internal_fallback(service, mock_session_repo, moc
         "metrics": {"duration": 1.0}
     }
 
-    # Mock distributed_lock
-    with patch('src.industrial_orchestrator.application.services.session_service.distributed_lock') as mock_lock:
-        mock_lock.return_value.__aenter__.return_value = True
-        
-        # Execute
-        result = await service.execute_session(session_id)
+    # Execute
+    result = await service.execute_session(session_id)
 
     # Verify
     assert result["success"] is True
@@ -5,8 +5,12 @@ Unit tests for TaskDecompositionService business logic.
 These tests use mocks to isolate the service from infrastructure dependencies.
 """
 
+import sys
+from types import SimpleNamespace
+
 import pytest
 from uuid import uuid4
+from dataclasses import FrozenInstanceError
 
 # Import only what exists in the domain
 from src.industrial_orchestrator.application.services.task_decomposition_service import (
@@ -40,8 +44,8 @@ def complexity_analyzer():
     return ComplexityAnalyzer()
 
 
-@pytest.fixture
-def simple_task():
+@pytest.fixture(scope="module")
+def _simple_task_template():
     """Create simple implementation task."""
     return TaskEntity(
         tenant_id=uuid4(),
@@ -54,7 +58,13 @@ def simple_task():
 
 
 @pytest.fixture
-def complex_microservice_task():
+def simple_task(_simple_task_template):
+    """Mutable per-test copy of the template."""
+    return _simple_task_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="module")
+def _complex_microservice_task_template():
     """Create complex microservice task."""
     return TaskEntity(
         tenant_id=uuid4(),
@@ -67,7 +77,13 @@ def complex_microservice_task():
 
 
 @pytest.fixture
-def crud_task():
+def complex_microservice_task(_complex_microservice_task_template):
+    """Mutable per-test copy of the template."""
+    return _complex_microservice_task_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="module")
+def _crud_task_template():
     """Create CRUD operation task."""
     return TaskEntity(
         tenant_id=uuid4(),
@@ -80,7 +96,13 @@ def crud_task():
 
 
 @pytest.fixture
-def security_task():
+def crud_task(_crud_task_template):
+    """Mutable per-test copy of the template."""
+    return _crud_task_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="module")
+def _security_task_template():
     """Create security-focused task."""
     return TaskEntity(
         tenant_id=uuid4(),
@@ -92,6 +114,12 @@ def security_task():
     )
 
 
+@pytest.fixture
+def security_task(_security_task_template):
+    """Mutable per-test copy of the template."""
+    return _security_task_template.model_copy(deep=True)
+
+
 # ============================================================================
 # Test Complexity Analyzer
 # ============================================================================
@@ -137,6 +165,23 @@ class TestComplexityAnalyzer:
         # Security requirements should have higher complexity
         assert secure_result["technical_terms"] > simple_result["technical_terms"]
 
+    def test_analyze_repeated_text_returns_independent_copies(self, complexity_analyzer):
+        """Test cached analysis is not shared with callers."""
+        text = "Implement API integration with database authentication"
+        
+        first = complexity_analyzer.analyze_requirements_text(text)
+        first["estimated_hours"] = -1
+        second = complexity_analyzer.analyze_requirements_text(text)
+        
+        assert second["estimated_hours"] >= 1.0
+        assert second == complexity_analyzer._compute_requirements_analysis(text)
+
+    def test_analyze_text_with_lone_surrogate(self, complexity_analyzer):
+        """Test text that cannot be UTF-8 encoded is still analyzed."""
+        result = complexity_analyzer.analyze_requirements_text("Build API \ud800 and deploy")
+        
+        assert result["word_count"] == 5
+
     def test_analyze_empty_text(self, complexity_analyzer):
         """Test analyzing empty text."""
         result = complexity_analyzer.analyze_requirements_text("")
@@ -144,9 +189,18 @@ class TestComplexityAnalyzer:
         assert result["word_count"] == 0
         assert result["estimated_hours"] == 1.0
 
-    def test_estimate_from_task_description(self, complexity_analyzer, simple_task):
+    def test_analyze_whitespace_text(self, complexity_analyzer):
+        """Test whitespace-only text is analyzed as one empty sentence."""
+        result = complexity_analyzer.analyze_requirements_text(" \n\t ")
+        
+        assert result["word_count"] == 0
+        assert result["sentence_count"] == 1
+        assert result["complexity_score"] == 1.0
+        assert result["estimated_hours"] == 1.0
+
+    def test_estimate_from_task_description(self, complexity_analyzer, _simple_task_template):
         """Test estimating complexity from task entity."""
-        result = complexity_analyzer.estimate_from_task_description(simple_task)
+        result = complexity_analyzer.estimate_from_task_description(_simple_task_template)
         
         assert result is not None
         assert isinstance(result, TaskEstimate)
@@ -196,6 +250,15 @@ class TestTemplateMatching:
         assert hasattr(decomposition_service, '_rules')
         assert len(decomposition_service._rules) > 0
 
+    def test_services_share_default_templates_and_rules(self, decomposition_service):
+        """Test defaults are built once and shared read-only."""
+        other = TaskDecompositionService()
+        
+        assert other._templates is decomposition_service._templates
+        assert other._rules is decomposition_service._rules
+        with pytest.raises(TypeError):
+            other._templates["extra"] = None
+
     def test_templates_have_required_fields(self, decomposition_service):
         """Test that templates have required configuration."""
         for name, template in decomposition_service._templates.items():
@@ -318,6 +381,33 @@ class TestDecompositionRuleModel:
         
         assert rule.parameters == {}
 
+    def test_rule_compiles_pattern_once(self):
+        """Test rule pattern is compiled case-insensitively and reused."""
+        rule = DecompositionRule(
+            pattern=".*(CRUD|database).*",
+            strategy="crud_pattern",
+        )
+        
+        assert rule.compiled_pattern is rule.compiled_pattern
+        assert rule.compiled_pattern.search("build a crud endpoint")
+
+    def test_rule_rejects_invalid_pattern(self):
+        """Test invalid regex fails validation."""
+        with pytest.raises(ValueError, match="Invalid rule pattern"):
+            DecompositionRule(pattern="(unclosed", strategy="direct")
+
+    def test_rule_rejects_out_of_range_priority(self):
+        """Test priority is bounded to 1-10."""
+        with pytest.raises(ValueError, match="priority"):
+            DecompositionRule(pattern=".*", strategy="direct", priority=11)
+
+    def test_rule_is_immutable(self):
+        """Test rules cannot be modified after construction."""
+        rule = DecompositionRule(pattern=".*api.*", strategy="direct")
+        
+        with pytest.raises(FrozenInstanceError):
+            rule.pattern = ".*ui.*"
+
 
 # ============================================================================
 # Test Edge Cases
@@ -358,8 +448,19 @@ class TestEdgeCases:
         assert result is not None
         assert result["estimated_hours"] <= 24.0  # Should cap at max
 
-    def test_calculate_max_depth_leaf_task(self, decomposition_service, simple_task):
+    def test_calculate_max_depth_leaf_task(self, decomposition_service, _simple_task_template):
         """Test depth calculation for leaf task."""
-        depth = decomposition_service._calculate_max_depth(simple_task)
+        depth = decomposition_service._calculate_max_depth(_simple_task_template)
         
         assert depth == 1
+
+    def test_calculate_max_depth_beyond_recursion_limit(self, decomposition_service):
+        """Test depth calculation on a hierarchy deeper than the recursion limit."""
+        levels = sys.getrecursionlimit() + 10
+        root = node = SimpleNamespace(child_tasks=[])
+        for _ in range(levels - 1):
+            child = SimpleNamespace(child_tasks=[])
+            node.child_tasks.extend([SimpleNamespace(child_tasks=[]), child])
+            node = child
+        
+        assert decomposition_service._calculate_max_depth(root) == levels
@@ -0,0 +1,121 @@
+"""
+CONFTEST - Domain Entity Test Fixtures
+Shared fixtures for domain entity unit testing.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.industrial_orchestrator.domain.entities.agent import AgentEntity
+from src.industrial_orchestrator.domain.entities.session import SessionEntity
+from src.industrial_orchestrator.domain.entities.task import TaskEntity
+from src.industrial_orchestrator.domain.value_objects.session_status import SessionStatus
+from tests.unit.domain.factories.agent_factory import AgentEntityFactory
+from tests.unit.domain.factories.session_factory import SessionEntityFactory
+from tests.unit.domain.factories.task_factory import TaskEntityFactory
+
+
+# ============================================================================
+# Agent Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def _agent_proto():
+    """One AgentEntity per factory variant, built once per run."""
+    return {
+        "default": AgentEntityFactory.build(),
+        "elite": AgentEntityFactory.build(elite=True),
+        "degraded": AgentEntityFactory.build(degraded=True),
+        "overloaded": AgentEntityFactory.build(overloaded=True),
+    }
+
+
+@pytest.fixture
+def agent(request, _agent_proto) -> AgentEntity:
+    """
+    Fresh AgentEntity cloned from the session prototype.
+
+    Defaults to the plain factory variant; select another with
+    ``@pytest.mark.parametrize("agent", ["elite"], indirect=True)``.
+    The clone is deep, so tests may mutate performance and load freely.
+    """
+    variant = getattr(request, "param", "default")
+    return _agent_proto[variant].model_copy(update={"id": uuid4()}, deep=True)
+
+
+# ============================================================================
+# Session Fixtures
+# ============================================================================
+
+_PROTO_STATUSES = (
+    SessionStatus.PENDING,
+    SessionStatus.RUNNING,
+    SessionStatus.COMPLETED,
+    SessionStatus.FAILED,
+)
+
+
+@pytest.fixture(scope="session")
+def _session_proto():
+    """
+    One SessionEntity per start status and factory trait.
+
+    Status keys mirror ``SessionEntityFactory(status=...)`` and are validated
+    because they override a field; the string keys mirror the
+    ``running``/``completed``/``failed`` traits, which the factory builds
+    with ``model_construct``.
+    """
+    protos = {
+        status: SessionEntityFactory.build(status=status)
+        for status in _PROTO_STATUSES
+    }
+    protos.update({
+        "running": SessionEntityFactory.build(running=True),
+        "completed": SessionEntityFactory.build(completed=True),
+        "failed": SessionEntityFactory.build(failed=True),
+    })
+    return protos
+
+
+@pytest.fixture
+def session(request, _session_proto) -> SessionEntity:
+    """
+    Fresh SessionEntity cloned from the session prototype.
+
+    Defaults to a PENDING session; select another with
+    ``@pytest.mark.parametrize("session", [SessionStatus.RUNNING], indirect=True)``
+    or a trait name such as ``"failed"``. The clone is deep, so metrics,
+    checkpoints and pending events never leak between tests.
+    """
+    variant = getattr(request, "param", SessionStatus.PENDING)
+    return _session_proto[variant].model_copy(update={"id": uuid4()}, deep=True)
+
+
+# ============================================================================
+# Task Fixtures
+# ============================================================================
+
+_TASK_TRAITS = ("assigned", "in_progress", "completed", "complex_task", "trivial")
+
+
+@pytest.fixture(scope="session")
+def _task_proto():
+    """One TaskEntity per factory trait, plus the plain default."""
+    protos = {trait: TaskEntityFactory.build(**{trait: True}) for trait in _TASK_TRAITS}
+    protos["default"] = TaskEntityFactory.build()
+    return protos
+
+
+@pytest.fixture
+def task(request, _task_proto) -> TaskEntity:
+    """
+    Fresh TaskEntity cloned from the session prototype.
+
+    Defaults to a PENDING task; select a trait with
+    ``@pytest.mark.parametrize("task", ["in_progress"], indirect=True)``.
+    The clone is deep, so estimates, dependencies and children are private
+    to the test.
+    """
+    variant = getattr(request, "param", "default")
+    return _task_proto[variant].model_copy(update={"id": uuid4()}, deep=True)
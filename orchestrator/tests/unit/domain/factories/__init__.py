@@ -8,6 +8,7 @@ from .session_factory import (
     ExecutionMetricsFactory,
     create_session_with_dependencies,
     create_session_batch,
+    create_session_batch_fast,
     IndustrialFaker,
 )
 
@@ -25,9 +26,15 @@ from .task_factory import (
     create_task_chain,
 )
 
+from ._clock import batch_clock
+from ._ids import next_uuid
+from ._seed import FACTORY_SEED, seed_factories, seeded_faker
+
 from .context_factory import (
     ContextEntityFactory,
     create_conflicting_contexts,
+    get_conflict_pair_readonly,
+    fresh_data,
 )
 
 __all__ = [
@@ -36,6 +43,7 @@ __all__ = [
     "ExecutionMetricsFactory",
     "create_session_with_dependencies",
     "create_session_batch",
+    "create_session_batch_fast",
     "IndustrialFaker",
     # Agent factories
     "AgentEntityFactory",
@@ -50,4 +58,14 @@ __all__ = [
     # Context factories
     "ContextEntityFactory",
     "create_conflicting_contexts",
+    "get_conflict_pair_readonly",
+    "fresh_data",
+    # Shared batch clock
+    "batch_clock",
+    # Seeded id source
+    "next_uuid",
+    # Shared seed
+    "FACTORY_SEED",
+    "seed_factories",
+    "seeded_faker",
 ]
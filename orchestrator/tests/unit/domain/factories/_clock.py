@@ -0,0 +1,26 @@
+"""
+FACTORY CLOCK
+One shared "now" for every timestamp generated inside a batch.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("batch_now", default=None)
+
+
+def clock_now() -> datetime:
+    """Current batch time, or the real time outside a batch"""
+    return _batch_now.get() or datetime.now(timezone.utc)
+
+
+@contextmanager
+def batch_clock() -> Iterator[datetime]:
+    """Freeze ``clock_now()`` for the duration of the block"""
+    token = _batch_now.set(datetime.now(timezone.utc))
+    try:
+        yield _batch_now.get()
+    finally:
+        _batch_now.reset(token)
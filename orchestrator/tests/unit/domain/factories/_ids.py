@@ -0,0 +1,19 @@
+"""
+FACTORY IDS
+Cheap version-4 UUIDs drawn from the seeded test RNG.
+"""
+
+import random
+from uuid import UUID
+
+_getrandbits = random.getrandbits
+
+
+def next_uuid() -> UUID:
+    """
+    Random UUID4 without an ``os.urandom`` read per call
+
+    Draws from the module RNG that the test session seeds, so ids are
+    reproducible run to run. Not for anything needing real entropy.
+    """
+    return UUID(int=_getrandbits(128), version=4)
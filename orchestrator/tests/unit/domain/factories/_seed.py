@@ -0,0 +1,30 @@
+"""
+FACTORY SEED
+One seed for every source of randomness the factories draw from.
+"""
+
+import random
+
+import factory.random
+from faker import Faker
+
+FACTORY_SEED = 0
+
+
+def seeded_faker() -> Faker:
+    """
+    Faker with its own RNG seeded from ``FACTORY_SEED``
+
+    For pools built at import time, before the test session seeds the
+    shared generators, so they come out the same in every process.
+    """
+    fake = Faker()
+    fake.seed_instance(FACTORY_SEED)
+    return fake
+
+
+def seed_factories() -> None:
+    """Seed ``random``, Faker's shared RNG and factory-boy from ``FACTORY_SEED``"""
+    random.seed(FACTORY_SEED)
+    Faker.seed(FACTORY_SEED)
+    factory.random.reseed_random(FACTORY_SEED)
@@ -3,15 +3,13 @@ INDUSTRIAL AGENT TEST FACTORY
 Generates realistic agent test data with performance and load variations.
 """
 
+import random
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any, List
 from uuid import uuid4
 
 import factory
 from factory import LazyFunction, LazyAttribute, SubFactory
-from faker import Faker
-
-fake = Faker()
 
 from src.industrial_orchestrator.domain.entities.agent import (
     AgentEntity,
@@ -23,6 +21,36 @@ from src.industrial_orchestrator.domain.entities.agent import (
     AgentLoadMetrics,
 )
 
+from ._seed import seeded_faker
+
+
+# Faker is slow per call, so names and descriptions are drawn from pools
+# built once at import. The pools use a privately seeded Faker, since the
+# session seeds the shared RNG only after import. Words the entity rejects
+# as generic (e.g. "Both" contains "bot") are filtered out.
+_GENERIC_NAME_PARTS = ('bot', 'helper', 'agent', 'coder', 'reviewer', 'debugger')
+_fake = seeded_faker()
+
+
+def _build_name_words(size: int = 256) -> tuple:
+    words = set()
+    while len(words) < size:
+        word = _fake.word().capitalize()
+        if not any(part in word.lower() for part in _GENERIC_NAME_PARTS):
+            words.add(word)
+    return tuple(sorted(words))
+
+
+_NAME_WORDS = _build_name_words()
+_DESCRIPTIONS = tuple(_fake.sentence(nb_words=10) for _ in range(256))
+
+# Per-type primary capabilities. Tuples are shared by every instance;
+# pydantic copies them into the entity's own list on validation.
+_IMPLEMENTER_CAPS = (AgentCapability.CODE_GENERATION, AgentCapability.TEST_GENERATION)
+_ARCHITECT_CAPS = (AgentCapability.SYSTEM_DESIGN, AgentCapability.ARCHITECTURE_PLANNING)
+_REVIEWER_CAPS = (AgentCapability.CODE_REVIEW, AgentCapability.SECURITY_AUDIT)
+_DEBUGGER_CAPS = (AgentCapability.DEBUGGING, AgentCapability.ROOT_CAUSE_ANALYSIS)
+
 
 class AgentPerformanceMetricsFactory(factory.Factory):
     """Factory for AgentPerformanceMetrics"""
@@ -30,28 +58,28 @@ class AgentPerformanceMetricsFactory(factory.Factory):
     class Meta:
         model = AgentPerformanceMetrics
 
-    total_tasks = factory.Faker('random_int', min=10, max=500)
+    total_tasks = LazyFunction(lambda: random.randint(10, 500))
     successful_tasks = LazyAttribute(lambda o: int(o.total_tasks * 0.85))
     failed_tasks = LazyAttribute(lambda o: int(o.total_tasks * 0.05))
     partially_successful_tasks = LazyAttribute(
         lambda o: o.total_tasks - o.successful_tasks - o.failed_tasks
     )
 
-    average_quality_score = factory.Faker('pyfloat', min_value=0.7, max_value=0.95)
-    code_coverage_impact = factory.Faker('pyfloat', min_value=0.5, max_value=0.9)
-    security_improvement_score = factory.Faker('pyfloat', min_value=0.6, max_value=0.9)
-    performance_improvement_score = factory.Faker('pyfloat', min_value=0.5, max_value=0.85)
+    average_quality_score = LazyFunction(lambda: random.uniform(0.7, 0.95))
+    code_coverage_impact = LazyFunction(lambda: random.uniform(0.5, 0.9))
+    security_improvement_score = LazyFunction(lambda: random.uniform(0.6, 0.9))
+    performance_improvement_score = LazyFunction(lambda: random.uniform(0.5, 0.85))
 
-    average_execution_time_seconds = factory.Faker('random_int', min=30, max=600)
-    tokens_per_task = factory.Faker('random_int', min=500, max=5000)
-    cost_per_task_usd = factory.Faker('pyfloat', min_value=0.01, max_value=0.5)
+    average_execution_time_seconds = LazyFunction(lambda: random.randint(30, 600))
+    tokens_per_task = LazyFunction(lambda: random.randint(500, 5000))
+    cost_per_task_usd = LazyFunction(lambda: random.uniform(0.01, 0.5))
 
     capability_success_rates = factory.Dict({})
     technology_success_rates = factory.Dict({})
 
-    success_rate_trend_30d = factory.Faker('pyfloat', min_value=-0.1, max_value=0.1)
-    quality_trend_30d = factory.Faker('pyfloat', min_value=-0.05, max_value=0.1)
-    efficiency_trend_30d = factory.Faker('pyfloat', min_value=-0.05, max_value=0.15)
+    success_rate_trend_30d = LazyFunction(lambda: random.uniform(-0.1, 0.1))
+    quality_trend_30d = LazyFunction(lambda: random.uniform(-0.05, 0.1))
+    efficiency_trend_30d = LazyFunction(lambda: random.uniform(-0.05, 0.15))
 
 
 class AgentLoadMetricsFactory(factory.Factory):
@@ -60,18 +88,45 @@ class AgentLoadMetricsFactory(factory.Factory):
     class Meta:
         model = AgentLoadMetrics
 
-    current_concurrent_tasks = factory.Faker('random_int', min=0, max=3)
+    current_concurrent_tasks = LazyFunction(lambda: random.randint(0, 3))
     max_concurrent_capacity = 5
-    queue_length = factory.Faker('random_int', min=0, max=5)
+    queue_length = LazyFunction(lambda: random.randint(0, 5))
 
-    cpu_utilization = factory.Faker('pyfloat', min_value=0.1, max_value=0.7)
-    memory_utilization = factory.Faker('pyfloat', min_value=0.2, max_value=0.6)
-    network_utilization = factory.Faker('pyfloat', min_value=0.05, max_value=0.3)
+    cpu_utilization = LazyFunction(lambda: random.uniform(0.1, 0.7))
+    memory_utilization = LazyFunction(lambda: random.uniform(0.2, 0.6))
+    network_utilization = LazyFunction(lambda: random.uniform(0.05, 0.3))
 
-    load_trend_1h = factory.Faker('pyfloat', min_value=-0.2, max_value=0.2)
+    load_trend_1h = LazyFunction(lambda: random.uniform(-0.2, 0.2))
     peak_load_today = LazyAttribute(lambda o: max(o.current_concurrent_tasks, 3))
 
 
+# Variant metrics are validated once at import; each build takes a deep
+# copy instead of running a SubFactory, so agents never share state
+_ELITE_PERFORMANCE = AgentPerformanceMetricsFactory.build(
+    total_tasks=500,
+    successful_tasks=490,
+    failed_tasks=5,
+    partially_successful_tasks=5,
+    average_quality_score=0.95,
+)
+_ELITE_LOAD = AgentLoadMetricsFactory.build(current_concurrent_tasks=2)
+_DEGRADED_PERFORMANCE = AgentPerformanceMetricsFactory.build(
+    total_tasks=100,
+    successful_tasks=30,
+    failed_tasks=50,
+    partially_successful_tasks=20,
+    average_quality_score=0.4,
+)
+_OVERLOADED_LOAD = AgentLoadMetricsFactory.build(
+    current_concurrent_tasks=6,
+    max_concurrent_capacity=5,
+)
+
+
+def _copy_of(prototype):
+    return LazyFunction(lambda: prototype.model_copy(deep=True))
+
+
 class AgentEntityFactory(factory.Factory):
     """Industrial-grade factory for AgentEntity"""
 
@@ -82,21 +137,18 @@ class AgentEntityFactory(factory.Factory):
     id = LazyFunction(uuid4)
     tenant_id = LazyFunction(uuid4)
     name = factory.LazyFunction(
-        lambda: f"Nexus-{fake.word().capitalize()}-{fake.pyint(min_value=100, max_value=999)}"
+        lambda: f"Nexus-{random.choice(_NAME_WORDS)}-{random.randint(100, 999)}"
     )
     agent_type = AgentType.IMPLEMENTER
-    description = factory.Faker('sentence', nb_words=10)
+    description = factory.LazyFunction(lambda: random.choice(_DESCRIPTIONS))
 
     # Capabilities (must match agent_type)
     primary_capabilities = LazyAttribute(
-        lambda o: [
-            AgentCapability.CODE_GENERATION,
-            AgentCapability.TEST_GENERATION,
-        ]
+        lambda o: _IMPLEMENTER_CAPS
         if o.agent_type == AgentType.IMPLEMENTER
-        else [AgentCapability.SYSTEM_DESIGN, AgentCapability.ARCHITECTURE_PLANNING]
+        else _ARCHITECT_CAPS
     )
-    secondary_capabilities = factory.List([])
+    secondary_capabilities = LazyFunction(list)
 
     # Configuration
     model_identifier = "anthropic/claude-sonnet-4.5"
@@ -114,8 +166,8 @@ class AgentEntityFactory(factory.Factory):
     load = SubFactory(AgentLoadMetricsFactory)
 
     # Specialization
-    preferred_technologies = factory.List(['python', 'typescript', 'rust'])
-    avoided_technologies = factory.List([])
+    preferred_technologies = ('python', 'typescript', 'rust')
+    avoided_technologies = LazyFunction(list)
     complexity_preference = 'medium'
 
     # Operational state
@@ -124,7 +176,7 @@ class AgentEntityFactory(factory.Factory):
     maintenance_mode = False
 
     # Routing preferences
-    preferred_session_types = factory.List([])
+    preferred_session_types = LazyFunction(list)
     max_task_duration_hours = 4.0
     min_quality_threshold = 0.7
 
@@ -139,69 +191,51 @@ class AgentEntityFactory(factory.Factory):
 
         # Elite performer
         elite = factory.Trait(
-            performance=SubFactory(
-                AgentPerformanceMetricsFactory,
-                total_tasks=500,
-                successful_tasks=490,
-                failed_tasks=5,
-                partially_successful_tasks=5,
-                average_quality_score=0.95,
-            ),
-            load=SubFactory(
-                AgentLoadMetricsFactory,
-                current_concurrent_tasks=2,
-            ),
+            performance=_copy_of(_ELITE_PERFORMANCE),
+            load=_copy_of(_ELITE_LOAD),
         )
 
         # Degraded agent
         degraded = factory.Trait(
-            performance=SubFactory(
-                AgentPerformanceMetricsFactory,
-                total_tasks=100,
-                successful_tasks=30,
-                failed_tasks=50,
-                partially_successful_tasks=20,
-                average_quality_score=0.4,
-            ),
+            performance=_copy_of(_DEGRADED_PERFORMANCE),
         )
 
         # Overloaded agent
         overloaded = factory.Trait(
-            load=SubFactory(
-                AgentLoadMetricsFactory,
-                current_concurrent_tasks=6,
-                max_concurrent_capacity=5,
-            ),
+            load=_copy_of(_OVERLOADED_LOAD),
         )
 
         # Architect type
         architect = factory.Trait(
             agent_type=AgentType.ARCHITECT,
-            primary_capabilities=[
-                AgentCapability.SYSTEM_DESIGN,
-                AgentCapability.ARCHITECTURE_PLANNING,
-            ],
+            primary_capabilities=_ARCHITECT_CAPS,
         )
 
         # Reviewer type
         reviewer = factory.Trait(
             agent_type=AgentType.REVIEWER,
-            primary_capabilities=[
-                AgentCapability.CODE_REVIEW,
-                AgentCapability.SECURITY_AUDIT,
-            ],
+            primary_capabilities=_REVIEWER_CAPS,
         )
 
         # Debugger type
         debugger = factory.Trait(
             agent_type=AgentType.DEBUGGER,
-            primary_capabilities=[
-                AgentCapability.DEBUGGING,
-                AgentCapability.ROOT_CAUSE_ANALYSIS,
-            ],
+            primary_capabilities=_DEBUGGER_CAPS,
         )
 
 
+_TRAIT_KWARGS = {
+    AgentType.ARCHITECT: {"architect": True},
+    AgentType.REVIEWER: {"reviewer": True},
+    AgentType.DEBUGGER: {"debugger": True},
+}
+
+
+def _build_agent(agent_type: AgentType) -> AgentEntity:
+    """Build one agent of the given type"""
+    return AgentEntityFactory(**_TRAIT_KWARGS.get(agent_type, {"agent_type": agent_type}))
+
+
 def create_agent_pool(
     count: int = 5,
     type_distribution: Optional[Dict[AgentType, float]] = None,
@@ -215,25 +249,8 @@ def create_agent_pool(
             AgentType.DEBUGGER: 0.2,
         }
 
-    agents = []
-    for _ in range(count):
-        rand = fake.pyfloat(min_value=0, max_value=1)
-        cumulative = 0
-        selected_type = AgentType.IMPLEMENTER
-
-        for agent_type, probability in type_distribution.items():
-            cumulative += probability
-            if rand <= cumulative:
-                selected_type = agent_type
-                break
-
-        if selected_type == AgentType.ARCHITECT:
-            agents.append(AgentEntityFactory(architect=True))
-        elif selected_type == AgentType.REVIEWER:
-            agents.append(AgentEntityFactory(reviewer=True))
-        elif selected_type == AgentType.DEBUGGER:
-            agents.append(AgentEntityFactory(debugger=True))
-        else:
-            agents.append(AgentEntityFactory(agent_type=selected_type))
-
-    return agents
+    types = list(type_distribution)
+    weights = [type_distribution[t] for t in types]
+    picks = random.choices(types, weights=weights, k=count)
+
+    return [_build_agent(agent_type) for agent_type in picks]
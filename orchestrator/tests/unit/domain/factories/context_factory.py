@@ -4,10 +4,13 @@ Generates realistic context test data with scopes and merge scenarios.
 """
 
 from datetime import datetime, timezone, timedelta
+from functools import cache
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 
 import factory
+import orjson
 from factory import LazyFunction, LazyAttribute
 
 from src.industrial_orchestrator.domain.entities.context import (
@@ -17,6 +20,18 @@ from src.industrial_orchestrator.domain.entities.context import (
 )
 
 
+# Shared read-only default for ContextEntity.data
+_DEFAULT_CTX_DATA = MappingProxyType({
+    "project": MappingProxyType({"name": "test-project", "version": "1.0.0"}),
+    "config": MappingProxyType({"debug": True, "timeout": 30}),
+})
+
+
+def fresh_data() -> Dict[str, Any]:
+    """Mutable copy of the default context data"""
+    return {key: dict(section) for key, section in _DEFAULT_CTX_DATA.items()}
+
+
 class ContextEntityFactory(factory.Factory):
     """Industrial-grade factory for ContextEntity"""
 
@@ -31,12 +46,7 @@ class ContextEntityFactory(factory.Factory):
     scope = ContextScope.SESSION
 
     # Data
-    data = LazyFunction(
-        lambda: {
-            "project": {"name": "test-project", "version": "1.0.0"},
-            "config": {"debug": True, "timeout": 30},
-        }
-    )
+    data = LazyFunction(fresh_data)
 
     # Version and timestamps
     version = 1
@@ -90,8 +100,27 @@ class ContextEntityFactory(factory.Factory):
         )
 
 
-def create_conflicting_contexts() -> tuple:
-    """Create two contexts with conflicting values for merge testing."""
+# Frozen JSON templates; decoding gives each call fresh nested dicts
+_CONFLICT_DATA_1 = orjson.dumps({
+    "shared": "value_from_ctx1",
+    "only_in_ctx1": "unique1",
+    "nested": {"key": "ctx1_nested"},
+})
+_CONFLICT_DATA_2 = orjson.dumps({
+    "shared": "value_from_ctx2",
+    "only_in_ctx2": "unique2",
+    "nested": {"key": "ctx2_nested", "extra": "new"},
+})
+
+
+@cache
+def get_conflict_pair_readonly() -> tuple:
+    """
+    The conflict scenario, built once per process.
+
+    Shared by every caller: only use it where neither context is mutated
+    (``merge``/``diff`` only read their operands).
+    """
     tenant_id = uuid4()
     session_id = uuid4()
     base_time = datetime.now(timezone.utc)
@@ -100,11 +129,7 @@ def create_conflicting_contexts() -> tuple:
         tenant_id=tenant_id,
         session_id=session_id,
         scope=ContextScope.SESSION,
-        data={
-            "shared": "value_from_ctx1",
-            "only_in_ctx1": "unique1",
-            "nested": {"key": "ctx1_nested"},
-        },
+        data=orjson.loads(_CONFLICT_DATA_1),
         created_at=base_time,
         updated_at=base_time,
     )
@@ -113,13 +138,18 @@ def create_conflicting_contexts() -> tuple:
         tenant_id=tenant_id,
         session_id=session_id,
         scope=ContextScope.SESSION,
-        data={
-            "shared": "value_from_ctx2",
-            "only_in_ctx2": "unique2",
-            "nested": {"key": "ctx2_nested", "extra": "new"},
-        },
+        data=orjson.loads(_CONFLICT_DATA_2),
         created_at=base_time + timedelta(seconds=10),
         updated_at=base_time + timedelta(seconds=10),
     )
 
     return ctx1, ctx2
+
+
+def create_conflicting_contexts() -> tuple:
+    """Create two contexts with conflicting values for merge testing."""
+    shared = {"tenant_id": uuid4(), "session_id": uuid4()}
+    return tuple(
+        ctx.model_copy(update={"id": uuid4(), **shared}, deep=True)
+        for ctx in get_conflict_pair_readonly()
+    )
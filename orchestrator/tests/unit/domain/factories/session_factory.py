@@ -3,8 +3,9 @@ INDUSTRIAL TEST FACTORY PATTERN
 Generates realistic, varied test data for comprehensive testing.
 """
 
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from uuid import UUID, uuid4
+from collections import Counter
 from typing import Optional, Dict, Any, List
 
 import factory
@@ -18,6 +19,35 @@ from src.industrial_orchestrator.domain.entities.session import (
 from src.industrial_orchestrator.domain.value_objects.session_status import SessionStatus
 from src.industrial_orchestrator.domain.value_objects.execution_metrics import ExecutionMetrics
 
+from ._clock import batch_clock, clock_now
+
+
+_AGENTS = {
+    'industrial-architect': {
+        'model': 'anthropic/claude-sonnet-4.5',
+        'temperature': 0.1,
+        'max_tokens': 4000
+    },
+    'precision-coder': {
+        'model': 'openai/gpt-4o',
+        'temperature': 0.3,
+        'max_tokens': 8000
+    },
+    'meticulous-reviewer': {
+        'model': 'anthropic/claude-sonnet-4.5',
+        'temperature': 0.05,
+        'max_tokens': 2000
+    }
+}
+_AGENT_ITEMS = tuple(_AGENTS.items())
+
+_WARNING_TYPES = ('performance', 'resource', 'quality')
+_WARNING_CHANCE = 0.3
+
+_SESSION_TYPES = tuple(SessionType)
+_SESSION_PRIORITIES = tuple(SessionPriority)
+_SESSION_STATUSES = tuple(SessionStatus)
+
 
 class IndustrialFaker(faker.Faker):
     """Extended Faker with industrial-specific data"""
@@ -26,35 +56,6 @@ class IndustrialFaker(faker.Faker):
         super().__init__(*args, **kwargs)
         self.add_provider(IndustrialProvider)
     
-    def industrial_title(self) -> str:
-        """Generate industrial-style session titles"""
-        prefixes = ['CYBERNETIC', 'INDUSTRIAL', 'AUTONOMOUS', 'ROBUST', 'RESILIENT']
-        components = ['ORCHESTRATION', 'EXECUTION', 'PIPELINE', 'WORKFLOW', 'AUTOMATION']
-        suffixes = ['SESSION', 'TASK', 'JOB', 'PROCESS', 'OPERATION']
-        
-        return f"{self.random_element(prefixes)} {self.random_element(components)} {self.random_element(suffixes)}"
-    
-    def agent_config(self) -> Dict[str, Any]:
-        """Generate realistic agent configurations"""
-        agents = {
-            'industrial-architect': {
-                'model': 'anthropic/claude-sonnet-4.5',
-                'temperature': 0.1,
-                'max_tokens': 4000
-            },
-            'precision-coder': {
-                'model': 'openai/gpt-4o',
-                'temperature': 0.3,
-                'max_tokens': 8000
-            },
-            'meticulous-reviewer': {
-                'model': 'anthropic/claude-sonnet-4.5',
-                'temperature': 0.05,
-                'max_tokens': 2000
-            }
-        }
-        return {self.random_element(list(agents.keys())): agents[self.random_element(list(agents.keys()))]}
-    
     def execution_metrics(self) -> Dict[str, Any]:
         """Generate realistic execution metrics"""
         return {
@@ -68,19 +69,39 @@ class IndustrialFaker(faker.Faker):
 class IndustrialProvider(faker.providers.BaseProvider):
     """Custom industrial data provider"""
     
+    def industrial_title(self) -> str:
+        """Generate industrial-style session titles"""
+        prefixes = ['CYBERNETIC', 'INDUSTRIAL', 'AUTONOMOUS', 'ROBUST', 'RESILIENT']
+        components = ['ORCHESTRATION', 'EXECUTION', 'PIPELINE', 'WORKFLOW', 'AUTOMATION']
+        suffixes = ['SESSION', 'TASK', 'JOB', 'PROCESS', 'OPERATION']
+        
+        return f"{self.random_element(prefixes)} {self.random_element(components)} {self.random_element(suffixes)}"
+    
+    def agent_config(self) -> Dict[str, Any]:
+        """Generate realistic agent configurations"""
+        name, config = self.generator.random.choice(_AGENT_ITEMS)
+        return {name: dict(config)}
+    
+    def industrial_word_list(self, n: int = 3) -> List[str]:
+        """Generate a list of plain words"""
+        return [self.generator.word() for _ in range(n)]
+    
     def session_type(self) -> SessionType:
-        return self.random_element(list(SessionType))
+        return self.generator.random.choice(_SESSION_TYPES)
     
     def session_priority(self) -> SessionPriority:
-        return self.random_element(list(SessionPriority))
+        return self.generator.random.choice(_SESSION_PRIORITIES)
     
     def session_status(self) -> SessionStatus:
-        return self.random_element(list(SessionStatus))
+        return self.generator.random.choice(_SESSION_STATUSES)
 
 
 # Register the industrial faker
 Faker.add_provider(IndustrialProvider)
 
+# Faker instances load every provider on construction; build it once
+_PLAIN_FAKER = faker.Faker()
+
 
 class ExecutionMetricsFactory(factory.Factory):
     """Factory for ExecutionMetrics value object"""
@@ -89,43 +110,69 @@ class ExecutionMetricsFactory(factory.Factory):
         model = ExecutionMetrics
     
     # Timestamps with realistic relationships
-    created_at = LazyFunction(lambda: datetime.now(timezone.utc) - timedelta(hours=1))
+    created_at = LazyFunction(lambda: clock_now() - timedelta(hours=1))
     started_at = LazyAttribute(lambda o: o.created_at + timedelta(seconds=30))
     completed_at = LazyAttribute(lambda o: o.started_at + timedelta(seconds=o.execution_duration_seconds))
     
     # Performance metrics
     queue_duration_seconds = LazyAttribute(lambda o: (o.started_at - o.created_at).total_seconds())
-    execution_duration_seconds = factory.Faker('random_int', min=60, max=1800)
+    execution_duration_seconds = LazyFunction(lambda: random.randint(60, 1800))
     total_duration_seconds = LazyAttribute(lambda o: o.queue_duration_seconds + o.execution_duration_seconds)
     
     # Resource usage
-    cpu_usage_percent = factory.Faker('random_int', min=10, max=80)
-    memory_usage_mb = factory.Faker('random_int', min=100, max=2048)
-    disk_usage_mb = factory.Faker('random_int', min=10, max=500)
+    cpu_usage_percent = LazyFunction(lambda: random.randint(10, 80))
+    memory_usage_mb = LazyFunction(lambda: random.randint(100, 2048))
+    disk_usage_mb = LazyFunction(lambda: random.randint(10, 500))
     
     # API metrics
-    api_calls_count = factory.Faker('random_int', min=1, max=20)
+    api_calls_count = LazyFunction(lambda: random.randint(1, 20))
     api_errors_count = factory.LazyAttribute(lambda o: o.api_calls_count // 10)  # 10% error rate
-    retry_count = factory.Faker('random_int', min=0, max=2)
+    retry_count = LazyFunction(lambda: random.randint(0, 2))
     
     # Quality metrics
-    success_rate = factory.Faker('pyfloat', left_digits=1, right_digits=2, positive=True, min_value=0.8, max_value=1.0)
-    confidence_score = factory.Faker('pyfloat', left_digits=1, right_digits=2, positive=True, min_value=0.7, max_value=0.95)
+    success_rate = LazyFunction(lambda: round(random.uniform(0.8, 1.0), 2))
+    confidence_score = LazyFunction(lambda: round(random.uniform(0.7, 0.95), 2))
     
     @factory.post_generation
     def add_warnings(self, create, extracted, **kwargs):
         """Add random warnings if needed"""
-        from faker import Faker
-        fake = Faker()
         if extracted is not None:
             self.warnings = extracted
-        elif fake.boolean(chance_of_getting_true=30):
-            num_warnings = fake.random_int(min=1, max=3)
+        elif random.random() < _WARNING_CHANCE:
+            timestamp = clock_now().isoformat()
             self.warnings = [{
-                'type': fake.random_element(elements=['performance', 'resource', 'quality']),
-                'message': fake.sentence(),
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            } for _ in range(num_warnings)]
+                'type': random.choice(_WARNING_TYPES),
+                'message': _PLAIN_FAKER.sentence(),
+                'timestamp': timestamp
+            } for _ in range(random.randint(1, 3))]
+
+
+# Trait payloads shared by every build; pydantic copies them on validation
+_TIMEOUT_ERROR = {
+    'type': 'TimeoutError',
+    'message': 'Execution timeout exceeded',
+    'context': {'timeout_seconds': 1800}
+}
+_LATENCY_WARNING = {
+    'type': 'performance',
+    'message': 'High API latency detected'
+}
+
+
+def _completed_at(o) -> datetime:
+    return o.started_at + timedelta(seconds=o.execution_duration_seconds)
+
+
+def _failed_at(o) -> datetime:
+    return o.started_at + timedelta(seconds=o.execution_duration_seconds / 2)
+
+
+def _running_started_at() -> datetime:
+    return clock_now() - timedelta(minutes=5)
+
+
+def _degraded_warnings() -> List[Dict[str, Any]]:
+    return [{**_LATENCY_WARNING, 'timestamp': clock_now().isoformat()}]
 
 
 class SessionEntityFactory(factory.Factory):
@@ -137,47 +184,54 @@ class SessionEntityFactory(factory.Factory):
     # Identity
     id = factory.LazyFunction(uuid4)
     tenant_id = factory.LazyFunction(uuid4)
-    title = factory.LazyFunction(lambda: IndustrialFaker().industrial_title())
+    title = factory.Faker('industrial_title')
     description = factory.Faker('paragraph', nb_sentences=3)
-    session_type = factory.Faker('session_type')
-    priority = factory.Faker('session_priority')
+    # Cycle through enum values so batches cover every type and priority
+    session_type = factory.Iterator(_SESSION_TYPES)
+    priority = factory.Iterator(_SESSION_PRIORITIES)
     
     # State
     status = SessionStatus.PENDING
-    status_updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    status_updated_at = factory.LazyFunction(clock_now)
     
     # Execution context
-    agent_config = factory.LazyFunction(lambda: IndustrialFaker().agent_config())
-    model_identifier = factory.LazyAttribute(lambda o: next(iter(o.agent_config.values()))['model'])
+    agent_config = factory.LazyAttribute(lambda o: {o.agent_pair[0]: dict(o.agent_pair[1])})
+    model_identifier = factory.LazyAttribute(lambda o: o.agent_pair[1]['model'])
     initial_prompt = factory.Faker('text', max_nb_chars=500)
     
     # Resource allocation
-    max_duration_seconds = factory.Faker('random_int', min=300, max=7200)
-    cpu_limit = factory.Faker('pyfloat', left_digits=1, right_digits=1, positive=True, min_value=0.5, max_value=4.0)
-    memory_limit_mb = factory.Faker('random_int', min=512, max=4096)
+    max_duration_seconds = LazyFunction(lambda: random.randint(300, 7200))
+    cpu_limit = LazyFunction(lambda: round(random.uniform(0.5, 4.0), 1))
+    memory_limit_mb = LazyFunction(lambda: random.randint(512, 4096))
     
     # Metrics
     metrics = SubFactory(ExecutionMetricsFactory)
     
+    # Supplied explicitly: model_construct resolving a bare ``list`` default
+    # factory goes through a slow signature inspection
+    child_ids = LazyFunction(list)
+    checkpoints = LazyFunction(SessionEntity.model_fields["checkpoints"].default_factory)
+    
     # Metadata
-    tags = factory.LazyFunction(lambda: [IndustrialFaker().word() for _ in range(3)])
-    metadata = factory.Dict({
+    tags = factory.Faker('industrial_word_list', n=3)
+    metadata = factory.LazyFunction(lambda: {
         'source': 'factory',
-        'test_id': factory.LazyFunction(lambda: str(uuid4())),
+        'test_id': str(uuid4()),
         'environment': 'testing'
     })
     
     class Params:
         """Factory variants for different test scenarios"""
         
+        # (name, settings) drawn once and shared by agent_config and model_identifier
+        agent_pair = factory.LazyFunction(lambda: random.choice(_AGENT_ITEMS))
+        
         # Completed session variant
         completed = factory.Trait(
             status=SessionStatus.COMPLETED,
             metrics=factory.SubFactory(
                 ExecutionMetricsFactory,
-                completed_at=factory.LazyAttribute(
-                    lambda o: o.started_at + timedelta(seconds=o.execution_duration_seconds)
-                ),
+                completed_at=factory.LazyAttribute(_completed_at),
                 success_rate=1.0,
                 confidence_score=0.95
             )
@@ -188,15 +242,9 @@ class SessionEntityFactory(factory.Factory):
             status=SessionStatus.FAILED,
             metrics=factory.SubFactory(
                 ExecutionMetricsFactory,
-                failed_at=factory.LazyAttribute(
-                    lambda o: o.started_at + timedelta(seconds=o.execution_duration_seconds / 2)
-                ),
+                failed_at=factory.LazyAttribute(_failed_at),
                 success_rate=0.0,
-                error={
-                    'type': 'TimeoutError',
-                    'message': 'Execution timeout exceeded',
-                    'context': {'timeout_seconds': 1800}
-                }
+                error=_TIMEOUT_ERROR
             )
         )
         
@@ -205,7 +253,7 @@ class SessionEntityFactory(factory.Factory):
             status=SessionStatus.RUNNING,
             metrics=factory.SubFactory(
                 ExecutionMetricsFactory,
-                started_at=factory.LazyFunction(lambda: datetime.now(timezone.utc) - timedelta(minutes=5)),
+                started_at=factory.LazyFunction(_running_started_at),
                 execution_duration_seconds=300
             )
         )
@@ -216,29 +264,52 @@ class SessionEntityFactory(factory.Factory):
             metrics=factory.SubFactory(
                 ExecutionMetricsFactory,
                 api_errors_count=5,
-                warnings=[
-                    {
-                        'type': 'performance',
-                        'message': 'High API latency detected',
-                        'timestamp': datetime.now(timezone.utc).isoformat()
-                    }
-                ]
+                warnings=factory.LazyFunction(_degraded_warnings)
             )
         )
     
+    @classmethod
+    def _build(cls, model_class, *args, **kwargs):
+        """
+        Skip validation only when every field came from the factory
+        
+        Declarations are valid by construction, so ``model_construct`` is
+        safe for them; caller overrides go through full validation so bad
+        values still raise and validators still normalize them.
+        """
+        if kwargs.pop('_validate', False):
+            return model_class(*args, **kwargs)
+        return model_class.model_construct(*args, **kwargs)
+    
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        return cls._build(model_class, *args, **kwargs)
+    
+    @classmethod
+    def _generate(cls, strategy, params):
+        """
+        Honour ``skip_postgen=True`` by pre-empting both random hooks, and
+        flag builds that override a model field for validation in ``_build``
+        """
+        if params.pop('skip_postgen', False):
+            params.setdefault('add_checkpoints', [])
+            params.setdefault('metrics__add_warnings', [])
+        if not params.keys().isdisjoint(SessionEntity.model_fields):
+            params['_validate'] = True
+        return super()._generate(strategy, params)
+    
     @factory.post_generation
     def add_checkpoints(self, create, extracted, **kwargs):
         """Add realistic checkpoints based on session state"""
-        from faker import Faker
-        fake = Faker()
         if extracted is not None:
             self.checkpoints = extracted
         elif self.status.is_active():
             # Add checkpoints for active sessions
-            checkpoint_count = fake.random_int(min=1, max=5)
+            now = clock_now()
+            checkpoint_count = random.randint(1, 5)
             self.checkpoints = [
                 {
-                    'timestamp': (datetime.now(timezone.utc) - timedelta(minutes=i)).isoformat(),
+                    'timestamp': (now - timedelta(minutes=i)).isoformat(),
                     'data': {
                         'progress': i / checkpoint_count,
                         'step': f'step_{i}',
@@ -263,50 +334,100 @@ def create_session_with_dependencies(
         parent_session.child_ids.append(session.id)
     
     if child_count > 0:
-        session.child_ids = [
-            SessionEntityFactory(parent_id=session.id).id
-            for _ in range(child_count)
-        ]
+        with batch_clock():
+            children = SessionEntityFactory.build_batch(child_count, parent_id=session.id)
+        session.child_ids.extend(child.id for child in children)
     
     return session
 
 
+_STATUS_TRAITS = {
+    SessionStatus.COMPLETED: {'completed': True},
+    SessionStatus.FAILED: {'failed': True},
+    SessionStatus.RUNNING: {'running': True},
+}
+
+
+def _build_session_group(status: SessionStatus, size: int) -> List[SessionEntity]:
+    """Build a run of sessions sharing one status"""
+    return SessionEntityFactory.build_batch(
+        size, **_STATUS_TRAITS.get(status, {'status': status})
+    )
+
+
+_DEFAULT_STATUS_DISTRIBUTION = {
+    SessionStatus.PENDING: 0.2,
+    SessionStatus.RUNNING: 0.3,
+    SessionStatus.COMPLETED: 0.4,
+    SessionStatus.FAILED: 0.1
+}
+
+
+def _sample_statuses(
+    count: int,
+    status_distribution: Optional[Dict[SessionStatus, float]] = None
+) -> List[SessionStatus]:
+    """Draw ``count`` statuses weighted by the distribution"""
+    if status_distribution is None:
+        status_distribution = _DEFAULT_STATUS_DISTRIBUTION
+    return random.choices(
+        list(status_distribution),
+        weights=list(status_distribution.values()),
+        k=count,
+    )
+
+
 def create_session_batch(
     count: int,
     status_distribution: Optional[Dict[SessionStatus, float]] = None
 ) -> List[SessionEntity]:
     """Create batch of sessions with specified status distribution"""
-    if status_distribution is None:
-        status_distribution = {
-            SessionStatus.PENDING: 0.2,
-            SessionStatus.RUNNING: 0.3,
-            SessionStatus.COMPLETED: 0.4,
-            SessionStatus.FAILED: 0.1
+    statuses = _sample_statuses(count, status_distribution)
+    
+    # One build_batch call per status, then hand sessions back in the sampled order
+    with batch_clock():
+        by_status = {
+            status: _build_session_group(status, total)
+            for status, total in Counter(statuses).items()
         }
+    pools = {status: iter(sessions) for status, sessions in by_status.items()}
+    return [next(pools[status]) for status in statuses]
+
+
+def create_session_batch_fast(
+    count: int,
+    status_distribution: Optional[Dict[SessionStatus, float]] = None
+) -> List[SessionEntity]:
+    """
+    Create a batch of plain sessions without going through factory-boy
     
-    sessions = []
-    for i in range(count):
-        # Determine status based on distribution
-        rand = random.random()  # Use standard random for status distribution
-        cumulative = 0
-        selected_status = SessionStatus.PENDING
-        
-        for status, probability in status_distribution.items():
-            cumulative += probability
-            if rand <= cumulative:
-                selected_status = status
-                break
-        
-        # Create session with selected status
-        if selected_status == SessionStatus.COMPLETED:
-            session = SessionEntityFactory(completed=True)
-        elif selected_status == SessionStatus.FAILED:
-            session = SessionEntityFactory(failed=True)
-        elif selected_status == SessionStatus.RUNNING:
-            session = SessionEntityFactory(running=True)
-        else:
-            session = SessionEntityFactory(status=selected_status)
-        
-        sessions.append(session)
+    For callers that only need the status mix and resource/metric numbers:
+    each numeric column is drawn in one pass up front and zipped into
+    SessionEntity constructors. No checkpoints, warnings, traits or Faker text.
+    """
+    statuses = _sample_statuses(count, status_distribution)
+    uniform, randint = random.uniform, random.randint
+    cpu_limits = [round(uniform(0.5, 4.0), 1) for _ in range(count)]
+    memory_limits = [randint(512, 4096) for _ in range(count)]
+    durations = [randint(60, 1800) for _ in range(count)]
+    success_rates = [round(uniform(0.8, 1.0), 2) for _ in range(count)]
     
-    return sessions
+    now = clock_now()
+    return [
+        SessionEntity(
+            tenant_id=uuid4(),
+            title=f"INDUSTRIAL BATCH SESSION {index:05d}",
+            initial_prompt="Execute batch workload",
+            status=status,
+            status_updated_at=now,
+            cpu_limit=cpu,
+            memory_limit_mb=memory,
+            metrics=ExecutionMetrics(
+                execution_duration_seconds=duration,
+                success_rate=success,
+            ),
+        )
+        for index, (status, cpu, memory, duration, success) in enumerate(
+            zip(statuses, cpu_limits, memory_limits, durations, success_rates)
+        )
+    ]
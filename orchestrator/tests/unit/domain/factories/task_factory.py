@@ -3,26 +3,35 @@ INDUSTRIAL TASK TEST FACTORY
 Generates realistic task test data with decomposition and dependencies.
 """
 
-from datetime import datetime, timezone, timedelta
+import random
+from datetime import timedelta
 from typing import Optional, Dict, Any, List
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import factory
 from factory import LazyFunction, LazyAttribute, SubFactory
-from faker import Faker
-
-fake = Faker()
 
 from src.industrial_orchestrator.domain.entities.task import (
     TaskEntity,
     TaskStatus,
     TaskPriority,
     TaskComplexityLevel,
+    TaskDependency,
     TaskDependencyType,
     TaskEstimate,
 )
 from src.industrial_orchestrator.domain.entities.agent import AgentCapability
 
+from ._clock import batch_clock, clock_now
+from ._ids import next_uuid
+from ._seed import seeded_faker
+
+
+# Component names drawn once at import (Faker is slow per call), from a
+# privately seeded Faker since the session seeds the shared RNG later
+_fake = seeded_faker()
+_TITLE_WORDS = tuple(sorted({_fake.word().capitalize() for _ in range(512)}))
+
 
 class TaskEstimateFactory(factory.Factory):
     """Factory for TaskEstimate"""
@@ -30,16 +39,16 @@ class TaskEstimateFactory(factory.Factory):
     class Meta:
         model = TaskEstimate
 
-    optimistic_hours = factory.Faker('pyfloat', min_value=0.5, max_value=2.0)
-    likely_hours = factory.Faker('pyfloat', min_value=2.0, max_value=6.0)
-    pessimistic_hours = factory.Faker('pyfloat', min_value=6.0, max_value=12.0)
+    optimistic_hours = LazyFunction(lambda: random.uniform(0.5, 2.0))
+    likely_hours = LazyFunction(lambda: random.uniform(2.0, 6.0))
+    pessimistic_hours = LazyFunction(lambda: random.uniform(6.0, 12.0))
 
-    estimated_tokens = factory.Faker('random_int', min=1000, max=10000)
-    estimated_cost_usd = factory.Faker('pyfloat', min_value=0.05, max_value=1.0)
+    estimated_tokens = LazyFunction(lambda: random.randint(1000, 10000))
+    estimated_cost_usd = LazyFunction(lambda: random.uniform(0.05, 1.0))
     required_capabilities = [AgentCapability.CODE_GENERATION]
 
-    estimate_confidence = factory.Faker('pyfloat', min_value=0.5, max_value=0.9)
-    last_estimated_at = LazyFunction(lambda: datetime.now(timezone.utc))
+    estimate_confidence = LazyFunction(lambda: random.uniform(0.5, 0.9))
+    last_estimated_at = LazyFunction(clock_now)
     estimation_source = "manual"
 
 
@@ -50,21 +59,21 @@ class TaskEntityFactory(factory.Factory):
         model = TaskEntity
 
     # Identity
-    id = LazyFunction(uuid4)
-    tenant_id = LazyFunction(uuid4)
-    session_id = LazyFunction(uuid4)
+    id = LazyFunction(next_uuid)
+    tenant_id = LazyFunction(next_uuid)
+    session_id = LazyFunction(next_uuid)
     parent_task_id = None
 
     # Task identity - must start with action verb
     title = factory.LazyFunction(
-        lambda: f"Implement {fake.word().capitalize()} component"
+        lambda: f"Implement {random.choice(_TITLE_WORDS)} component"
     )
     description = factory.Faker('sentence', nb_words=15)
     task_type = "implementation"
 
     # Execution state
     status = TaskStatus.PENDING
-    status_updated_at = LazyFunction(lambda: datetime.now(timezone.utc))
+    status_updated_at = LazyAttribute(lambda o: o.now)
     assigned_agent_id = None
     assigned_at = None
 
@@ -73,8 +82,8 @@ class TaskEntityFactory(factory.Factory):
     estimate = SubFactory(TaskEstimateFactory)
 
     # Dependencies
-    dependencies = factory.List([])
-    dependents = factory.List([])
+    dependencies = LazyFunction(list)
+    dependents = LazyFunction(list)
 
     # Timestamps
     started_at = None
@@ -84,20 +93,24 @@ class TaskEntityFactory(factory.Factory):
     # Results
     result = None
     error = None
-    artifacts = factory.List([])
+    artifacts = LazyFunction(list)
 
     # Metadata
-    tags = factory.List(['test', 'factory'])
+    # Tuple defaults are shared; pydantic copies them into a fresh list
+    tags = ('test', 'factory')
     metadata = factory.Dict({})
-    created_at = LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = LazyFunction(lambda: datetime.now(timezone.utc))
+    created_at = LazyAttribute(lambda o: o.now)
+    updated_at = LazyAttribute(lambda o: o.now)
 
     # Children
-    child_tasks = factory.List([])
+    child_tasks = LazyFunction(list)
 
     class Params:
         """Factory variants"""
 
+        # Read the clock once; every timestamp is an offset from it
+        now = LazyFunction(clock_now)
+
         # Ready to start
         ready = factory.Trait(
             status=TaskStatus.READY,
@@ -106,33 +119,33 @@ class TaskEntityFactory(factory.Factory):
         # Assigned to agent
         assigned = factory.Trait(
             status=TaskStatus.ASSIGNED,
-            assigned_agent_id=LazyFunction(uuid4),
-            assigned_at=LazyFunction(lambda: datetime.now(timezone.utc)),
+            assigned_agent_id=LazyFunction(next_uuid),
+            assigned_at=LazyAttribute(lambda o: o.now),
         )
 
         # In progress
         in_progress = factory.Trait(
             status=TaskStatus.IN_PROGRESS,
-            assigned_agent_id=LazyFunction(uuid4),
-            assigned_at=LazyFunction(lambda: datetime.now(timezone.utc) - timedelta(hours=1)),
-            started_at=LazyFunction(lambda: datetime.now(timezone.utc) - timedelta(minutes=30)),
+            assigned_agent_id=LazyFunction(next_uuid),
+            assigned_at=LazyAttribute(lambda o: o.now - timedelta(hours=1)),
+            started_at=LazyAttribute(lambda o: o.now - timedelta(minutes=30)),
         )
 
         # Completed
         completed = factory.Trait(
             status=TaskStatus.COMPLETED,
-            assigned_agent_id=LazyFunction(uuid4),
-            started_at=LazyFunction(lambda: datetime.now(timezone.utc) - timedelta(hours=2)),
-            completed_at=LazyFunction(lambda: datetime.now(timezone.utc)),
+            assigned_agent_id=LazyFunction(next_uuid),
+            started_at=LazyAttribute(lambda o: o.now - timedelta(hours=2)),
+            completed_at=LazyAttribute(lambda o: o.now),
             result={'files_created': ['component.py'], 'tests_passed': 5},
         )
 
         # Failed
         failed = factory.Trait(
             status=TaskStatus.FAILED,
-            assigned_agent_id=LazyFunction(uuid4),
-            started_at=LazyFunction(lambda: datetime.now(timezone.utc) - timedelta(hours=1)),
-            failed_at=LazyFunction(lambda: datetime.now(timezone.utc)),
+            assigned_agent_id=LazyFunction(next_uuid),
+            started_at=LazyAttribute(lambda o: o.now - timedelta(hours=1)),
+            failed_at=LazyAttribute(lambda o: o.now),
             error={'type': 'RuntimeError', 'message': 'Execution failed'},
         )
 
@@ -156,42 +169,70 @@ class TaskEntityFactory(factory.Factory):
             ),
         )
 
+    @classmethod
+    def _generate(cls, strategy, params):
+        """Pass every unused trait flag as False"""
+        # An unset flag resolves through factory-boy's AttributeError fallback,
+        # whose message formats every value resolved so far; on a task that
+        # repr dominated the build
+        for name in _TRAIT_NAMES:
+            params.setdefault(name, False)
+        return super()._generate(strategy, params)
+
+
+_TRAIT_NAMES = tuple(
+    name for name, declaration in TaskEntityFactory._meta.parameters.items()
+    if isinstance(declaration, factory.Trait)
+)
+
 
 def create_task_with_subtasks(
     depth: int = 2,
     children_per_level: int = 2,
 ) -> TaskEntity:
     """Create task with subtask hierarchy"""
-    root = TaskEntityFactory(complex_task=True)
-
-    if depth > 0:
-        for i in range(children_per_level):
-            child = create_task_with_subtasks(depth - 1, children_per_level)
-            child.parent_task_id = root.id
-            root.child_tasks.append(child)
+    with batch_clock():
+        root = TaskEntityFactory(complex_task=True)
+
+        # Build one level at a time; child j of parent p sits at p * n + j
+        level = [root]
+        for _ in range(depth):
+            children = TaskEntityFactory.build_batch(
+                len(level) * children_per_level, complex_task=True
+            )
+            for index, child in enumerate(children):
+                parent = level[index // children_per_level]
+                child.parent_task_id = parent.id
+                parent.child_tasks.append(child)
+            level = children
 
     return root
 
 
 def create_task_chain(length: int = 3) -> List[TaskEntity]:
     """Create chain of dependent tasks"""
-    tasks = []
-    session_id = uuid4()
+    session_id = next_uuid()
 
-    for i in range(length):
-        task = TaskEntityFactory(
+    with batch_clock():
+        tasks = TaskEntityFactory.build_batch(
+            length,
             session_id=session_id,
-            title=f"Implement step {i + 1} of pipeline",
+            title=factory.Iterator(
+                [f"Implement step {i + 1} of pipeline" for i in range(length)],
+                cycle=False,
+            ),
         )
 
-        # Add dependency on previous task
-        if tasks:
-            task.add_dependency(
-                tasks[-1].id,
+    # Wire each step to its predecessor directly; the ids are fresh and
+    # distinct, so add_dependency's self/duplicate checks cannot fire
+    for i in range(1, length):
+        tasks[i].dependencies.append(
+            TaskDependency.model_construct(
+                source_task_id=tasks[i].id,
+                target_task_id=tasks[i - 1].id,
                 dependency_type=TaskDependencyType.FINISH_TO_START,
                 description=f"Depends on step {i}",
             )
-
-        tasks.append(task)
+        )
 
     return tasks
@@ -3,6 +3,9 @@ INDUSTRIAL-GRADE AGENT ENTITY TESTS
 Comprehensive TDD-style tests for agent capabilities, performance, and load.
 """
 
+import random
+import re
+
 import pytest
 from datetime import datetime, timezone, timedelta
 from uuid import uuid4
@@ -28,6 +31,23 @@ from tests.unit.domain.factories.agent_factory import (
     create_agent_pool,
 )
 
+pytestmark = pytest.mark.parallel_safe
+
+FIXED_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Property-style checks draw from a fixed seed so failures reproduce
+PROPERTY_SEED = 20250101
+PROPERTY_EXAMPLES = 200
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the agent module clock to FIXED_NOW."""
+    monkeypatch.setattr(
+        "src.industrial_orchestrator.domain.entities.agent._now", lambda: FIXED_NOW
+    )
+    return FIXED_NOW
+
 
 class TestAgentEntityCreation:
     """Test agent entity creation and validation"""
@@ -60,27 +80,25 @@ class TestAgentEntityCreation:
         assert AgentCapability.CODE_REVIEW in agent.primary_capabilities
         assert AgentCapability.SECURITY_AUDIT in agent.primary_capabilities
 
-    @pytest.mark.parametrize("invalid_name", [
-        "",
-        "   ",
-        "ai assistant test",
-        "simple bot",
-        "helper",
-    ])
-    def test_invalid_agent_names_rejected(self, invalid_name):
+    INVALID_NAMES = ("", "   ", "ai assistant test", "simple bot", "helper")
+    CAP_MATCH = re.compile(r"at least one primary capability")
+    TYPE_MATCH = re.compile(r"not allowed for agent type")
+
+    def test_invalid_agent_names_rejected(self, subtests):
         """Test that generic/invalid names are rejected"""
-        with pytest.raises(ValueError):
-            AgentEntity(
-                name=invalid_name,
-                agent_type=AgentType.IMPLEMENTER,
-                primary_capabilities=[AgentCapability.CODE_GENERATION],
-                model_config="anthropic/claude-sonnet-4.5",
-                system_prompt_template="A" * 100,
-            )
+        for invalid_name in self.INVALID_NAMES:
+            with subtests.test(name=invalid_name), pytest.raises(ValueError):
+                AgentEntity(
+                    name=invalid_name,
+                    agent_type=AgentType.IMPLEMENTER,
+                    primary_capabilities=[AgentCapability.CODE_GENERATION],
+                    model_config="anthropic/claude-sonnet-4.5",
+                    system_prompt_template="A" * 100,
+                )
 
     def test_agent_must_have_capabilities(self):
         """Test that agents must have at least one capability"""
-        with pytest.raises(ValueError, match="at least one primary capability"):
+        with pytest.raises(ValueError, match=self.CAP_MATCH):
             AgentEntity(
                 name="Valid-Industrial-Agent",
                 agent_type=AgentType.IMPLEMENTER,
@@ -92,7 +110,7 @@ class TestAgentEntityCreation:
     def test_capability_type_alignment(self):
         """Test that capabilities must align with agent type"""
         # Architect cannot have IMPLEMENTER capabilities as primary
-        with pytest.raises(ValueError, match="not allowed for agent type"):
+        with pytest.raises(ValueError, match=self.TYPE_MATCH):
             AgentEntity(
                 name="Invalid-Architect-Agent",
                 agent_type=AgentType.ARCHITECT,
@@ -135,26 +153,48 @@ class TestAgentPerformanceMetrics:
         assert metrics.overall_success_rate == 0.0
         assert metrics.complete_success_rate == 0.0
 
-    @pytest.mark.parametrize("success_rate,quality,expected_tier", [
+    TIER_CASES = (
         (0.96, 0.92, AgentPerformanceTier.ELITE),
         (0.90, 0.80, AgentPerformanceTier.ADVANCED),
         (0.75, 0.70, AgentPerformanceTier.COMPETENT),
         (0.60, 0.60, AgentPerformanceTier.TRAINEE),
         (0.40, 0.40, AgentPerformanceTier.DEGRADED),
-    ])
-    def test_performance_tier_calculation(self, success_rate, quality, expected_tier):
+    )
+
+    def test_performance_tier_calculation(self, subtests):
         """Test performance tier based on metrics"""
         total = 100
-        successful = int(total * success_rate)
-
-        metrics = AgentPerformanceMetrics(
-            total_tasks=total,
-            successful_tasks=successful,
-            failed_tasks=total - successful,
-            average_quality_score=quality,
-        )
+        for success_rate, quality, expected_tier in self.TIER_CASES:
+            with subtests.test(tier=expected_tier.value):
+                successful = int(total * success_rate)
+                metrics = AgentPerformanceMetrics(
+                    total_tasks=total,
+                    successful_tasks=successful,
+                    failed_tasks=total - successful,
+                    average_quality_score=quality,
+                )
+
+                assert metrics.calculate_performance_tier() == expected_tier
+
+    def test_success_rates_are_consistent(self):
+        """Test success rates stay bounded and ordered over sampled counts"""
+        rng = random.Random(PROPERTY_SEED)
+        for _ in range(PROPERTY_EXAMPLES):
+            successful, failed, partial = (rng.randint(0, 500) for _ in range(3))
+            total = successful + failed + partial
+            metrics = AgentPerformanceMetrics(
+                total_tasks=total,
+                successful_tasks=successful,
+                failed_tasks=failed,
+                partially_successful_tasks=partial,
+            )
 
-        assert metrics.calculate_performance_tier() == expected_tier
+            case = (successful, failed, partial)
+            assert 0.0 <= metrics.complete_success_rate <= metrics.overall_success_rate <= 1.0, case
+            if total:
+                assert metrics.overall_success_rate == pytest.approx(
+                    (successful + partial * 0.5) / total
+                ), case
 
     def test_record_task_result_success(self):
         """Test recording successful task result"""
@@ -206,7 +246,7 @@ class TestAgentLoadMetrics:
 
         assert load.utilization_percentage == 0.6
 
-    @pytest.mark.parametrize("tasks,capacity,expected_level", [
+    LOAD_CASES = (
         (0, 5, AgentLoadLevel.IDLE),
         (1, 5, AgentLoadLevel.IDLE),
         (2, 5, AgentLoadLevel.OPTIMAL),
@@ -214,15 +254,43 @@ class TestAgentLoadMetrics:
         (4, 5, AgentLoadLevel.HIGH),
         (5, 5, AgentLoadLevel.CRITICAL),
         (6, 5, AgentLoadLevel.OVERLOADED),
-    ])
-    def test_load_level_classification(self, tasks, capacity, expected_level):
+    )
+
+    def test_load_level_classification(self, subtests):
         """Test load level classification"""
-        load = AgentLoadMetrics(
-            current_concurrent_tasks=tasks,
-            max_concurrent_capacity=capacity,
+        for tasks, capacity, expected_level in self.LOAD_CASES:
+            with subtests.test(tasks=tasks, capacity=capacity):
+                load = AgentLoadMetrics(
+                    current_concurrent_tasks=tasks,
+                    max_concurrent_capacity=capacity,
+                )
+
+                assert load.load_level == expected_level
+
+    def test_load_level_properties(self):
+        """Test load level rises monotonically and flags only over-capacity"""
+        levels = (
+            AgentLoadLevel.IDLE,
+            AgentLoadLevel.OPTIMAL,
+            AgentLoadLevel.HIGH,
+            AgentLoadLevel.CRITICAL,
+            AgentLoadLevel.OVERLOADED,
         )
-
-        assert load.load_level == expected_level
+        rng = random.Random(PROPERTY_SEED)
+        for _ in range(PROPERTY_EXAMPLES // 4):
+            capacity = rng.randint(1, 100)
+            previous = 0
+            for tasks in range(2 * capacity + 1):
+                load = AgentLoadMetrics(
+                    current_concurrent_tasks=tasks,
+                    max_concurrent_capacity=capacity,
+                )
+                rank = levels.index(load.load_level)
+
+                assert load.utilization_percentage == tasks / capacity
+                assert rank >= previous, (tasks, capacity)
+                assert (load.load_level == AgentLoadLevel.OVERLOADED) == (tasks > capacity)
+                previous = rank
 
     def test_can_accept_task_normal(self):
         """Test normal task acceptance"""
@@ -270,9 +338,8 @@ class TestAgentLoadMetrics:
 class TestAgentCapabilities:
     """Test capability handling"""
 
-    def test_all_capabilities(self):
+    def test_all_capabilities(self, agent):
         """Test combined primary and secondary capabilities"""
-        agent = AgentEntityFactory()
         agent.secondary_capabilities = [AgentCapability.DOCUMENTATION]
 
         all_caps = agent.all_capabilities
@@ -280,26 +347,24 @@ class TestAgentCapabilities:
         assert AgentCapability.CODE_GENERATION in all_caps
         assert AgentCapability.DOCUMENTATION in all_caps
 
-    def test_has_capability_primary(self):
+    def test_has_capability_primary(self, agent):
         """Test checking primary capability"""
-        agent = AgentEntityFactory()
-
         assert agent.has_capability(AgentCapability.CODE_GENERATION) is True
 
-    def test_has_capability_missing(self):
-        """Test checking missing capability"""
-        agent = AgentEntityFactory()
+    def test_all_capabilities_is_frozen(self, agent):
+        """Test combined capabilities are returned as a read-only set"""
+        assert isinstance(agent.all_capabilities, frozenset)
 
+    def test_has_capability_missing(self, agent):
+        """Test checking missing capability"""
         assert agent.has_capability(AgentCapability.DEPLOYMENT) is False
 
 
 class TestAgentTaskHandling:
     """Test task handling and suitability scoring"""
 
-    def test_can_handle_task_success(self):
+    def test_can_handle_task_success(self, agent):
         """Test agent can handle matching task"""
-        agent = AgentEntityFactory()
-
         result = agent.can_handle_task(
             required_capabilities=[AgentCapability.CODE_GENERATION],
             estimated_complexity=1.0,
@@ -307,19 +372,16 @@ class TestAgentTaskHandling:
 
         assert result is True
 
-    def test_cannot_handle_missing_capability(self):
+    def test_cannot_handle_missing_capability(self, agent):
         """Test rejection for missing capability"""
-        agent = AgentEntityFactory()
-
         result = agent.can_handle_task(
             required_capabilities=[AgentCapability.DEPLOYMENT],  # Not an IMPLEMENTER cap
         )
 
         assert result is False
 
-    def test_cannot_handle_when_inactive(self):
+    def test_cannot_handle_when_inactive(self, agent):
         """Test rejection when agent inactive"""
-        agent = AgentEntityFactory()
         agent.is_active = False
 
         result = agent.can_handle_task(
@@ -328,9 +390,8 @@ class TestAgentTaskHandling:
 
         assert result is False
 
-    def test_cannot_handle_when_maintenance(self):
+    def test_cannot_handle_when_maintenance(self, agent):
         """Test rejection during maintenance"""
-        agent = AgentEntityFactory()
         agent.maintenance_mode = True
 
         result = agent.can_handle_task(
@@ -339,20 +400,18 @@ class TestAgentTaskHandling:
 
         assert result is False
 
-    def test_cannot_handle_when_degraded(self):
+    @pytest.mark.parametrize("agent", ["degraded"], indirect=True)
+    def test_cannot_handle_when_degraded(self, agent):
         """Test rejection when degraded"""
-        agent = AgentEntityFactory(degraded=True)
-
         result = agent.can_handle_task(
             required_capabilities=[AgentCapability.CODE_GENERATION],
         )
 
         assert result is False
 
-    def test_suitability_score_calculation(self):
+    @pytest.mark.parametrize("agent", ["elite"], indirect=True)
+    def test_suitability_score_calculation(self, agent):
         """Test suitability score is calculated"""
-        agent = AgentEntityFactory(elite=True)
-
         score = agent.calculate_task_suitability_score(
             required_capabilities=[AgentCapability.CODE_GENERATION],
             estimated_complexity=1.0,
@@ -361,9 +420,8 @@ class TestAgentTaskHandling:
 
         assert 0.0 < score <= 1.1  # Can exceed 1.0 due to tier multipliers
 
-    def test_suitability_zero_when_cannot_handle(self):
+    def test_suitability_zero_when_cannot_handle(self, agent):
         """Test zero score when cannot handle"""
-        agent = AgentEntityFactory()
         agent.is_active = False
 
         score = agent.calculate_task_suitability_score(
@@ -376,9 +434,8 @@ class TestAgentTaskHandling:
 class TestAgentTaskAcceptance:
     """Test accept_task and complete_task methods"""
 
-    def test_accept_task_success(self):
+    def test_accept_task_success(self, agent):
         """Test successful task acceptance"""
-        agent = AgentEntityFactory()
         initial_load = agent.load.current_concurrent_tasks
 
         agent.accept_task(estimated_complexity=1.0)
@@ -386,25 +443,21 @@ class TestAgentTaskAcceptance:
         assert agent.load.current_concurrent_tasks == initial_load + 1.0
         assert agent.last_active_at is not None
 
-    def test_accept_task_raises_on_overload(self):
+    @pytest.mark.parametrize("agent", ["overloaded"], indirect=True)
+    def test_accept_task_raises_on_overload(self, agent):
         """Test exception when overloaded"""
-        agent = AgentEntityFactory(overloaded=True)
-
         with pytest.raises(AgentOverloadedError):
             agent.accept_task(estimated_complexity=1.0)
 
-    def test_accept_task_raises_on_missing_capability(self):
+    def test_accept_task_raises_on_missing_capability(self, agent):
         """Test exception when missing capability"""
-        agent = AgentEntityFactory()
-
         with pytest.raises(AgentCapabilityMismatchError):
             agent.accept_task(
                 required_capabilities=[AgentCapability.DEPLOYMENT],
             )
 
-    def test_complete_task_updates_metrics(self):
+    def test_complete_task_updates_metrics(self, agent):
         """Test completing task updates all metrics"""
-        agent = AgentEntityFactory()
         agent.accept_task(estimated_complexity=1.0)
         initial_tasks = agent.performance.total_tasks
 
@@ -422,41 +475,45 @@ class TestAgentTaskAcceptance:
 class TestAgentHealthStatus:
     """Test health status reporting"""
 
-    def test_healthy_agent(self):
+    @pytest.mark.parametrize("agent", ["elite"], indirect=True)
+    def test_healthy_agent(self, agent):
         """Test healthy agent has no issues"""
-        agent = AgentEntityFactory(elite=True)
-
         health = agent.get_health_status()
 
         assert health['is_healthy'] is True
         assert len(health['issues']) == 0
 
-    def test_degraded_performance_issue(self):
+    @pytest.mark.parametrize("agent", ["degraded"], indirect=True)
+    def test_degraded_performance_issue(self, agent):
         """Test degraded performance flagged"""
-        agent = AgentEntityFactory(degraded=True)
-
         health = agent.get_health_status()
 
         assert health['is_healthy'] is False
         assert any(i['type'] == 'performance_degradation' for i in health['issues'])
 
-    def test_overloaded_issue(self):
+    @pytest.mark.parametrize("agent", ["overloaded"], indirect=True)
+    def test_overloaded_issue(self, agent):
         """Test overload flagged"""
-        agent = AgentEntityFactory(overloaded=True)
-
         health = agent.get_health_status()
 
         assert health['is_healthy'] is False
         assert any(i['type'] == 'overloaded' for i in health['issues'])
 
-    def test_inactive_warning(self):
+    def test_inactive_warning(self, agent, frozen_now):
         """Test inactivity warning"""
-        agent = AgentEntityFactory()
-        agent.last_active_at = datetime.now(timezone.utc) - timedelta(hours=48)
+        agent.last_active_at = frozen_now - timedelta(hours=48)
 
         health = agent.get_health_status()
 
         assert any(i['type'] == 'inactive' for i in health['issues'])
+        assert health['last_active_hours'] == 48.0
+        assert health['timestamp'] == frozen_now.isoformat()
+
+
+@pytest.fixture(scope="module")
+def agent_pool_10():
+    """Ten-agent pool built once per module; tests only read it."""
+    return create_agent_pool(10)
 
 
 class TestAgentFactory:
@@ -481,9 +538,10 @@ class TestAgentFactory:
         overloaded = AgentEntityFactory(overloaded=True)
         assert overloaded.load_level == AgentLoadLevel.OVERLOADED
 
-    def test_create_agent_pool(self):
+    @pytest.mark.slow
+    def test_create_agent_pool(self, agent_pool_10):
         """Test agent pool creation"""
-        agents = create_agent_pool(10)
+        agents = agent_pool_10
 
         assert len(agents) == 10
         assert all(isinstance(a, AgentEntity) for a in agents)
@@ -3,6 +3,8 @@ INDUSTRIAL-GRADE CONTEXT ENTITY TESTS
 Comprehensive TDD-style tests for context merge, diff, and conflict handling.
 """
 
+import sys
+
 import pytest
 from datetime import datetime
 from uuid import uuid4
@@ -13,41 +15,62 @@ from src.industrial_orchestrator.domain.entities.context import (
     MergeStrategy,
     ContextDiff,
     ContextChange,
+    MAX_CHANGE_HISTORY,
 )
 
 from tests.unit.domain.factories.context_factory import (
     ContextEntityFactory,
     create_conflicting_contexts,
+    get_conflict_pair_readonly,
 )
 
+pytestmark = pytest.mark.parallel_safe
 
-class TestContextEntityCreation:
-    """Test context entity creation"""
+# Diff tests never inspect session ids; one is enough for the module
+_SHARED_SESSION = uuid4()
 
-    def test_create_minimal_context(self):
-        """Test creating context with minimal fields"""
-        ctx = ContextEntityFactory()
 
-        assert ctx.id is not None
-        assert ctx.session_id is not None
-        assert ctx.scope == ContextScope.SESSION
-        assert ctx.version == 1
-        assert ctx.data is not None
+@pytest.fixture(scope="module")
+def nested_ctx():
+    """Nested-data context shared by the module; clone() it before mutating."""
+    return ContextEntityFactory(nested=True)
 
-    def test_create_global_context(self):
-        """Test creating global scope context"""
-        ctx = ContextEntityFactory(global_scope=True)
 
-        assert ctx.scope == ContextScope.GLOBAL
-        assert ctx.session_id is None
-        assert ctx.agent_id is None
+@pytest.fixture(scope="class")
+def shared_tenant_id():
+    """One tenant id shared by every context built in a test class."""
+    return uuid4()
+
+
+@pytest.fixture(scope="class")
+def conflict_pair():
+    """Read-only conflicting pair; merge() never mutates its operands."""
+    return get_conflict_pair_readonly()
+
+
+class TestContextEntityCreation:
+    """Test context entity creation"""
 
-    def test_create_agent_context(self):
-        """Test creating agent scope context"""
-        ctx = ContextEntityFactory(agent_scope=True)
+    # (variant, factory kwargs, expected scope, {id field: expected to be set})
+    CREATION_CASES = (
+        ("minimal", {}, ContextScope.SESSION, {"session_id": True}),
+        ("global", {"global_scope": True}, ContextScope.GLOBAL,
+         {"session_id": False, "agent_id": False}),
+        ("agent", {"agent_scope": True}, ContextScope.AGENT, {"agent_id": True}),
+    )
 
-        assert ctx.scope == ContextScope.AGENT
-        assert ctx.agent_id is not None
+    def test_create_context_variants(self, subtests):
+        """Test factory variants set scope and owning ids"""
+        for variant, kwargs, expected_scope, ids_set in self.CREATION_CASES:
+            with subtests.test(variant=variant):
+                ctx = ContextEntityFactory(**kwargs)
+
+                assert ctx.id is not None
+                assert ctx.scope == expected_scope
+                assert ctx.version == 1
+                assert ctx.data is not None
+                for field, is_set in ids_set.items():
+                    assert (getattr(ctx, field) is not None) is is_set, field
 
 
 class TestContextGetSet:
@@ -60,12 +83,19 @@ class TestContextGetSet:
 
         assert ctx.get("key") == "value"
 
-    def test_get_nested_key(self):
+    def test_get_nested_key(self, nested_ctx):
         """Test getting nested key with dot notation"""
-        ctx = ContextEntityFactory(nested=True)
+        ctx = nested_ctx
 
         assert ctx.get("level1.level2.level3.deep_value") == "found"
 
+    def test_get_path_matches_dotted_get(self, nested_ctx):
+        """Test get_path walks pre-split parts like get walks dotted keys"""
+        ctx = nested_ctx
+
+        assert ctx.get_path(("level1", "level2", "level3", "deep_value")) == "found"
+        assert ctx.get_path(("level1", "missing"), default="fallback") == "fallback"
+
     def test_get_missing_key_returns_default(self):
         """Test missing key returns default"""
         ctx = ContextEntityFactory()
@@ -126,9 +156,9 @@ class TestContextDelete:
 
         assert result is False
 
-    def test_delete_nested_key(self):
+    def test_delete_nested_key(self, nested_ctx):
         """Test deleting nested key"""
-        ctx = ContextEntityFactory(nested=True)
+        ctx = nested_ctx.clone()
 
         result = ctx.delete("level1.level2.level3.deep_value")
 
@@ -148,15 +178,39 @@ class TestContextKeys:
 
         assert set(keys) == {"a", "b", "c"}
 
-    def test_all_keys_includes_nested(self):
+    def test_all_keys_includes_nested(self, nested_ctx):
         """Test all_keys includes nested keys"""
-        ctx = ContextEntityFactory(nested=True)
+        ctx = nested_ctx
 
-        all_keys = ctx.all_keys()
+        all_keys = set(ctx.iter_keys())
 
-        assert "level1" in all_keys
-        assert "level1.level2" in all_keys
-        assert "level1.level2.level3.deep_value" in all_keys
+        assert {
+            "level1",
+            "level1.level2",
+            "level1.level2.level3.deep_value",
+        } <= all_keys
+
+    def test_all_keys_depth_first_order(self):
+        """Test all_keys lists each parent before its children, in insertion order"""
+        ctx = ContextEntityFactory()
+        ctx.data = {"a": {"b": {"c": 1}, "d": 2}, "e": 3}
+
+        assert ctx.all_keys() == ["a", "a.b", "a.b.c", "a.d", "e"]
+        assert ctx.all_keys(prefix="root") == [
+            "root.a", "root.a.b", "root.a.b.c", "root.a.d", "root.e"
+        ]
+
+    def test_all_keys_handles_deep_nesting(self):
+        """Test all_keys walks nesting deeper than the recursion limit"""
+        depth = sys.getrecursionlimit() + 100
+        data = leaf = {}
+        for _ in range(depth):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        ctx = ContextEntityFactory()
+        ctx.data = data
+
+        assert len(ctx.all_keys()) == depth
 
     def test_has_returns_true_for_existing(self):
         """Test has returns True for existing key"""
@@ -175,43 +229,47 @@ class TestContextKeys:
 class TestContextDiff:
     """Test context diff operations"""
 
+    @pytest.fixture
+    def make_ctx(self, shared_tenant_id):
+        def _make(data):
+            return ContextEntity(tenant_id=shared_tenant_id, session_id=_SHARED_SESSION, data=data)
+        return _make
+
     def test_diff_no_changes(self):
         """Test diff with identical contexts"""
         ctx1 = ContextEntityFactory()
-        ctx2 = ctx1.clone()
+        # diff() only reads, so a shallow copy sharing ctx1's data is enough
+        ctx2 = ctx1.model_copy()
 
         diff = ctx1.diff(ctx2)
 
         assert diff.has_changes is False
         assert len(diff) == 0
 
-    def test_diff_additions(self):
+    def test_diff_additions(self, make_ctx):
         """Test diff detects additions"""
-        tenant_id = uuid4()
-        ctx1 = ContextEntity(tenant_id=tenant_id, session_id=uuid4(), data={"existing": 1})
-        ctx2 = ContextEntity(tenant_id=tenant_id, session_id=uuid4(), data={"existing": 1, "added": 2})
+        ctx1 = make_ctx({"existing": 1})
+        ctx2 = make_ctx({"existing": 1, "added": 2})
 
         diff = ctx1.diff(ctx2)
 
         assert "added" in diff.added
         assert diff.added["added"] == 2
 
-    def test_diff_deletions(self):
+    def test_diff_deletions(self, make_ctx):
         """Test diff detects deletions"""
-        tenant_id = uuid4()
-        ctx1 = ContextEntity(tenant_id=tenant_id, session_id=uuid4(), data={"existing": 1, "removed": 2})
-        ctx2 = ContextEntity(tenant_id=tenant_id, session_id=uuid4(), data={"existing": 1})
+        ctx1 = make_ctx({"existing": 1, "removed": 2})
+        ctx2 = make_ctx({"existing": 1})
 
         diff = ctx1.diff(ctx2)
 
         assert "removed" in diff.deleted
         assert diff.deleted["removed"] == 2
 
-    def test_diff_modifications(self):
+    def test_diff_modifications(self, make_ctx):
         """Test diff detects modifications"""
-        tenant_id = uuid4()
-        ctx1 = ContextEntity(tenant_id=tenant_id, session_id=uuid4(), data={"key": "old"})
-        ctx2 = ContextEntity(tenant_id=tenant_id, session_id=uuid4(), data={"key": "new"})
+        ctx1 = make_ctx({"key": "old"})
+        ctx2 = make_ctx({"key": "new"})
 
         diff = ctx1.diff(ctx2)
 
@@ -222,63 +280,69 @@ class TestContextDiff:
 class TestContextMerge:
     """Test context merge operations"""
 
-    def test_merge_last_write_wins(self):
-        """Test merge with LAST_WRITE_WINS strategy"""
-        ctx1, ctx2 = create_conflicting_contexts()
-
-        merged = ctx1.merge(ctx2, MergeStrategy.LAST_WRITE_WINS)
-
+    STRATEGY_CASES = (
         # ctx2 (other) values should win
-        assert merged.get("shared") == "value_from_ctx2"
-        assert merged.get("only_in_ctx1") == "unique1"
-        assert merged.get("only_in_ctx2") == "unique2"
+        (MergeStrategy.LAST_WRITE_WINS, "shared", "value_from_ctx2"),
+        (MergeStrategy.PREFER_SOURCE, "shared", "value_from_ctx2"),
+        (MergeStrategy.PREFER_TARGET, "shared", "value_from_ctx1"),
+        # Nested obj should have keys from both
+        (MergeStrategy.DEEP_MERGE, "nested.extra", "new"),
+    )
 
-    def test_merge_prefer_source(self):
-        """Test merge with PREFER_SOURCE strategy"""
-        ctx1, ctx2 = create_conflicting_contexts()
+    def test_merge_strategies(self, conflict_pair, subtests):
+        """Test each merge strategy resolves the conflicting key"""
+        ctx1, ctx2 = conflict_pair
 
-        merged = ctx1.merge(ctx2, MergeStrategy.PREFER_SOURCE)
+        for strategy, key, expected in self.STRATEGY_CASES:
+            with subtests.test(strategy=strategy.value):
+                merged = ctx1.merge(ctx2, strategy)
 
-        assert merged.get("shared") == "value_from_ctx2"
+                assert merged.get(key) == expected
 
-    def test_merge_prefer_target(self):
-        """Test merge with PREFER_TARGET strategy"""
-        ctx1, ctx2 = create_conflicting_contexts()
+    def test_merge_keeps_unique_keys(self, conflict_pair):
+        """Test merge keeps keys present on only one side"""
+        ctx1, ctx2 = conflict_pair
 
-        merged = ctx1.merge(ctx2, MergeStrategy.PREFER_TARGET)
+        merged = ctx1.merge(ctx2, MergeStrategy.LAST_WRITE_WINS)
 
-        assert merged.get("shared") == "value_from_ctx1"
+        assert merged.get("only_in_ctx1") == "unique1"
+        assert merged.get("only_in_ctx2") == "unique2"
 
-    def test_merge_deep_merge(self):
-        """Test merge with DEEP_MERGE strategy"""
-        ctx1, ctx2 = create_conflicting_contexts()
+    def test_merge_result_is_independent(self, conflict_pair, subtests):
+        """Test mutating merged data never reaches either operand"""
+        ctx1, ctx2 = conflict_pair
 
-        merged = ctx1.merge(ctx2, MergeStrategy.DEEP_MERGE)
+        for strategy in MergeStrategy:
+            with subtests.test(strategy=strategy.value):
+                merged = ctx1.merge(ctx2, strategy)
+                merged.data["nested"]["key"] = "mutated"
+                merged.data["nested"]["extra"] = "mutated"
 
-        # Nested obj should have keys from both
-        assert merged.get("nested.extra") == "new"
+                assert ctx1.get("nested.key") == "ctx1_nested"
+                assert ctx2.get("nested.key") == "ctx2_nested"
+                assert ctx2.get("nested.extra") == "new"
 
-    def test_merge_manual_records_conflicts(self):
+    def test_merge_manual_records_conflicts(self, conflict_pair):
         """Test merge with MANUAL strategy records conflicts"""
-        ctx1, ctx2 = create_conflicting_contexts()
+        ctx1, ctx2 = conflict_pair
 
         merged = ctx1.merge(ctx2, MergeStrategy.MANUAL)
 
         assert "conflicts" in merged.metadata
         assert len(merged.metadata["conflicts"]) > 0
 
-    def test_merge_creates_new_id(self):
+    def test_merge_creates_new_id(self, conflict_pair):
         """Test merge creates new context ID"""
-        ctx1, ctx2 = create_conflicting_contexts()
+        ctx1, ctx2 = conflict_pair
 
         merged = ctx1.merge(ctx2)
 
         assert merged.id != ctx1.id
         assert merged.id != ctx2.id
 
-    def test_merge_records_source_ids(self):
+    def test_merge_records_source_ids(self, conflict_pair):
         """Test merge records source IDs in metadata"""
-        ctx1, ctx2 = create_conflicting_contexts()
+        ctx1, ctx2 = conflict_pair
 
         merged = ctx1.merge(ctx2)
 
@@ -290,9 +354,9 @@ class TestContextMerge:
 class TestContextClone:
     """Test context clone operations"""
 
-    def test_clone_creates_deep_copy(self):
+    def test_clone_creates_deep_copy(self, nested_ctx):
         """Test clone creates independent copy"""
-        ctx = ContextEntityFactory(nested=True)
+        ctx = nested_ctx.clone()
 
         cloned = ctx.clone()
 
@@ -346,9 +410,9 @@ class TestContextSerialization:
         assert restored.scope == original.scope
         assert restored.data == original.data
 
-    def test_roundtrip(self):
+    def test_roundtrip(self, nested_ctx):
         """Test serialization roundtrip"""
-        original = ContextEntityFactory(nested=True)
+        original = nested_ctx
 
         restored = ContextEntity.from_dict(original.to_dict())
 
@@ -384,6 +448,14 @@ class TestContextChangeHistory:
         assert len(changes) == 5
         # Should have most recent changes
         assert changes[-1].key == "key9"
+        assert [c.key for c in ctx._change_history] == [f"key{i}" for i in range(5, 10)]
+
+    def test_default_history_buffer_matches_limit(self):
+        """Test a new context's history buffer is sized from the shared limit"""
+        ctx = ContextEntity(tenant_id=uuid4(), session_id=uuid4(), data={})
+
+        assert ctx._max_history == MAX_CHANGE_HISTORY
+        assert ctx._change_history.maxlen == MAX_CHANGE_HISTORY
 
 
 class TestContextScopeHandling:
@@ -429,3 +501,13 @@ class TestContextFactory:
 
         assert ctx1.session_id == ctx2.session_id
         assert ctx1.get("shared") != ctx2.get("shared")
+
+    def test_conflicting_contexts_are_independent_copies(self):
+        """Test each call returns fresh contexts detached from the shared pair"""
+        ctx1, _ = create_conflicting_contexts()
+        proto1, _ = get_conflict_pair_readonly()
+
+        ctx1.set("nested.key", "changed")
+
+        assert ctx1.id != proto1.id
+        assert proto1.get("nested.key") == "ctx1_nested"
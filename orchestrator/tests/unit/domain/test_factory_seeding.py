@@ -0,0 +1,54 @@
+"""
+FACTORY SEEDING TESTS
+Seeded factory runs must generate the same data in every process.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.parallel_safe
+
+ORCHESTRATOR_ROOT = Path(__file__).resolve().parents[3]
+
+# Imports the factories in a fresh interpreter (so import-time pools are
+# rebuilt), seeds them, and prints what a build produced. Agent ids come
+# from uuid4 and are left out.
+_BUILD_SCRIPT = """
+from tests.unit.domain.factories import (
+    AgentEntityFactory, TaskEntityFactory, seed_factories,
+)
+from tests.unit.domain.factories import agent_factory, task_factory
+
+seed_factories()
+agent = AgentEntityFactory()
+task = TaskEntityFactory()
+print(agent_factory._NAME_WORDS, agent_factory._DESCRIPTIONS, task_factory._TITLE_WORDS)
+print(agent.name, agent.description)
+print(task.id, task.title, task.description)
+"""
+
+
+def _seeded_build(hash_seed: str) -> str:
+    env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+    result = subprocess.run(
+        [sys.executable, "-c", _BUILD_SCRIPT],
+        cwd=ORCHESTRATOR_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def test_seeded_builds_match_across_processes():
+    """Two processes (different hash seeds) build identical pools and entities"""
+    first = _seeded_build("1")
+    second = _seeded_build("2")
+
+    assert first
+    assert first == second
@@ -3,9 +3,13 @@ INDUSTRIAL-GRADE TASK ENTITY TESTS
 Comprehensive TDD-style tests for task decomposition, dependencies, and cycles.
 """
 
+import random
+import sys
+from dataclasses import dataclass
+from typing import List
+
 import pytest
 from datetime import datetime, timezone, timedelta
-from uuid import uuid4
 
 from src.industrial_orchestrator.domain.entities.task import (
     TaskEntity,
@@ -14,9 +18,8 @@ from src.industrial_orchestrator.domain.entities.task import (
     TaskComplexityLevel,
     TaskDependencyType,
     TaskEstimate,
-    TaskDependency,
+    _pert_metrics,
 )
-from src.industrial_orchestrator.domain.entities.agent import AgentCapability
 from src.industrial_orchestrator.domain.exceptions.task_exceptions import (
     TaskDependencyCycleError,
 )
@@ -27,6 +30,49 @@ from tests.unit.domain.factories.task_factory import (
     create_task_with_subtasks,
     create_task_chain,
 )
+from tests.unit.domain.factories import batch_clock, next_uuid
+
+pytestmark = pytest.mark.parallel_safe
+
+FIXED_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Never raised, only recorded by fail_with_error, so one instance is safe to share
+EXECUTION_ERROR = RuntimeError("Execution failed")
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the task module clock to FIXED_NOW."""
+    monkeypatch.setattr(
+        "src.industrial_orchestrator.domain.entities.task._now", lambda: FIXED_NOW
+    )
+    return FIXED_NOW
+
+
+@dataclass(frozen=True)
+class HierarchyBundle:
+    """A subtask tree with its traversals computed once"""
+
+    root: TaskEntity
+    flat: List[TaskEntity]
+    count: int
+
+
+@pytest.fixture(scope="class")
+def shared_session_id():
+    """One session id shared by every task built in a test class"""
+    return next_uuid()
+
+
+@pytest.fixture(scope="class")
+def hierarchy():
+    """Depth-2, fan-out-2 tree shared by the read-only hierarchy tests"""
+    root = create_task_with_subtasks(depth=2, children_per_level=2)
+    return HierarchyBundle(
+        root=root,
+        flat=root.flatten_hierarchy(),
+        count=root.count_subtasks(),
+    )
 
 
 class TestTaskEntityCreation:
@@ -44,9 +90,9 @@ class TestTaskEntityCreation:
 
     def test_create_task_with_all_fields(self):
         """Test creating task with all fields"""
-        session_id = uuid4()
+        session_id = next_uuid()
         task = TaskEntity(
-            tenant_id=uuid4(),
+            tenant_id=next_uuid(),
             session_id=session_id,
             title="Implement authentication module",
             description="Full OAuth2 authentication with JWT tokens",
@@ -64,21 +110,13 @@ class TestTaskEntityCreation:
         assert task.title == "Implement authentication module"
         assert task.priority == TaskPriority.HIGH
 
-    @pytest.mark.parametrize("invalid_title", [
+    INVALID_TITLES = (
         "",
         "   ",
         "authentication module",  # Doesn't start with verb
         "the module system",
-    ])
-    def test_invalid_titles_rejected(self, invalid_title):
-        """Test that non-actionable titles are rejected"""
-        with pytest.raises(ValueError):
-            TaskEntity(
-                session_id=uuid4(),
-                title=invalid_title,
-            )
-
-    @pytest.mark.parametrize("valid_title", [
+    )
+    VALID_TITLES = (
         "Implement user authentication",
         "Create database schema",
         "Add logging middleware",
@@ -86,15 +124,28 @@ class TestTaskEntityCreation:
         "Fix race condition bug",
         "Refactor legacy code",
         "Test payment integration",
-    ])
-    def test_valid_titles_accepted(self, valid_title):
+    )
+
+    def test_invalid_titles_rejected(self, subtests):
+        """Test that non-actionable titles are rejected"""
+        for invalid_title in self.INVALID_TITLES:
+            with subtests.test(title=invalid_title), pytest.raises(ValueError):
+                TaskEntity(
+                    tenant_id=next_uuid(),
+                    session_id=next_uuid(),
+                    title=invalid_title,
+                )
+
+    def test_valid_titles_accepted(self, subtests):
         """Test that actionable titles are accepted"""
-        task = TaskEntity(
-            tenant_id=uuid4(),
-            session_id=uuid4(),
-            title=valid_title,
-        )
-        assert task.title == valid_title
+        for valid_title in self.VALID_TITLES:
+            with subtests.test(title=valid_title):
+                task = TaskEntity(
+                    tenant_id=next_uuid(),
+                    session_id=next_uuid(),
+                    title=valid_title,
+                )
+                assert task.title == valid_title
 
 
 class TestTaskEstimate:
@@ -109,7 +160,7 @@ class TestTaskEstimate:
         )
 
         # PERT: (O + 4M + P) / 6 = (1 + 8 + 6) / 6 = 2.5
-        assert estimate.expected_hours == pytest.approx(2.5, rel=0.01)
+        assert estimate.expected_hours == 2.5
 
     def test_standard_deviation(self):
         """Test standard deviation calculation"""
@@ -120,7 +171,7 @@ class TestTaskEstimate:
         )
 
         # SD: (P - O) / 6 = (7 - 1) / 6 = 1.0
-        assert estimate.standard_deviation_hours == pytest.approx(1.0, rel=0.01)
+        assert estimate.standard_deviation_hours == 1.0
 
     @pytest.mark.parametrize("likely,expected_level", [
         (0.1, TaskComplexityLevel.TRIVIAL),
@@ -139,6 +190,19 @@ class TestTaskEstimate:
 
         assert estimate.complexity_level == expected_level
 
+    def test_equal_estimates_share_pert_metrics(self):
+        """Test estimates with the same hours reuse one cached PERT result"""
+        hours = dict(optimistic_hours=1.25, likely_hours=2.5, pessimistic_hours=5.0)
+        first = TaskEstimate(**hours)
+        second = TaskEstimate(**hours)
+
+        first.complexity_level
+        hits_before = _pert_metrics.cache_info().hits
+        second.expected_hours
+        second.standard_deviation_hours
+
+        assert _pert_metrics.cache_info().hits == hits_before + 2
+
     def test_update_from_execution(self):
         """Test estimate updates from actual execution"""
         estimate = TaskEstimate(
@@ -155,7 +219,7 @@ class TestTaskEstimate:
         )
 
         # Likely hours updated as average
-        assert estimate.likely_hours == pytest.approx(1.75, rel=0.01)
+        assert estimate.likely_hours == 1.75
         # Confidence increased
         assert estimate.estimate_confidence == pytest.approx(0.55, rel=0.01)
         # Source updated
@@ -165,10 +229,10 @@ class TestTaskEstimate:
 class TestTaskDependencies:
     """Test dependency management"""
 
-    def test_add_dependency(self):
+    def test_add_dependency(self, shared_session_id):
         """Test adding dependency"""
-        task1 = TaskEntityFactory()
-        task2 = TaskEntityFactory(session_id=task1.session_id)
+        task1 = TaskEntityFactory(session_id=shared_session_id)
+        task2 = TaskEntityFactory(session_id=shared_session_id)
 
         task2.add_dependency(task1.id)
 
@@ -176,27 +240,26 @@ class TestTaskDependencies:
         assert task2.dependencies[0].target_task_id == task1.id
         assert task2.dependencies[0].dependency_type == TaskDependencyType.FINISH_TO_START
 
-    def test_cannot_depend_on_self(self):
+    def test_cannot_depend_on_self(self, task):
         """Test that self-dependency is rejected"""
-        task = TaskEntityFactory()
 
         with pytest.raises(ValueError, match="cannot depend on itself"):
             task.add_dependency(task.id)
 
-    def test_duplicate_dependency_rejected(self):
+    def test_duplicate_dependency_rejected(self, shared_session_id):
         """Test that duplicate dependency is rejected"""
-        task1 = TaskEntityFactory()
-        task2 = TaskEntityFactory()
+        task1 = TaskEntityFactory(session_id=shared_session_id)
+        task2 = TaskEntityFactory(session_id=shared_session_id)
 
         task2.add_dependency(task1.id)
 
         with pytest.raises(ValueError, match="already exists"):
             task2.add_dependency(task1.id)
 
-    def test_dependency_types(self):
+    def test_dependency_types(self, shared_session_id):
         """Test different dependency types"""
-        task1 = TaskEntityFactory()
-        task2 = TaskEntityFactory()
+        task1 = TaskEntityFactory(session_id=shared_session_id)
+        task2 = TaskEntityFactory(session_id=shared_session_id)
 
         task2.add_dependency(
             task1.id,
@@ -218,7 +281,7 @@ class TestDependencyCycleDetection:
         # Last task should validate (no cycle)
         assert tasks[-1].validate_dependencies() is True
 
-    def test_direct_cycle_detected(self):
+    def test_direct_cycle_detected(self, shared_session_id):
         """Test direct A->B->A cycle validation behavior
         
         Note: Entity-level validate_dependencies() only knows about this task's
@@ -228,8 +291,8 @@ class TestDependencyCycleDetection:
         Full graph cycle detection is the responsibility of the service layer
         which has access to the complete task graph.
         """
-        task_a = TaskEntityFactory()
-        task_b = TaskEntityFactory(session_id=task_a.session_id)
+        task_a = TaskEntityFactory(session_id=shared_session_id)
+        task_b = TaskEntityFactory(session_id=shared_session_id)
 
         task_b.add_dependency(task_a.id)
         task_a.add_dependency(task_b.id)
@@ -239,6 +302,65 @@ class TestDependencyCycleDetection:
         assert task_a.validate_dependencies() is True
         assert task_b.validate_dependencies() is True
 
+    def test_cycle_within_hierarchy_detected(self):
+        """Test a cycle between sibling subtasks is caught from the root"""
+        root = create_task_with_subtasks(depth=1, children_per_level=2)
+        first, second = root.child_tasks
+
+        first.add_dependency(second.id)
+        second.add_dependency(first.id)
+
+        with pytest.raises(TaskDependencyCycleError):
+            root.validate_dependencies()
+        with pytest.raises(TaskDependencyCycleError):
+            root.get_execution_order()
+
+    @pytest.mark.slow
+    def test_long_subtask_chain(self):
+        """Test validation and ordering scale to a long dependency chain"""
+        root = TaskEntityFactory()
+        with batch_clock():
+            chain = TaskEntityFactory.build_batch(500, session_id=root.session_id)
+        for previous, task in zip(chain, chain[1:]):
+            task.add_dependency(previous.id)
+        for task in chain:
+            root.add_child_task(task)
+
+        assert root.validate_dependencies() is True
+        order = root.get_execution_order()
+        assert order[0] == root.id
+        assert order[1:] == [task.id for task in chain]
+
+        # Closing the chain turns it into one 500-task cycle
+        chain[0].add_dependency(chain[-1].id)
+        with pytest.raises(TaskDependencyCycleError):
+            root.validate_dependencies()
+
+    @pytest.mark.slow
+    def test_random_subtask_dag(self, shared_session_id):
+        """Test validation scales to a wide random DAG and catches one back edge"""
+        rng = random.Random(0)
+        root = TaskEntityFactory(session_id=shared_session_id)
+        with batch_clock():
+            tasks = TaskEntityFactory.build_batch(1_000, session_id=shared_session_id)
+        # Edges only point to earlier tasks, so the graph is acyclic by construction
+        edges = {
+            tuple(sorted(rng.sample(range(len(tasks)), 2)))
+            for _ in range(3_000)
+        }
+        for earlier, later in edges:
+            tasks[later].add_dependency(tasks[earlier].id)
+        for task in tasks:
+            root.add_child_task(task)
+
+        assert root.validate_dependencies() is True
+
+        # One edge against the order closes a cycle through an existing path
+        earlier, later = next(iter(edges))
+        tasks[earlier].add_dependency(tasks[later].id)
+        with pytest.raises(TaskDependencyCycleError):
+            root.validate_dependencies()
+
     def test_execution_order(self):
         """Test topological sort for execution order"""
         tasks = create_task_chain(3)
@@ -282,9 +404,9 @@ class TestTaskHierarchy:
         assert parent.is_root_task is True
         assert child.is_root_task is False
 
-    def test_subtask_hierarchy(self):
+    def test_subtask_hierarchy(self, hierarchy):
         """Test multi-level hierarchy"""
-        root = create_task_with_subtasks(depth=2, children_per_level=2)
+        root = hierarchy.root
 
         # Root has 2 children
         assert len(root.child_tasks) == 2
@@ -292,17 +414,14 @@ class TestTaskHierarchy:
         for child in root.child_tasks:
             assert len(child.child_tasks) == 2
 
-    def test_count_subtasks(self):
+    def test_count_subtasks(self, hierarchy):
         """Test counting subtasks recursively"""
-        root = create_task_with_subtasks(depth=2, children_per_level=2)
-
         # 2 children + 4 grandchildren = 6
-        total = root.count_subtasks()
-        assert total == 6
+        assert hierarchy.count == 6
 
-    def test_find_subtask(self):
+    def test_find_subtask(self, hierarchy):
         """Test finding subtask by ID"""
-        root = create_task_with_subtasks(depth=2, children_per_level=2)
+        root = hierarchy.root
         grandchild = root.child_tasks[0].child_tasks[0]
 
         found = root.find_subtask(grandchild.id)
@@ -310,22 +429,42 @@ class TestTaskHierarchy:
         assert found is not None
         assert found.id == grandchild.id
 
-    def test_flatten_hierarchy(self):
+    def test_flatten_hierarchy(self, hierarchy):
         """Test flattening task hierarchy"""
-        root = create_task_with_subtasks(depth=2, children_per_level=2)
+        # 1 root + 2 children + 4 grandchildren = 7
+        assert len(hierarchy.flat) == 7
 
-        flat = root.flatten_hierarchy()
+    def test_flatten_hierarchy_is_preorder(self, hierarchy):
+        """Test each task is listed before its own subtasks"""
+        first, second = hierarchy.root.child_tasks
 
-        # 1 root + 2 children + 4 grandchildren = 7
-        assert len(flat) == 7
+        assert hierarchy.flat == [
+            hierarchy.root,
+            first, *first.child_tasks,
+            second, *second.child_tasks,
+        ]
+
+    @pytest.mark.slow
+    def test_traversal_deeper_than_recursion_limit(self):
+        """Test hierarchy walks do not recurse once per level"""
+        depth = sys.getrecursionlimit() + 100
+        with batch_clock():
+            chain = TaskEntityFactory.build_batch(depth + 1)
+        for parent, child in zip(chain, chain[1:]):
+            parent.add_child_task(child)
+        root, deepest = chain[0], chain[-1]
+
+        assert root.count_subtasks() == depth
+        assert root.find_subtask(deepest.id) is deepest
+        assert root.flatten_hierarchy() == chain
 
 
 class TestTaskDecomposition:
     """Test task decomposition"""
 
-    def test_decompose_complex_task(self):
+    @pytest.mark.parametrize("task", ["complex_task"], indirect=True)
+    def test_decompose_complex_task(self, task):
         """Test decomposing a complex task"""
-        task = TaskEntityFactory(complex_task=True)
 
         subtasks = task.decompose(
             decomposition_strategy="functional",
@@ -336,9 +475,9 @@ class TestTaskDecomposition:
         assert len(subtasks) >= 1
         assert all(st.parent_task_id == task.id for st in subtasks)
 
-    def test_no_decompose_trivial_task(self):
+    @pytest.mark.parametrize("task", ["trivial"], indirect=True)
+    def test_no_decompose_trivial_task(self, task):
         """Test trivial task is not decomposed"""
-        task = TaskEntityFactory(trivial=True)
 
         subtasks = task.decompose(
             target_complexity=TaskComplexityLevel.MODERATE,
@@ -346,9 +485,9 @@ class TestTaskDecomposition:
 
         assert len(subtasks) == 0
 
-    def test_temporal_decomposition_creates_dependencies(self):
+    @pytest.mark.parametrize("task", ["complex_task"], indirect=True)
+    def test_temporal_decomposition_creates_dependencies(self, task):
         """Test temporal strategy creates phase dependencies"""
-        task = TaskEntityFactory(complex_task=True)
 
         subtasks = task.decompose(
             decomposition_strategy="temporal",
@@ -363,54 +502,40 @@ class TestTaskDecomposition:
 class TestTaskStatusTransitions:
     """Test status state machine"""
 
-    def test_valid_transition_pending_to_ready(self):
-        """Test valid PENDING -> READY transition"""
-        task = TaskEntityFactory()
-
-        task.update_status(TaskStatus.READY)
-
-        assert task.status == TaskStatus.READY
-
-    def test_valid_transition_to_in_progress(self):
-        """Test transition to IN_PROGRESS sets started_at"""
-        task = TaskEntityFactory(assigned=True)
-
-        task.update_status(TaskStatus.IN_PROGRESS)
-
-        assert task.status == TaskStatus.IN_PROGRESS
-        assert task.started_at is not None
-
-    def test_valid_transition_to_completed(self):
-        """Test transition to COMPLETED sets completed_at"""
-        task = TaskEntityFactory(in_progress=True)
-
-        task.update_status(TaskStatus.COMPLETED)
-
-        assert task.status == TaskStatus.COMPLETED
-        assert task.completed_at is not None
-
-    def test_invalid_transition_rejected(self):
-        """Test invalid transition is rejected"""
-        task = TaskEntityFactory()  # PENDING
-
-        with pytest.raises(ValueError, match="Invalid status transition"):
-            task.update_status(TaskStatus.COMPLETED)
-
-    def test_terminal_states_immutable(self):
-        """Test terminal states cannot transition"""
-        task = TaskEntityFactory(completed=True)
-
-        with pytest.raises(ValueError):
-            task.update_status(TaskStatus.IN_PROGRESS)
+    # (prototype variant, target status, expected error, post-condition)
+    TRANSITIONS = (
+        ("default", TaskStatus.READY, None,
+         lambda t: t.status == TaskStatus.READY),
+        ("assigned", TaskStatus.IN_PROGRESS, None,
+         lambda t: t.status == TaskStatus.IN_PROGRESS and t.started_at is not None),
+        ("in_progress", TaskStatus.COMPLETED, None,
+         lambda t: t.status == TaskStatus.COMPLETED and t.completed_at is not None),
+        # Invalid transition is rejected
+        ("default", TaskStatus.COMPLETED, "Invalid status transition", None),
+        # Terminal states cannot transition
+        ("completed", TaskStatus.IN_PROGRESS, "Invalid status transition", None),
+    )
+
+    def test_status_transitions(self, subtests, _task_proto):
+        """Test valid transitions stamp timestamps and invalid ones raise"""
+        for start, target, error, check in self.TRANSITIONS:
+            with subtests.test(start=start, target=target.value):
+                task = _task_proto[start].model_copy(deep=True)
+
+                if error is None:
+                    task.update_status(target)
+                    assert check(task)
+                else:
+                    with pytest.raises(ValueError, match=error):
+                        task.update_status(target)
 
 
 class TestTaskAssignment:
     """Test task assignment to agents"""
 
-    def test_assign_pending_task(self):
+    def test_assign_pending_task(self, task):
         """Test assigning pending task"""
-        task = TaskEntityFactory()
-        agent_id = uuid4()
+        agent_id = next_uuid()
 
         task.assign_to_agent(agent_id)
 
@@ -418,20 +543,20 @@ class TestTaskAssignment:
         assert task.assigned_at is not None
         assert task.status == TaskStatus.ASSIGNED
 
-    def test_cannot_assign_completed_task(self):
+    @pytest.mark.parametrize("task", ["completed"], indirect=True)
+    def test_cannot_assign_completed_task(self, task):
         """Test cannot assign completed task"""
-        task = TaskEntityFactory(completed=True)
 
         with pytest.raises(ValueError, match="Cannot assign"):
-            task.assign_to_agent(uuid4())
+            task.assign_to_agent(next_uuid())
 
 
 class TestTaskCompletion:
     """Test task completion and failure"""
 
-    def test_complete_with_result(self):
+    @pytest.mark.parametrize("task", ["in_progress"], indirect=True)
+    def test_complete_with_result(self, task):
         """Test completing task with result"""
-        task = TaskEntityFactory(in_progress=True)
 
         task.complete_with_result(
             result={'files_created': ['main.py']},
@@ -441,43 +566,42 @@ class TestTaskCompletion:
         assert task.status == TaskStatus.COMPLETED
         assert task.result['files_created'] == ['main.py']
 
-    def test_fail_with_error(self):
+    @pytest.mark.parametrize("task", ["in_progress"], indirect=True)
+    def test_fail_with_error(self, task):
         """Test failing task with error"""
-        task = TaskEntityFactory(in_progress=True)
 
         task.fail_with_error(
-            error=RuntimeError("Execution failed"),
+            error=EXECUTION_ERROR,
             error_context={'attempt': 3},
         )
 
         assert task.status == TaskStatus.FAILED
         assert task.error['type'] == 'RuntimeError'
+        assert task.error['message'] == str(EXECUTION_ERROR)
         assert task.error['context']['attempt'] == 3
 
 
 class TestTaskProgress:
     """Test progress tracking"""
 
-    def test_elapsed_hours(self):
+    @pytest.mark.parametrize("task", ["in_progress"], indirect=True)
+    def test_elapsed_hours(self, task, frozen_now):
         """Test elapsed hours calculation"""
-        task = TaskEntityFactory(in_progress=True)
-        task.started_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        task.started_at = frozen_now - timedelta(hours=2)
 
         elapsed = task.elapsed_hours
 
-        assert elapsed is not None
-        assert elapsed >= 2.0
+        assert elapsed == 2.0
 
-    def test_duration_hours_completed(self):
+    @pytest.mark.parametrize("task", ["completed"], indirect=True)
+    def test_duration_hours_completed(self, task, frozen_now):
         """Test duration for completed task"""
-        task = TaskEntityFactory(completed=True)
-        task.started_at = datetime.now(timezone.utc) - timedelta(hours=3)
-        task.completed_at = datetime.now(timezone.utc)
+        task.started_at = frozen_now - timedelta(hours=3)
+        task.completed_at = frozen_now
 
         duration = task.duration_hours
 
-        assert duration is not None
-        assert duration >= 3.0
+        assert duration == 3.0
 
     def test_progress_summary(self):
         """Test progress summary generation"""
@@ -490,21 +614,40 @@ class TestTaskProgress:
         assert 'total_tasks' in summary
         assert summary['total_tasks'] == 3
 
+    def test_progress_summary_status_counts(self):
+        """Test summary counts subtasks by status across the hierarchy"""
+        root = create_task_with_subtasks(depth=2, children_per_level=2)
+        first, second = root.child_tasks
+        first.child_tasks[0].status = TaskStatus.COMPLETED
+        first.child_tasks[1].status = TaskStatus.FAILED
+        second.status = TaskStatus.IN_PROGRESS
+
+        summary = root.get_progress_summary()
+
+        assert summary['total_tasks'] == 6
+        assert summary['completed_tasks'] == 1
+        assert summary['failed_tasks'] == 1
+        assert summary['in_progress_tasks'] == 1
+        assert summary['blocked_tasks'] == 0
+        assert summary['progress_percentage'] == pytest.approx(100 / 6)
+
 
 class TestTaskFactory:
     """Test factory integration"""
 
+    ACTION_VERBS = frozenset({
+        'implement', 'create', 'add', 'update', 'fix',
+        'refactor', 'optimize', 'test', 'review', 'deploy',
+        'configure', 'document',
+    })
+
     def test_factory_creates_valid_tasks(self):
         """Test factory produces valid entities"""
         task = TaskEntityFactory()
 
         assert isinstance(task, TaskEntity)
         assert task.id is not None
-        assert task.title.split()[0].lower() in [
-            'implement', 'create', 'add', 'update', 'fix',
-            'refactor', 'optimize', 'test', 'review', 'deploy',
-            'configure', 'document',
-        ]
+        assert task.title.split(maxsplit=1)[0].lower() in self.ACTION_VERBS
 
     def test_factory_variants(self):
         """Test factory variants"""
@@ -523,6 +666,21 @@ class TestTaskFactory:
         assert failed.status == TaskStatus.FAILED
         assert failed.error is not None
 
+    def test_batch_clock_shares_one_timestamp(self):
+        """Test tasks built under batch_clock share the frozen time"""
+        with batch_clock() as now:
+            tasks = TaskEntityFactory.build_batch(3)
+
+        assert all(t.created_at == now for t in tasks)
+        assert all(t.status_updated_at == now for t in tasks)
+
+    def test_trait_offsets_share_one_clock_read(self):
+        """Test trait timestamps are offsets from the same instant"""
+        task = TaskEntityFactory(completed=True)
+
+        assert task.completed_at - task.started_at == timedelta(hours=2)
+        assert task.completed_at == task.created_at
+
     def test_create_task_chain(self):
         """Test task chain creation"""
         tasks = create_task_chain(4)